@@ -7,6 +7,7 @@ Commands implemented (small, safe stubs to operate in this repo):
 - list: print known server folders
 - start: start a server's `main.py` as a subprocess (non-blocking)
 - health: simple health check that verifies main.py exists for a server
+- build-manifest: write the unified MCP server's tool manifest snapshot
 
 The real servers live in sibling packages (e.g. `event_server`, `flight_server`).
 This CLI intentionally uses subprocess invocation to avoid import-time side-effects
@@ -51,6 +52,12 @@ def _run_control_server(host: str, port: int):
         return 1
 
 
+def _build_tool_manifest(output: str | None):
+    """Write the tool manifest snapshot used for fast unified-server startup."""
+    from . import tool_manifest
+    return tool_manifest.main(output)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="py_mcp_travelplanner",
@@ -92,6 +99,11 @@ def build_parser() -> argparse.ArgumentParser:
     sp_mcp = subparsers.add_parser("mcp", help="Run unified MCP server via stdio")
     sp_mcp.set_defaults(func=lambda args: _run_mcp_server())
 
+    # build-manifest - write the unified server's tool manifest snapshot
+    sp_manifest = subparsers.add_parser("build-manifest", help="Write the unified MCP server's tool manifest snapshot")
+    sp_manifest.add_argument("--output", default=None, help="Manifest path (default: UNIFIED_MANIFEST_PATH)")
+    sp_manifest.set_defaults(func=lambda args: _build_tool_manifest(args.output))
+
     # Add verbosity
     parser.add_argument("-v", "--verbose", action="count", default=0, help="Increase logging verbosity")
 
@@ -207,11 +207,11 @@ def verify_serpapi_key(timeout: float = 10.0) -> tuple[bool, dict]:
         return False, {"error": "SERPAPI_KEY not found"}
 
     try:
-        import requests
+        from .http_client import http_get
 
         url = 'https://serpapi.com/search.json'
         params = {'q': 'example', 'engine': 'google', 'api_key': serpapi}
-        r = requests.get(url, params=params, timeout=timeout)
+        r = http_get(url, params=params, timeout=timeout)
         info: dict = {"http_status": r.status_code}
         try:
             data = r.json()
@@ -119,6 +119,80 @@ class RuntimeConfig:
             # PID File Management
             'PID_FILE_DIR': '.mcp_pids',
             'ENABLE_PID_TRACKING': True,
+
+            # Shared HTTP client (SerpAPI and other upstream APIs)
+            'HTTP_CONNECT_TIMEOUT': 5.0,
+            'HTTP_READ_TIMEOUT': 30.0,
+            'HTTP_POOL_CONNECTIONS': 10,
+            'HTTP_POOL_MAXSIZE': 10,
+            'HTTP_MAX_RETRIES': 3,
+            'HTTP_BACKOFF_FACTOR': 0.5,
+            'HTTP_MAX_RETRY_AFTER': 60.0,  # Longest Retry-After wait honoured (seconds)
+
+            # HTTP validator cache (ETag/Last-Modified, Cache-Control) for upstream GETs
+            'HTTP_CACHE_ENABLED': True,
+            'HTTP_CACHE_MAX_BYTES': 32 * 1024 * 1024,
+
+            # SerpAPI response cache
+            'RESPONSE_CACHE_ENABLED': True,
+            'RESPONSE_CACHE_MAX_BYTES': 64 * 1024 * 1024,
+            'RESPONSE_CACHE_DEFAULT_TTL': 900.0,
+            'RESPONSE_CACHE_DIR': None,  # On-disk tier disabled if None
+            'RESPONSE_CACHE_TTLS': None,  # Per-engine TTL overrides (YAML mapping)
+
+            # Thread pool for synchronous subservice tools (unified server)
+            'TOOL_EXECUTOR_MAX_WORKERS': 8,
+            'TOOL_EXECUTOR_SERVICE_LIMIT': 4,
+            'TOOL_EXECUTOR_SERVICE_LIMITS': None,  # Per-service overrides (YAML mapping)
+
+            # Unified server tool registry
+            'UNIFIED_LAZY_LOADING': False,
+            'UNIFIED_MANIFEST_PATH': None,  # Defaults to py_mcp_travelplanner/tool_manifest.json
+
+            # Saved search results (flights, hotels, events, finance)
+            'RESULT_STORE_BACKEND': 'json',  # 'json' (one file per search) or 'sqlite'
+            'RESULT_STORE_PATH': None,  # SQLite file; defaults to ./outputs/results.sqlite3
+            'RESULT_CACHE_MAX_BYTES': 64 * 1024 * 1024,  # Parsed-result LRU; 0 disables
+            'FINANCE_SERIES_DIR': None,  # Columnar price histories; defaults to series/ in the finance output directory
+
+            # FX rate table (finance server convert_currency)
+            'FX_RATE_TABLE_ENABLED': True,
+            'FX_RATE_MAX_AGE': 3600.0,  # Oldest quote used for a conversion (seconds)
+            'FX_REFRESH_INTERVAL': 900.0,  # Snapshot age that triggers a background refresh
+            'FX_REFRESH_RETRY_INTERVAL': 60.0,  # Wait after a failed or empty refresh before retrying
+            'FX_PIVOT_CURRENCIES': ['USD', 'EUR'],  # Currencies cross rates are derived through
+            'FX_SNAPSHOT_QUERY': 'EUR-USD',  # google_finance query whose markets block is ingested
+
+            # Nominatim client (geocoder server)
+            'NOMINATIM_USER_AGENT': None,  # Defaults to py_mcp_travelplanner-geocoder
+            'NOMINATIM_MIN_DELAY_SECONDS': 1.0,
+
+            # Persistent geocode cache (geocoder server)
+            'GEOCODE_CACHE_ENABLED': True,
+            'GEOCODE_CACHE_PATH': None,  # Defaults to ./outputs/geocode_cache.sqlite3
+            'GEOCODE_CACHE_TTL': 30 * 24 * 3600.0,
+            'GEOCODE_CACHE_NEGATIVE_TTL': 24 * 3600.0,
+            'GEOCODE_CACHE_MAX_ENTRIES': 100000,
+            'GEOCODE_CACHE_REVERSE_DECIMALS': 4,  # Reverse lookup grid cell (~11 m)
+            'GEOCODE_REVERSE_PROXIMITY_METERS': 25.0,  # Reuse cached reverse results this close (0 = exact cell only)
+
+            # NWS grid metadata cache (weather server)
+            'NWS_METADATA_CACHE_ENABLED': True,
+            'NWS_METADATA_CACHE_DIR': None,  # Defaults to nws_metadata/ next to the weather data directory
+            'NWS_POINT_CACHE_TTL': 30 * 24 * 3600.0,
+            'NWS_STATIONS_CACHE_TTL': 7 * 24 * 3600.0,
+            'NWS_POINT_DECIMALS': 4,
+            'NWS_STATION_PROBE_STRATEGY': 'hedged',  # 'hedged', 'concurrent' or 'sequential'
+            'NWS_STATION_HEDGE_DELAY': 1.0,  # Seconds before also trying the next station
+            'NWS_STATION_PROBE_LIMIT': 3,
+            'NWS_RATE_LIMIT': 5.0,  # Requests per second sent to api.weather.gov
+            'NWS_RATE_BURST': 5,
+            'NWS_BATCH_CONCURRENCY': 4,  # Requests in flight per get_forecasts_batch call
+            'WEATHERSTACK_CACHE_ENABLED': True,
+            'WEATHERSTACK_CACHE_DIR': None,  # Defaults to weatherstack_cache/ next to the weather data directory
+            'WEATHERSTACK_CURRENT_CACHE_TTL': 600.0,
+            'WEATHERSTACK_CACHE_MAX_BYTES': 16 * 1024 * 1024,  # In-memory tier; historical days also persist on disk
+            'WEATHERSTACK_CONCURRENCY': 5,  # Requests in flight per compare_weather/get_historical_weather call
         }
     
     def _resolve_path(self, path: Optional[str | pathlib.Path],
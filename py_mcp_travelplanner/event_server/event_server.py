@@ -1,9 +1,11 @@
-import requests
+import httpx
 import json
 import os
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 from mcp.server.fastmcp import FastMCP
+from py_mcp_travelplanner.http_client import serpapi_search_async
+from py_mcp_travelplanner.result_store import ResultStore, get_result_store
 
 # Directory to store event search results
 EVENTS_DIR = "./outputs/events"
@@ -11,6 +13,14 @@ EVENTS_DIR = "./outputs/events"
 # Initialize FastMCP server
 mcp = FastMCP("event-assistant")
 
+def _index_event_search(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive the indexed columns of a stored event search."""
+    return {"result_count": len(document.get("events_results", []))}
+
+def _result_store() -> ResultStore:
+    """Return the store holding saved event searches."""
+    return get_result_store("events", EVENTS_DIR, index=_index_event_search)
+
 def get_serpapi_key() -> str:
     """Get SerpAPI key from environment variable."""
     api_key = os.getenv("SERPAPI_KEY")
@@ -19,7 +29,7 @@ def get_serpapi_key() -> str:
     return api_key
 
 @mcp.tool()
-def search_events(
+async def search_events(
     query: str,
     location: Optional[str] = None,
     date_filter: Optional[str] = None,
@@ -72,10 +82,7 @@ def search_events(
             params["htichips"] = ",".join(filters)
         
         # Make API request
-        response = requests.get("https://serpapi.com/search", params=params)
-        response.raise_for_status()
-        
-        event_data = response.json()
+        event_data = await serpapi_search_async(params)
         
         # Create search identifier
         search_id = f"{query.replace(' ', '_')}_{location or 'global'}"
@@ -85,9 +92,6 @@ def search_events(
             search_id += f"_{event_type}"
         search_id += f"_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Create directory structure
-        os.makedirs(EVENTS_DIR, exist_ok=True)
-        
         # Process and store event results
         events_results = event_data.get("events_results", [])[:max_results]
         
@@ -108,12 +112,10 @@ def search_events(
             "events_results": events_results
         }
         
-        # Save results to file
-        file_path = os.path.join(EVENTS_DIR, f"{search_id}.json")
-        with open(file_path, "w") as f:
-            json.dump(processed_results, f, indent=2)
+        # Save results to the result store
+        saved_to = _result_store().save(search_id, processed_results)
         
-        print(f"Event search results saved to: {file_path}")
+        print(f"Event search results saved to: {saved_to}")
         
         # Return summary for the user
         summary = {
@@ -137,7 +139,7 @@ def search_events(
         
         return summary
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
@@ -156,16 +158,12 @@ def get_event_details(search_id: str) -> str:
         JSON string with detailed event information
     """
     
-    file_path = os.path.join(EVENTS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No event search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            event_data = json.load(f)
+        event_data = _result_store().load(search_id)
+        if event_data is None:
+            return f"No event search found with ID: {search_id}"
         return json.dumps(event_data, indent=2)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error reading event data for {search_id}: {str(e)}"
 
 @mcp.tool()
@@ -186,14 +184,10 @@ def filter_events_by_date(
         JSON string with filtered event results
     """
     
-    file_path = os.path.join(EVENTS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No event search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            event_data = json.load(f)
+        event_data = _result_store().load(search_id)
+        if event_data is None:
+            return f"No event search found with ID: {search_id}"
         
         events = event_data.get("events_results", [])
         filtered_events = []
@@ -222,7 +216,7 @@ def filter_events_by_date(
         
         return json.dumps(result, indent=2)
         
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error processing event data for {search_id}: {str(e)}"
 
 @mcp.tool()
@@ -241,14 +235,10 @@ def filter_events_by_type(
         JSON string with filtered event results
     """
     
-    file_path = os.path.join(EVENTS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No event search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            event_data = json.load(f)
+        event_data = _result_store().load(search_id)
+        if event_data is None:
+            return f"No event search found with ID: {search_id}"
         
         events = event_data.get("events_results", [])
         filtered_events = []
@@ -272,7 +262,7 @@ def filter_events_by_type(
         
         return json.dumps(result, indent=2)
         
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error processing event data for {search_id}: {str(e)}"
 
 @mcp.tool()
@@ -291,14 +281,10 @@ def filter_events_by_venue(
         JSON string with filtered event results
     """
     
-    file_path = os.path.join(EVENTS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No event search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            event_data = json.load(f)
+        event_data = _result_store().load(search_id)
+        if event_data is None:
+            return f"No event search found with ID: {search_id}"
         
         events = event_data.get("events_results", [])
         filtered_events = []
@@ -321,7 +307,7 @@ def filter_events_by_venue(
         
         return json.dumps(result, indent=2)
         
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error processing event data for {search_id}: {str(e)}"
 
 @mcp.resource("events://searches")
@@ -333,26 +319,17 @@ def get_event_searches() -> str:
     """
     searches = []
     
-    if os.path.exists(EVENTS_DIR):
-        for filename in os.listdir(EVENTS_DIR):
-            if filename.endswith('.json'):
-                search_id = filename[:-5]  # Remove .json extension
-                file_path = os.path.join(EVENTS_DIR, filename)
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        metadata = data.get('search_metadata', {})
-                        searches.append({
-                            'search_id': search_id,
-                            'query': metadata.get('query', 'N/A'),
-                            'location': metadata.get('location', 'N/A'),
-                            'date_filter': metadata.get('date_filter', 'None'),
-                            'event_type': metadata.get('event_type', 'None'),
-                            'total_results': metadata.get('total_results', 0),
-                            'search_time': metadata.get('search_timestamp', 'N/A')
-                        })
-                except (json.JSONDecodeError, KeyError):
-                    continue
+    for stored in _result_store().list_searches():
+        metadata = stored['metadata']
+        searches.append({
+            'search_id': stored['search_id'],
+            'query': metadata.get('query', 'N/A'),
+            'location': metadata.get('location', 'N/A'),
+            'date_filter': metadata.get('date_filter', 'None'),
+            'event_type': metadata.get('event_type', 'None'),
+            'total_results': metadata.get('total_results', 0),
+            'search_time': metadata.get('search_timestamp', 'N/A')
+        })
     
     content = "# Event Searches\n\n"
     if searches:
@@ -380,14 +357,10 @@ def get_event_search_details(search_id: str) -> str:
     Args:
         search_id: The event search ID to retrieve details for
     """
-    file_path = os.path.join(EVENTS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"# Event Search Not Found: {search_id}\n\nNo event search found with this ID."
-    
     try:
-        with open(file_path, 'r') as f:
-            event_data = json.load(f)
+        event_data = _result_store().load(search_id)
+        if event_data is None:
+            return f"# Event Search Not Found: {search_id}\n\nNo event search found with this ID."
         
         metadata = event_data.get('search_metadata', {})
         events = event_data.get('events_results', [])
@@ -445,7 +418,7 @@ def get_event_search_details(search_id: str) -> str:
         
         return content
         
-    except json.JSONDecodeError:
+    except ValueError:
         return f"# Error\n\nCorrupted event data for search ID: {search_id}"
 
 @mcp.prompt()
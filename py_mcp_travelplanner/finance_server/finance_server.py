@@ -1,9 +1,21 @@
-import requests
+import asyncio
+import email.utils
+import httpx
 import json
 import os
 from typing import List, Dict, Optional, Any, Union
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from mcp.server.fastmcp import FastMCP
+from py_mcp_travelplanner.config import get_config
+from py_mcp_travelplanner.finance_server.fx_rates import FxRateTable, get_fx_rate_table
+from py_mcp_travelplanner.finance_server.price_series import (
+    PriceSeriesStore,
+    analyze,
+    get_price_series_store,
+    parse_graph,
+)
+from py_mcp_travelplanner.http_client import SERPAPI_URL, async_http_get, serpapi_get_async, serpapi_search_async
+from py_mcp_travelplanner.result_store import ResultStore, get_result_store
 
 # Directory to store finance search results
 FINANCE_DIR = "./outputs/finance"
@@ -11,6 +23,59 @@ FINANCE_DIR = "./outputs/finance"
 # Initialize FastMCP server
 mcp = FastMCP("finance-assistant")
 
+def _index_finance_search(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive the indexed symbol/price columns of a stored finance search."""
+    metadata = document.get("search_metadata", {})
+    if metadata.get("from_currency"):
+        route = f"{metadata['from_currency']}-{metadata.get('to_currency')}"
+    else:
+        route = metadata.get("symbol")
+    summary = document.get("summary")
+    price = summary.get("extracted_price") if isinstance(summary, dict) else None
+    return {
+        "route": route,
+        "min_price": price if isinstance(price, (int, float)) else None,
+    }
+
+def _result_store() -> ResultStore:
+    """Return the store holding saved finance searches."""
+    return get_result_store("finance", FINANCE_DIR, index=_index_finance_search)
+
+def _price_series_store() -> PriceSeriesStore:
+    """Return the columnar store of price histories (FINANCE_DIR/series by default)."""
+    return get_price_series_store(os.path.join(FINANCE_DIR, "series"))
+
+def _fx_rate_table() -> Optional[FxRateTable]:
+    """Return the FX rate table convert_currency answers from (None if disabled)."""
+    return get_fx_rate_table()
+
+async def _fetch_fx_quotes(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a google_finance search for FX quotes, bypassing the SerpAPI response cache.
+
+    The rate table stamps quotes with the time they are ingested, so they
+    must come straight from upstream rather than from a cached response.
+    """
+    response = await async_http_get(SERPAPI_URL, params=params)
+    response.raise_for_status()
+    return response.json()
+
+def _response_date(response: httpx.Response) -> Optional[float]:
+    """Return a response's Date header as epoch seconds, or None."""
+    try:
+        return email.utils.parsedate_to_datetime(response.headers["date"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return None
+
+async def _fetch_fx_snapshot() -> Dict[str, Any]:
+    """Fetch one google_finance page; its markets block quotes the major currency pairs."""
+    params = {
+        "engine": "google_finance",
+        "api_key": get_serpapi_key(),
+        "q": get_config().get('FX_SNAPSHOT_QUERY', 'EUR-USD'),
+        "hl": "en"
+    }
+    return await _fetch_fx_quotes(params)
+
 def get_serpapi_key() -> str:
     """Get SerpAPI key from environment variable."""
     api_key = os.getenv("SERPAPI_KEY")
@@ -19,7 +84,7 @@ def get_serpapi_key() -> str:
     return api_key
 
 @mcp.tool()
-def lookup_stock(
+async def lookup_stock(
     symbol: str,
     exchange: Optional[str] = None,
     window: Optional[str] = None,
@@ -59,10 +124,7 @@ def lookup_stock(
             params["window"] = window.upper()
         
         # Make API request
-        response = requests.get("https://serpapi.com/search", params=params)
-        response.raise_for_status()
-        
-        stock_data = response.json()
+        stock_data = await serpapi_search_async(params)
         
         # Create search identifier
         search_id = f"stock_{symbol.lower()}"
@@ -70,9 +132,6 @@ def lookup_stock(
             search_id += f"_{exchange.lower()}"
         search_id += f"_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Create directory structure
-        os.makedirs(FINANCE_DIR, exist_ok=True)
-        
         # Process and store stock results
         processed_results = {
             "search_metadata": {
@@ -93,12 +152,10 @@ def lookup_stock(
             "discover_more": stock_data.get("discover_more", [])
         }
         
-        # Save results to file
-        file_path = os.path.join(FINANCE_DIR, f"{search_id}.json")
-        with open(file_path, "w") as f:
-            json.dump(processed_results, f, indent=2)
+        # Save results to the result store
+        saved_to = _result_store().save(search_id, processed_results)
         
-        print(f"Stock lookup results saved to: {file_path}")
+        print(f"Stock lookup results saved to: {saved_to}")
         
         # Return summary for the user
         summary = processed_results.get("summary", {})
@@ -114,7 +171,7 @@ def lookup_stock(
             "last_updated": datetime.now().isoformat()
         }
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
@@ -122,20 +179,26 @@ def lookup_stock(
         return {"error": f"Unexpected error: {str(e)}"}
 
 @mcp.tool()
-def convert_currency(
+async def convert_currency(
     from_currency: str,
     to_currency: str,
     amount: float = 1.0,
-    language: str = "en"
+    language: str = "en",
+    max_age: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Convert currency using Google Finance exchange rates.
     
+    Rates are answered from an in-memory table fed by market snapshots,
+    including cross rates through USD/EUR; only pairs the table cannot
+    derive are requested (and saved) individually.
+    
     Args:
         from_currency: Source currency code (e.g., 'USD', 'EUR', 'GBP')
         to_currency: Target currency code (e.g., 'USD', 'EUR', 'GBP')
         amount: Amount to convert (default: 1.0)
         language: Language code (default: 'en')
+        max_age: Oldest acceptable rate in seconds (default: FX_RATE_MAX_AGE)
         
     Returns:
         Dict containing conversion rate and converted amount
@@ -147,6 +210,30 @@ def convert_currency(
         # Format currency pair query
         query = f"{from_currency.upper()}-{to_currency.upper()}"
         
+        table = _fx_rate_table()
+        if table is not None:
+            rate = table.rate(from_currency, to_currency, max_age)
+            if table.needs_refresh():
+                if rate is None:
+                    # Nothing usable yet: wait for the snapshot
+                    await table.refresh(_fetch_fx_snapshot)
+                    rate = table.rate(from_currency, to_currency, max_age)
+                else:
+                    table.refresh_in_background(_fetch_fx_snapshot)
+            if rate is not None:
+                return {
+                    "search_id": None,
+                    "from_currency": from_currency.upper(),
+                    "to_currency": to_currency.upper(),
+                    "original_amount": amount,
+                    "exchange_rate": rate.rate,
+                    "converted_amount": amount * rate.rate,
+                    "rate_source": "rate_table",
+                    "rate_path": list(rate.path),
+                    "rate_age_seconds": round(table.now() - rate.as_of, 1),
+                    "last_updated": datetime.fromtimestamp(rate.as_of).isoformat()
+                }
+        
         # Build search parameters
         params = {
             "engine": "google_finance",
@@ -155,18 +242,14 @@ def convert_currency(
             "hl": language
         }
         
-        # Make API request
-        response = requests.get("https://serpapi.com/search", params=params)
-        response.raise_for_status()
-        
-        currency_data = response.json()
+        # Make API request (uncached: the quote goes into the rate table)
+        currency_data = await _fetch_fx_quotes(params)
+        if table is not None:
+            table.update_from_response(currency_data, query)
         
         # Create search identifier
         search_id = f"currency_{from_currency.lower()}_{to_currency.lower()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Create directory structure
-        os.makedirs(FINANCE_DIR, exist_ok=True)
-        
         # Process and store currency results
         processed_results = {
             "search_metadata": {
@@ -183,12 +266,10 @@ def convert_currency(
             "markets": currency_data.get("markets", {})
         }
         
-        # Save results to file
-        file_path = os.path.join(FINANCE_DIR, f"{search_id}.json")
-        with open(file_path, "w") as f:
-            json.dump(processed_results, f, indent=2)
+        # Save results to the result store
+        saved_to = _result_store().save(search_id, processed_results)
         
-        print(f"Currency conversion results saved to: {file_path}")
+        print(f"Currency conversion results saved to: {saved_to}")
         
         # Extract conversion rate
         summary = processed_results.get("summary", {})
@@ -213,11 +294,12 @@ def convert_currency(
             "original_amount": amount,
             "exchange_rate": exchange_rate,
             "converted_amount": converted_amount,
+            "rate_source": "pair_request",
             "rate_change": summary.get("price_movement", {}),
             "last_updated": datetime.now().isoformat()
         }
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
@@ -225,7 +307,7 @@ def convert_currency(
         return {"error": f"Unexpected error: {str(e)}"}
 
 @mcp.tool()
-def get_market_overview(language: str = "en") -> Dict[str, Any]:
+async def get_market_overview(language: str = "en") -> Dict[str, Any]:
     """
     Get overview of major markets including stocks, currencies, and crypto.
     
@@ -248,7 +330,7 @@ def get_market_overview(language: str = "en") -> Dict[str, Any]:
         }
         
         # Make API request
-        response = requests.get("https://serpapi.com/search", params=params)
+        response = await serpapi_get_async(params)
         response.raise_for_status()
         
         market_data = response.json()
@@ -256,11 +338,13 @@ def get_market_overview(language: str = "en") -> Dict[str, Any]:
         # Create search identifier
         search_id = f"market_overview_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Create directory structure
-        os.makedirs(FINANCE_DIR, exist_ok=True)
-        
         # Process markets data
         markets = market_data.get("markets", {})
+        table = _fx_rate_table()
+        fetched_at = _response_date(response)
+        if table is not None and fetched_at is not None:
+            # Stamped with the upstream Date, which a response replayed from the HTTP cache keeps
+            table.update_from_markets(markets, as_of=fetched_at)
         
         processed_results = {
             "search_metadata": {
@@ -271,12 +355,10 @@ def get_market_overview(language: str = "en") -> Dict[str, Any]:
             "markets": markets
         }
         
-        # Save results to file
-        file_path = os.path.join(FINANCE_DIR, f"{search_id}.json")
-        with open(file_path, "w") as f:
-            json.dump(processed_results, f, indent=2)
+        # Save results to the result store
+        saved_to = _result_store().save(search_id, processed_results)
         
-        print(f"Market overview results saved to: {file_path}")
+        print(f"Market overview results saved to: {saved_to}")
         
         # Return organized market data
         result = {
@@ -292,7 +374,7 @@ def get_market_overview(language: str = "en") -> Dict[str, Any]:
         
         return result
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
@@ -311,16 +393,12 @@ def get_finance_details(search_id: str) -> str:
         JSON string with detailed finance information
     """
     
-    file_path = os.path.join(FINANCE_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No finance search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            finance_data = json.load(f)
+        finance_data = _result_store().load(search_id)
+        if finance_data is None:
+            return f"No finance search found with ID: {search_id}"
         return json.dumps(finance_data, indent=2)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error reading finance data for {search_id}: {str(e)}"
 
 @mcp.tool()
@@ -343,14 +421,10 @@ def filter_stocks_by_price_movement(
         JSON string with filtered results
     """
     
-    file_path = os.path.join(FINANCE_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No finance search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            finance_data = json.load(f)
+        finance_data = _result_store().load(search_id)
+        if finance_data is None:
+            return f"No finance search found with ID: {search_id}"
         
         def movement_filter(item):
             price_movement = item.get("price_movement", {})
@@ -391,11 +465,11 @@ def filter_stocks_by_price_movement(
         
         return json.dumps(result, indent=2)
         
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error processing finance data for {search_id}: {str(e)}"
 
 @mcp.tool()
-def get_historical_data(
+async def get_historical_data(
     symbol: str,
     exchange: Optional[str] = None,
     window: str = "1Y",
@@ -404,6 +478,9 @@ def get_historical_data(
     """
     Get historical price data for a stock with specific time window.
     
+    The price graph is merged into a columnar series stored per symbol and
+    window, which analyze_price_history reads without refetching.
+    
     Args:
         symbol: Stock symbol (e.g., 'GOOGL', 'AAPL', 'TSLA')
         exchange: Optional exchange (e.g., 'NASDAQ', 'NYSE')
@@ -432,7 +509,7 @@ def get_historical_data(
         }
         
         # Make API request
-        response = requests.get("https://serpapi.com/search", params=params)
+        response = await serpapi_get_async(params)
         response.raise_for_status()
         
         historical_data = response.json()
@@ -443,12 +520,12 @@ def get_historical_data(
             search_id += f"_{exchange.lower()}"
         search_id += f"_{window.lower()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Create directory structure
-        os.makedirs(FINANCE_DIR, exist_ok=True)
-        
-        # Process historical data
+        # Process historical data: the price graph goes to the columnar series store
         graph_data = historical_data.get("graph", [])
         key_events = historical_data.get("key_events", [])
+        fetched = parse_graph(graph_data)
+        # np.load/np.save and the meta.json write are blocking file I/O
+        series = await asyncio.to_thread(_price_series_store().merge, query, window.upper(), fetched)
         
         processed_results = {
             "search_metadata": {
@@ -460,28 +537,26 @@ def get_historical_data(
                 "search_type": "historical"
             },
             "summary": historical_data.get("summary", {}),
-            "graph": graph_data,
+            "series": {"symbol": query, "window": window.upper(), "stored_points": len(series)},
             "key_events": key_events,
             "data_points": len(graph_data)
         }
         
-        # Save results to file
-        file_path = os.path.join(FINANCE_DIR, f"{search_id}.json")
-        with open(file_path, "w") as f:
-            json.dump(processed_results, f, indent=2)
+        # Save results to the result store
+        saved_to = _result_store().save(search_id, processed_results)
         
-        print(f"Historical data results saved to: {file_path}")
+        print(f"Historical data results saved to: {saved_to}")
         
         # Calculate basic statistics
-        prices = [point.get("price", 0) for point in graph_data if point.get("price")]
+        prices = fetched.prices
         
         statistics = {}
-        if prices:
+        if len(prices):
             statistics = {
-                "min_price": min(prices),
-                "max_price": max(prices),
-                "avg_price": sum(prices) / len(prices),
-                "price_range": max(prices) - min(prices),
+                "min_price": float(prices.min()),
+                "max_price": float(prices.max()),
+                "avg_price": float(prices.mean()),
+                "price_range": float(prices.max() - prices.min()),
                 "total_data_points": len(prices)
             }
         
@@ -490,18 +565,71 @@ def get_historical_data(
             "symbol": symbol.upper(),
             "window": window.upper(),
             "statistics": statistics,
+            "stored_points": len(series),
             "key_events_count": len(key_events),
             "has_data": len(graph_data) > 0,
             "last_updated": datetime.now().isoformat()
         }
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}"}
 
+@mcp.tool()
+def analyze_price_history(
+    symbol: str,
+    exchange: Optional[str] = None,
+    window: str = "1Y",
+    moving_averages: Optional[List[int]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Analyze a stored price history: returns, moving averages, volatility and drawdown.
+    
+    Works on the series saved by get_historical_data (no new API request).
+    
+    Args:
+        symbol: Stock symbol (e.g., 'GOOGL', 'AAPL', 'TSLA')
+        exchange: Optional exchange (e.g., 'NASDAQ', 'NYSE')
+        window: Time window the history was fetched with ('1D', '5D', '1M', '6M', '1Y', '5Y', 'MAX')
+        moving_averages: Moving average lengths in data points (default: [20, 50])
+        start_date: Only analyze points from this date (YYYY-MM-DD, UTC)
+        end_date: Only analyze points up to this date (YYYY-MM-DD, UTC)
+        
+    Returns:
+        Dict containing the price statistics of the stored series
+    """
+    
+    try:
+        query = symbol.upper()
+        if exchange:
+            query = f"{symbol.upper()}:{exchange.upper()}"
+        
+        series = _price_series_store().load(query, window)
+        if series is None or not len(series):
+            return {"error": f"No stored price history for {query} ({window.upper()}); call get_historical_data first"}
+        
+        start = int(datetime.fromisoformat(start_date).replace(tzinfo=timezone.utc).timestamp()) if start_date else None
+        end = None
+        if end_date:
+            end = int((datetime.fromisoformat(end_date) + timedelta(days=1)).replace(tzinfo=timezone.utc).timestamp()) - 1
+        
+        return {
+            "symbol": query,
+            "window": window.upper(),
+            "stored_points": len(series),
+            "statistics": analyze(series.between(start, end), moving_averages or [20, 50])
+        }
+        
+    except ValueError as e:
+        return {"error": str(e)}
+    except Exception as e:
+        return {"error": f"Unexpected error: {str(e)}"}
+
 @mcp.resource("finance://searches")
 def get_finance_searches() -> str:
     """
@@ -511,27 +639,16 @@ def get_finance_searches() -> str:
     """
     searches = []
     
-    if os.path.exists(FINANCE_DIR):
-        for filename in os.listdir(FINANCE_DIR):
-            if filename.endswith('.json'):
-                search_id = filename[:-5]  # Remove .json extension
-                file_path = os.path.join(FINANCE_DIR, filename)
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        metadata = data.get('search_metadata', {})
-                        searches.append({
-                            'search_id': search_id,
-                            'type': metadata.get('search_type', 'unknown'),
-                            'symbol': metadata.get('symbol', 'N/A'),
-                            'query': metadata.get('query', 'N/A'),
-                            'search_time': metadata.get('search_timestamp', 'N/A')
-                        })
-                except (json.JSONDecodeError, KeyError):
-                    continue
-    
-    # Sort by search time (most recent first)
-    searches.sort(key=lambda x: x['search_time'], reverse=True)
+    # Most recent first
+    for stored in _result_store().list_searches():
+        metadata = stored['metadata']
+        searches.append({
+            'search_id': stored['search_id'],
+            'type': metadata.get('search_type', 'unknown'),
+            'symbol': metadata.get('symbol', 'N/A'),
+            'query': metadata.get('query', 'N/A'),
+            'search_time': metadata.get('search_timestamp', 'N/A')
+        })
     
     content = "# Finance Searches\n\n"
     if searches:
@@ -577,14 +694,10 @@ def get_finance_search_details(search_id: str) -> str:
     Args:
         search_id: The finance search ID to retrieve details for
     """
-    file_path = os.path.join(FINANCE_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"# Finance Search Not Found: {search_id}\n\nNo finance search found with this ID."
-    
     try:
-        with open(file_path, 'r') as f:
-            finance_data = json.load(f)
+        finance_data = _result_store().load(search_id)
+        if finance_data is None:
+            return f"# Finance Search Not Found: {search_id}\n\nNo finance search found with this ID."
         
         metadata = finance_data.get('search_metadata', {})
         search_type = metadata.get('search_type', 'unknown')
@@ -687,7 +800,7 @@ def get_finance_search_details(search_id: str) -> str:
         
         return content
         
-    except json.JSONDecodeError:
+    except ValueError:
         return f"# Error\n\nCorrupted finance data for search ID: {search_id}"
 
 @mcp.prompt()
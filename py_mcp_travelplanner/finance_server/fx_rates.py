@@ -0,0 +1,341 @@
+"""In-memory FX rate table for answering currency conversions locally.
+
+``convert_currency`` used to send one ``google_finance`` request per
+currency pair. Every ``google_finance`` response, however, carries a
+``markets`` block whose ``currencies`` (and ``crypto``) lists quote the
+major pairs, so a single response is a snapshot of the whole FX market.
+The table ingests those quotes and answers any pair from memory:
+
+- a direct quote (``EUR-USD``) or its inverse (``USD-EUR``)
+- a cross rate through the pivot currencies (``FX_PIVOT_CURRENCIES``,
+  USD and EUR by default), e.g. ``GBP-JPY`` as ``GBP-USD`` x ``USD-JPY``
+
+Every quote keeps the time it was observed. A derived rate is as old as
+its oldest leg and is only used while that is within ``FX_RATE_MAX_AGE``
+seconds. Once the last snapshot is ``FX_REFRESH_INTERVAL`` seconds old,
+conversions are still answered from the table while a new snapshot is
+fetched in the background (one refresh in flight at a time). A refresh
+that fails or yields no quotes is not retried for
+``FX_REFRESH_RETRY_INTERVAL`` seconds.
+
+Example Usage:
+    from py_mcp_travelplanner.finance_server.fx_rates import get_fx_rate_table
+
+    table = get_fx_rate_table()
+    table.update_from_response(response)   # any google_finance response
+    rate = table.rate("GBP", "JPY")
+    if rate is not None:
+        rate.rate, rate.path                # 188.9, ("GBP", "USD", "JPY")
+    if table.needs_refresh():
+        table.refresh_in_background(fetch_snapshot)
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from py_mcp_travelplanner.config import get_config
+
+LOG = logging.getLogger("py_mcp_travelplanner.finance_server.fx_rates")
+
+DEFAULT_MAX_AGE = 3600.0
+DEFAULT_REFRESH_INTERVAL = 900.0
+DEFAULT_REFRESH_RETRY_INTERVAL = 60.0
+DEFAULT_PIVOTS = ("USD", "EUR")
+
+# Lists of a google_finance ``markets`` block that quote currency pairs
+MARKET_LISTS = ("currencies", "crypto")
+
+_PAIR = re.compile(r"^\s*([A-Za-z]{3,5})\s*[-/ ]\s*([A-Za-z]{3,5})\s*$")
+
+
+def parse_pair(text: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Parse ``"EUR-USD"`` or ``"EUR / USD"`` into ``("EUR", "USD")``."""
+    match = _PAIR.match(text or "")
+    if match is None:
+        return None
+    return match.group(1).upper(), match.group(2).upper()
+
+
+def parse_currencies(value: str | Sequence[str]) -> Tuple[str, ...]:
+    """Normalize ``"USD, EUR"`` or ``["usd", "eur"]`` to ``("USD", "EUR")``.
+
+    Environment and .env values arrive as a single comma-separated string.
+    """
+    items = value.split(",") if isinstance(value, str) else value
+    return tuple(code.strip().upper() for code in items if code and code.strip())
+
+
+def _rate(value: Any) -> Optional[float]:
+    """Return a quoted price as a positive float, or None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        value = value.replace(",", "")
+    try:
+        rate = float(value)
+    except (TypeError, ValueError):
+        return None
+    return rate if rate > 0 else None
+
+
+@dataclass(frozen=True)
+class FxRate:
+    """A conversion rate and how it was obtained."""
+
+    base: str
+    quote: str
+    rate: float
+    as_of: float  # Observation time of the oldest quote used
+    path: Tuple[str, ...]  # Currencies traversed, e.g. ("GBP", "USD", "JPY")
+
+
+class FxRateTable:
+    """Thread-safe table of currency quotes with direct, inverse and cross-rate lookup."""
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE,
+                 refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+                 refresh_retry_interval: float = DEFAULT_REFRESH_RETRY_INTERVAL,
+                 pivots: str | Sequence[str] = DEFAULT_PIVOTS,
+                 clock: Callable[[], float] = time.time):
+        self.max_age = float(max_age)
+        self.refresh_interval = float(refresh_interval)
+        self.refresh_retry_interval = float(refresh_retry_interval)
+        self.pivots = parse_currencies(pivots)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._quotes: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._refreshed_at: Optional[float] = None
+        self._attempted_at: Optional[float] = None  # End of the last refresh attempt
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._counters = {"lookups": 0, "direct": 0, "cross": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0}
+
+    def now(self) -> float:
+        return self._clock()
+
+    def update(self, quotes: Mapping[str, Any] | Iterable[Tuple[str, Any]],
+               as_of: Optional[float] = None) -> int:
+        """Record ``pair -> rate`` quotes; returns how many were usable."""
+        as_of = self._clock() if as_of is None else as_of
+        items = quotes.items() if isinstance(quotes, Mapping) else quotes
+        parsed = []
+        for text, value in items:
+            pair, rate = parse_pair(text), _rate(value)
+            if pair is not None and rate is not None and pair[0] != pair[1]:
+                parsed.append((pair, rate))
+        with self._lock:
+            for pair, rate in parsed:
+                self._quotes[pair] = (rate, as_of)
+        return len(parsed)
+
+    def update_from_markets(self, markets: Optional[Mapping[str, Any]],
+                            as_of: Optional[float] = None) -> int:
+        """Record every pair quoted in a google_finance ``markets`` block.
+
+        A block with at least one usable quote counts as a snapshot refresh.
+        """
+        as_of = self._clock() if as_of is None else as_of
+        quotes = [
+            (entry.get("stock"), entry.get("price"))
+            for name in MARKET_LISTS
+            for entry in (markets or {}).get(name) or []
+            if isinstance(entry, Mapping)
+        ]
+        count = self.update(quotes, as_of)
+        if count:
+            with self._lock:
+                self._refreshed_at = max(self._refreshed_at or as_of, as_of)
+        return count
+
+    def update_from_response(self, response: Mapping[str, Any], query: Optional[str] = None,
+                             as_of: Optional[float] = None) -> int:
+        """Record the quotes of a google_finance response.
+
+        Args:
+            response: Parsed response; its ``markets`` block is ingested
+            query: The ``q`` of the request; when it is a currency pair the
+                summary's ``extracted_price`` is recorded for it as well
+            as_of: Observation time (defaults to now)
+        """
+        count = self.update_from_markets(response.get("markets"), as_of)
+        summary = response.get("summary")
+        if query and isinstance(summary, Mapping):
+            count += self.update({query: summary.get("extracted_price")}, as_of)
+        return count
+
+    def _leg(self, base: str, quote: str, oldest: float) -> Optional[Tuple[float, float]]:
+        # Caller holds the lock
+        direct = self._quotes.get((base, quote))
+        if direct is not None and direct[1] >= oldest:
+            return direct
+        inverse = self._quotes.get((quote, base))
+        if inverse is not None and inverse[1] >= oldest:
+            return 1.0 / inverse[0], inverse[1]
+        return None
+
+    def _paths(self, base: str, quote: str) -> Iterable[Tuple[str, ...]]:
+        pivots = [p for p in self.pivots if p not in (base, quote)]
+        yield (base, quote)
+        for pivot in pivots:
+            yield (base, pivot, quote)
+        for first, second in itertools.permutations(pivots, 2):
+            yield (base, first, second, quote)
+
+    def rate(self, base: str, quote: str, max_age: Optional[float] = None) -> Optional[FxRate]:
+        """Return the rate converting ``base`` into ``quote``, or None if not derivable.
+
+        Args:
+            base: Currency converted from
+            quote: Currency converted to
+            max_age: Oldest acceptable quote in seconds (defaults to the table's ``max_age``)
+        """
+        base, quote = base.upper(), quote.upper()
+        now = self._clock()
+        if base == quote:
+            return FxRate(base, quote, 1.0, now, (base,))
+
+        oldest = now - (self.max_age if max_age is None else float(max_age))
+        with self._lock:
+            self._counters["lookups"] += 1
+            for path in self._paths(base, quote):
+                rate, as_of = 1.0, now
+                for leg_base, leg_quote in zip(path, path[1:]):
+                    leg = self._leg(leg_base, leg_quote, oldest)
+                    if leg is None:
+                        break
+                    rate, as_of = rate * leg[0], min(as_of, leg[1])
+                else:
+                    self._counters["direct" if len(path) == 2 else "cross"] += 1
+                    return FxRate(base, quote, rate, as_of, path)
+            self._counters["misses"] += 1
+        return None
+
+    def convert(self, amount: float, base: str, quote: str,
+                max_age: Optional[float] = None) -> Optional[float]:
+        """Convert an amount locally; returns None when no fresh rate is known."""
+        rate = self.rate(base, quote, max_age)
+        return None if rate is None else amount * rate.rate
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last market snapshot, or None if there has been none."""
+        with self._lock:
+            refreshed_at = self._refreshed_at
+        return None if refreshed_at is None else self._clock() - refreshed_at
+
+    def needs_refresh(self) -> bool:
+        """Return True when the snapshot is due and no attempt failed recently."""
+        age = self.age()
+        if age is not None and age < self.refresh_interval:
+            return False
+        with self._lock:
+            attempted_at = self._attempted_at
+        return attempted_at is None or self._clock() - attempted_at >= self.refresh_retry_interval
+
+    def _current_task(self) -> Optional[asyncio.Task]:
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    async def _run_refresh(self, fetch: Callable[[], Awaitable[Mapping[str, Any]]],
+                           query: Optional[str]) -> int:
+        try:
+            count = self.update_from_response(await fetch(), query)
+        except Exception as e:
+            with self._lock:
+                self._counters["refresh_errors"] += 1
+                self._attempted_at = self._clock()
+            LOG.warning("FX rate refresh failed: %s", e)
+            return 0
+        with self._lock:
+            self._counters["refreshes"] += 1
+            self._attempted_at = self._clock()
+        return count
+
+    def refresh_in_background(self, fetch: Callable[[], Awaitable[Mapping[str, Any]]],
+                              query: Optional[str] = None) -> asyncio.Task:
+        """Start a snapshot refresh unless one is already running; returns its task.
+
+        Args:
+            fetch: Coroutine function returning a google_finance response
+            query: The response's query (see ``update_from_response``)
+
+        Must be called from a running event loop. Failures are logged and
+        counted, never raised.
+        """
+        task = self._current_task()
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._run_refresh(fetch, query))
+            self._refresh_task = task
+        return task
+
+    async def refresh(self, fetch: Callable[[], Awaitable[Mapping[str, Any]]],
+                      query: Optional[str] = None) -> int:
+        """Refresh from a snapshot now, joining a refresh already in flight.
+
+        Returns the number of quotes recorded (0 if the fetch failed).
+        """
+        return await asyncio.shield(self.refresh_in_background(fetch, query))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._quotes.clear()
+            self._refreshed_at = None
+            self._attempted_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        age = self.age()
+        with self._lock:
+            return {
+                **self._counters,
+                "quotes": len(self._quotes),
+                "age_seconds": None if age is None else round(age, 1),
+                "max_age": self.max_age,
+                "refresh_interval": self.refresh_interval,
+                "refresh_retry_interval": self.refresh_retry_interval,
+                "pivots": list(self.pivots),
+            }
+
+
+# Global FX rate table instance
+_fx_rate_table: Optional[FxRateTable] = None
+_fx_rate_table_lock = threading.Lock()
+
+
+def get_fx_rate_table() -> Optional[FxRateTable]:
+    """Return the process-wide FX rate table.
+
+    Returns None when the table is disabled via ``FX_RATE_TABLE_ENABLED``.
+    """
+    global _fx_rate_table
+
+    config = get_config()
+    if not config.get('FX_RATE_TABLE_ENABLED', True):
+        return None
+
+    if _fx_rate_table is None:
+        with _fx_rate_table_lock:
+            if _fx_rate_table is None:
+                _fx_rate_table = FxRateTable(
+                    max_age=float(config.get('FX_RATE_MAX_AGE', DEFAULT_MAX_AGE)),
+                    refresh_interval=float(config.get('FX_REFRESH_INTERVAL', DEFAULT_REFRESH_INTERVAL)),
+                    refresh_retry_interval=float(config.get('FX_REFRESH_RETRY_INTERVAL',
+                                                            DEFAULT_REFRESH_RETRY_INTERVAL)),
+                    pivots=config.get('FX_PIVOT_CURRENCIES') or DEFAULT_PIVOTS,
+                )
+    return _fx_rate_table
+
+
+def reset_fx_rate_table() -> None:
+    """Discard the global FX rate table instance.
+
+    This is primarily useful for testing.
+    """
+    global _fx_rate_table
+    _fx_rate_table = None
@@ -0,0 +1,339 @@
+"""Columnar on-disk store of Google Finance price history.
+
+``get_historical_data`` used to keep each ``google_finance`` price graph as
+nested JSON, so every analysis re-parsed a list of dicts. Graphs are now
+parsed once into three aligned NumPy columns:
+
+- ``timestamps.npy``: int64 UTC epoch seconds, strictly ascending
+- ``prices.npy``: float64 prices
+- ``volumes.npy``: float64 traded volume (NaN where Google reports none)
+
+Each (symbol, window) series lives in its own directory under the store
+root. Every write goes to a new, uniquely named version sub-directory, and
+the small ``meta.json`` naming the current version is then swapped in with
+one atomic rename, so readers (in this or another server process) always
+see a complete, aligned set of columns. Arrays are memory-mapped on load.
+
+Storing a newly fetched graph merges it into the stored series (union on
+timestamp, the newer price winning), so repeated fetches of a window
+extend the history instead of replacing it. Writers hold an exclusive
+lock on the series' ``.lock`` file for the whole read-merge-write, so
+concurrent merges from several server processes never drop each other's
+points.
+
+``analyze()`` computes returns, moving averages, volatility and drawdown
+over a series in a handful of vectorized passes.
+
+Example Usage:
+    from py_mcp_travelplanner.finance_server.price_series import (
+        analyze, get_price_series_store, parse_graph,
+    )
+
+    store = get_price_series_store("./outputs/finance/series")
+    series = store.merge("GOOGL:NASDAQ", "1Y", parse_graph(response["graph"]))
+    stats = analyze(series, moving_averages=(20, 50))
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import os
+import pathlib
+import re
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: merges are serialized within the process only
+    fcntl = None
+
+from py_mcp_travelplanner.config import get_config
+
+COLUMNS = ("timestamps", "prices", "volumes")
+
+TRADING_DAYS_PER_YEAR = 252
+TRADING_SECONDS_PER_DAY = 6.5 * 3600
+
+# "Oct 02 2023, 04:00 PM UTC-04:00" as found in google_finance graphs
+_GRAPH_DATE = re.compile(
+    r"^\s*([A-Za-z]{3} \d{1,2} \d{4}),?\s+(\d{1,2}:\d{2}\s*[AP]M)\s*(?:UTC([+-]\d{1,2}(?::?\d{2})?)?)?\s*$"
+)
+
+
+def parse_timestamp(text: str) -> Optional[int]:
+    """Return a graph point's date as UTC epoch seconds, or None if unparseable."""
+    match = _GRAPH_DATE.match(text or "")
+    if match is not None:
+        moment = datetime.strptime(f"{match.group(1)} {match.group(2).replace(' ', '')}", "%b %d %Y %I:%M%p")
+        offset = match.group(3) or "+00:00"
+        sign = -1 if offset[0] == "-" else 1
+        hours, _, minutes = offset[1:].partition(":")
+        if not minutes and len(hours) > 2:
+            hours, minutes = hours[:-2], hours[-2:]
+        tz = timezone(sign * timedelta(hours=int(hours), minutes=int(minutes or 0)))
+        return int(moment.replace(tzinfo=tz).timestamp())
+    try:
+        moment = datetime.fromisoformat(text)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+@dataclass(frozen=True)
+class PriceSeries:
+    """Aligned, timestamp-sorted price columns."""
+
+    timestamps: np.ndarray
+    prices: np.ndarray
+    volumes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def empty(cls) -> "PriceSeries":
+        return cls(np.empty(0, np.int64), np.empty(0, np.float64), np.empty(0, np.float64))
+
+    def between(self, start: Optional[int] = None, end: Optional[int] = None) -> "PriceSeries":
+        """Return the points with ``start <= timestamp <= end`` (epoch seconds)."""
+        lo = 0 if start is None else int(np.searchsorted(self.timestamps, start, side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamps, end, side="right"))
+        return PriceSeries(self.timestamps[lo:hi], self.prices[lo:hi], self.volumes[lo:hi])
+
+
+def _sorted_unique(timestamps: np.ndarray, prices: np.ndarray, volumes: np.ndarray) -> PriceSeries:
+    """Sort by timestamp, keeping the last value given for a repeated timestamp."""
+    order = np.argsort(timestamps, kind="stable")
+    timestamps, prices, volumes = timestamps[order], prices[order], volumes[order]
+    keep = np.ones(len(timestamps), dtype=bool)
+    keep[:-1] = timestamps[1:] != timestamps[:-1]
+    return PriceSeries(timestamps[keep], prices[keep], volumes[keep])
+
+
+def parse_graph(graph: Iterable[Mapping[str, Any]]) -> PriceSeries:
+    """Convert a ``google_finance`` graph (list of dicts) into columns.
+
+    Points without a parseable date or a positive numeric price are skipped
+    (Google reports 0 for missing quotes, which would break every return).
+    """
+    timestamps: List[int] = []
+    prices: List[float] = []
+    volumes: List[float] = []
+    for point in graph or []:
+        price = point.get("price")
+        timestamp = parse_timestamp(point.get("date", ""))
+        if timestamp is None or isinstance(price, bool) or not isinstance(price, (int, float)) or not price > 0:
+            continue
+        volume = point.get("volume")
+        timestamps.append(timestamp)
+        prices.append(float(price))
+        volumes.append(float(volume) if isinstance(volume, (int, float)) else math.nan)
+    return _sorted_unique(np.asarray(timestamps, dtype=np.int64),
+                          np.asarray(prices, dtype=np.float64),
+                          np.asarray(volumes, dtype=np.float64))
+
+
+def merge(stored: PriceSeries, fetched: PriceSeries) -> PriceSeries:
+    """Union two series on timestamp; ``fetched`` wins where both have a point."""
+    if not len(stored):
+        return fetched
+    if not len(fetched):
+        return stored
+    if fetched.timestamps[0] > stored.timestamps[-1]:
+        # Common case: the new fetch only extends the history
+        return PriceSeries(*(np.concatenate([getattr(stored, c), getattr(fetched, c)]) for c in COLUMNS))
+    return _sorted_unique(*(np.concatenate([getattr(stored, c), getattr(fetched, c)]) for c in COLUMNS))
+
+
+def periods_per_year(timestamps: np.ndarray) -> float:
+    """Estimate how many sampling periods a trading year holds from the median spacing."""
+    if len(timestamps) < 2:
+        return float(TRADING_DAYS_PER_YEAR)
+    spacing = float(np.median(np.diff(timestamps)))
+    if spacing < 86400:
+        return TRADING_DAYS_PER_YEAR * TRADING_SECONDS_PER_DAY / max(spacing, 1.0)
+    if spacing < 7 * 86400:
+        return float(TRADING_DAYS_PER_YEAR)
+    return 365.25 * 86400 / spacing
+
+
+def moving_average(prices: np.ndarray, window: int) -> np.ndarray:
+    """Trailing simple moving average (``len(prices) - window + 1`` values)."""
+    if window < 1 or window > len(prices):
+        return np.empty(0, dtype=np.float64)
+    sums = np.cumsum(np.concatenate(([0.0], prices)))
+    return (sums[window:] - sums[:-window]) / window
+
+
+def analyze(series: PriceSeries, moving_averages: Sequence[int] = (20, 50)) -> Dict[str, Any]:
+    """Return summary statistics of a price series, computed with vectorized NumPy passes.
+
+    Non-positive or non-finite prices are ignored.
+    """
+    usable = np.isfinite(series.prices) & (np.asarray(series.prices) > 0)
+    if not usable.all():
+        series = PriceSeries(*(np.asarray(getattr(series, c))[usable] for c in COLUMNS))
+    prices = np.asarray(series.prices, dtype=np.float64)
+    if len(prices) == 0:
+        return {"points": 0}
+
+    returns = prices[1:] / prices[:-1] - 1.0
+    log_returns = np.log(prices[1:] / prices[:-1])
+    drawdowns = prices / np.maximum.accumulate(prices) - 1.0
+    volumes = np.asarray(series.volumes, dtype=np.float64)
+    per_year = periods_per_year(series.timestamps)
+    volatility = float(np.std(log_returns, ddof=1)) if len(log_returns) > 1 else None
+
+    def iso(timestamp: int) -> str:
+        return datetime.fromtimestamp(int(timestamp), tz=timezone.utc).isoformat()
+
+    averages = {}
+    for window in moving_averages:
+        values = moving_average(prices, int(window))
+        averages[str(window)] = round(float(values[-1]), 4) if len(values) else None
+
+    return {
+        "points": len(prices),
+        "first": iso(series.timestamps[0]),
+        "last": iso(series.timestamps[-1]),
+        "first_price": float(prices[0]),
+        "last_price": float(prices[-1]),
+        "min_price": float(prices.min()),
+        "max_price": float(prices.max()),
+        "total_return": round(float(prices[-1] / prices[0] - 1.0), 6),
+        "mean_return": round(float(returns.mean()), 6) if len(returns) else None,
+        "best_return": round(float(returns.max()), 6) if len(returns) else None,
+        "worst_return": round(float(returns.min()), 6) if len(returns) else None,
+        "volatility": round(volatility, 6) if volatility is not None else None,
+        "annualized_volatility": round(volatility * math.sqrt(per_year), 6) if volatility is not None else None,
+        "max_drawdown": round(float(drawdowns.min()), 6),
+        "moving_averages": averages,
+        "average_volume": float(np.nanmean(volumes)) if np.isfinite(volumes).any() else None,
+    }
+
+
+class PriceSeriesStore:
+    """Directory of memory-mappable price series, one sub-directory per (symbol, window)."""
+
+    def __init__(self, directory: str | pathlib.Path):
+        self.directory = pathlib.Path(directory)
+        self._lock = threading.Lock()
+
+    def _path(self, symbol: str, window: str) -> pathlib.Path:
+        name = re.sub(r"[^A-Za-z0-9.-]+", "_", f"{symbol.upper()}__{window.upper()}")
+        return self.directory / name
+
+    def load(self, symbol: str, window: str) -> Optional[PriceSeries]:
+        """Return the stored series (memory-mapped, read-only) or None."""
+        path = self._path(symbol, window)
+        for _ in range(2):
+            metadata = self.metadata(symbol, window)
+            if metadata is None:
+                return None
+            version = path / metadata.get("version", "")
+            try:
+                return PriceSeries(*(np.load(version / f"{column}.npy", mmap_mode="r") for column in COLUMNS))
+            except FileNotFoundError:
+                continue  # Superseded and removed while we read; retry with the new version
+        return None
+
+    def metadata(self, symbol: str, window: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(symbol, window) / "meta.json", "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @contextlib.contextmanager
+    def _writer_lock(self, path: pathlib.Path) -> Iterator[None]:
+        """Hold the series' write lock, across threads and server processes."""
+        with self._lock:
+            path.mkdir(parents=True, exist_ok=True)
+            with open(path / ".lock", "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def merge(self, symbol: str, window: str, fetched: PriceSeries) -> PriceSeries:
+        """Merge a freshly fetched series into the stored one and persist the result."""
+        path = self._path(symbol, window)
+        with self._writer_lock(path):
+            stored = self.load(symbol, window)
+            series = merge(PriceSeries(*(np.array(getattr(stored, c)) for c in COLUMNS)) if stored else PriceSeries.empty(),
+                           fetched)
+            previous = (self.metadata(symbol, window) or {}).get("version")
+            version = pathlib.Path(tempfile.mkdtemp(prefix="v-", dir=path))
+            for column in COLUMNS:
+                np.save(version / f"{column}.npy", getattr(series, column))
+
+            fd, tmp = tempfile.mkstemp(prefix=".meta-", suffix=".json", dir=path)
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "symbol": symbol.upper(),
+                    "window": window.upper(),
+                    "version": version.name,
+                    "points": len(series),
+                    "first": int(series.timestamps[0]) if len(series) else None,
+                    "last": int(series.timestamps[-1]) if len(series) else None,
+                    "updated": datetime.now(timezone.utc).isoformat(),
+                }, f)
+            os.replace(tmp, path / "meta.json")
+
+            # Readers that already mapped the replaced version keep their (unlinked) files
+            if previous and previous != version.name:
+                shutil.rmtree(path / previous, ignore_errors=True)
+        return series
+
+    def list_series(self) -> List[Dict[str, Any]]:
+        """Return the metadata of every stored series."""
+        series = []
+        if self.directory.is_dir():
+            for entry in sorted(self.directory.iterdir()):
+                try:
+                    with open(entry / "meta.json", "r") as f:
+                        series.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        return series
+
+
+# Global price series stores, keyed on directory
+_price_series_stores: Dict[str, PriceSeriesStore] = {}
+_price_series_stores_lock = threading.Lock()
+
+
+def get_price_series_store(default_dir: str | pathlib.Path) -> PriceSeriesStore:
+    """Return the process-wide price series store.
+
+    Args:
+        default_dir: Store directory used unless ``FINANCE_SERIES_DIR`` is set
+    """
+    directory = os.path.abspath(get_config().get('FINANCE_SERIES_DIR') or default_dir)
+    store = _price_series_stores.get(directory)
+    if store is None:
+        with _price_series_stores_lock:
+            store = _price_series_stores.setdefault(directory, PriceSeriesStore(directory))
+    return store
+
+
+def reset_price_series_stores() -> None:
+    """Discard the global price series stores.
+
+    This is primarily useful for testing.
+    """
+    with _price_series_stores_lock:
+        _price_series_stores.clear()
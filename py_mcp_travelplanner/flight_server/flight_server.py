@@ -1,9 +1,11 @@
-import requests
+import httpx
 import json
 import os
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 from mcp.server.fastmcp import FastMCP
+from py_mcp_travelplanner.http_client import serpapi_search_async
+from py_mcp_travelplanner.result_store import ResultStore, get_result_store
 
 # Directory to store flight search results
 FLIGHTS_DIR = "./outputs/flights"
@@ -11,6 +13,22 @@ FLIGHTS_DIR = "./outputs/flights"
 # Initialize FastMCP server
 mcp = FastMCP("flight-assistant")
 
+def _index_flight_search(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive the indexed route/price columns of a stored flight search."""
+    metadata = document.get("search_metadata", {})
+    flights = document.get("best_flights", []) + document.get("other_flights", [])
+    prices = [f["price"] for f in flights if isinstance(f.get("price"), (int, float))]
+    lowest = document.get("price_insights", {}).get("lowest_price")
+    return {
+        "route": f"{metadata.get('departure')}-{metadata.get('arrival')}",
+        "min_price": lowest if lowest is not None else min(prices, default=None),
+        "result_count": len(flights),
+    }
+
+def _result_store() -> ResultStore:
+    """Return the store holding saved flight searches."""
+    return get_result_store("flights", FLIGHTS_DIR, index=_index_flight_search)
+
 def get_serpapi_key() -> str:
     """Get SerpAPI key from environment variable."""
     api_key = os.getenv("SERPAPI_KEY")
@@ -19,7 +37,7 @@ def get_serpapi_key() -> str:
     return api_key
 
 @mcp.tool()
-def search_flights(
+async def search_flights(
     departure_id: str,
     arrival_id: str,
     outbound_date: str,
@@ -86,10 +104,7 @@ def search_flights(
             return {"error": "Return date is required for round trip flights"}
         
         # Make API request
-        response = requests.get("https://serpapi.com/search", params=params)
-        response.raise_for_status()
-        
-        flight_data = response.json()
+        flight_data = await serpapi_search_async(params)
         
         # Create search identifier
         search_id = f"{departure_id}_{arrival_id}_{outbound_date}"
@@ -97,9 +112,6 @@ def search_flights(
             search_id += f"_{return_date}"
         search_id += f"_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Create directory structure
-        os.makedirs(FLIGHTS_DIR, exist_ok=True)
-        
         # Process and store flight results
         processed_results = {
             "search_metadata": {
@@ -125,12 +137,10 @@ def search_flights(
             "airports": flight_data.get("airports", [])
         }
         
-        # Save results to file
-        file_path = os.path.join(FLIGHTS_DIR, f"{search_id}.json")
-        with open(file_path, "w") as f:
-            json.dump(processed_results, f, indent=2)
+        # Save results to the result store
+        saved_to = _result_store().save(search_id, processed_results)
         
-        print(f"Flight search results saved to: {file_path}")
+        print(f"Flight search results saved to: {saved_to}")
         
         # Return summary for the user
         summary = {
@@ -146,7 +156,7 @@ def search_flights(
         
         return summary
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
@@ -165,16 +175,12 @@ def get_flight_details(search_id: str) -> str:
         JSON string with detailed flight information
     """
     
-    file_path = os.path.join(FLIGHTS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No flight search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            flight_data = json.load(f)
+        flight_data = _result_store().load(search_id)
+        if flight_data is None:
+            return f"No flight search found with ID: {search_id}"
         return json.dumps(flight_data, indent=2)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error reading flight data for {search_id}: {str(e)}"
 
 @mcp.tool()
@@ -195,14 +201,10 @@ def filter_flights_by_price(
         JSON string with filtered flight results
     """
     
-    file_path = os.path.join(FLIGHTS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No flight search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            flight_data = json.load(f)
+        flight_data = _result_store().load(search_id)
+        if flight_data is None:
+            return f"No flight search found with ID: {search_id}"
         
         def price_filter(flight):
             price = flight.get("price", 0)
@@ -228,7 +230,7 @@ def filter_flights_by_price(
         
         return json.dumps(result, indent=2)
         
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error processing flight data for {search_id}: {str(e)}"
 
 @mcp.tool()
@@ -244,14 +246,10 @@ def filter_flights_by_airline(search_id: str, airlines: List[str]) -> str:
         JSON string with filtered flight results
     """
     
-    file_path = os.path.join(FLIGHTS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No flight search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            flight_data = json.load(f)
+        flight_data = _result_store().load(search_id)
+        if flight_data is None:
+            return f"No flight search found with ID: {search_id}"
         
         def airline_filter(flight):
             flight_airlines = set()
@@ -276,7 +274,7 @@ def filter_flights_by_airline(search_id: str, airlines: List[str]) -> str:
         
         return json.dumps(result, indent=2)
         
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error processing flight data for {search_id}: {str(e)}"
 
 @mcp.resource("flights://searches")
@@ -288,24 +286,15 @@ def get_flight_searches() -> str:
     """
     searches = []
     
-    if os.path.exists(FLIGHTS_DIR):
-        for filename in os.listdir(FLIGHTS_DIR):
-            if filename.endswith('.json'):
-                search_id = filename[:-5]  # Remove .json extension
-                file_path = os.path.join(FLIGHTS_DIR, filename)
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        metadata = data.get('search_metadata', {})
-                        searches.append({
-                            'search_id': search_id,
-                            'route': f"{metadata.get('departure', 'N/A')} → {metadata.get('arrival', 'N/A')}",
-                            'dates': f"{metadata.get('outbound_date', 'N/A')} - {metadata.get('return_date', 'One way')}",
-                            'passengers': metadata.get('passengers', {}),
-                            'search_time': metadata.get('search_timestamp', 'N/A')
-                        })
-                except (json.JSONDecodeError, KeyError):
-                    continue
+    for stored in _result_store().list_searches():
+        metadata = stored['metadata']
+        searches.append({
+            'search_id': stored['search_id'],
+            'route': f"{metadata.get('departure', 'N/A')} → {metadata.get('arrival', 'N/A')}",
+            'dates': f"{metadata.get('outbound_date', 'N/A')} - {metadata.get('return_date', 'One way')}",
+            'passengers': metadata.get('passengers', {}),
+            'search_time': metadata.get('search_timestamp', 'N/A')
+        })
     
     content = "# Flight Searches\n\n"
     if searches:
@@ -338,14 +327,10 @@ def get_flight_search_details(search_id: str) -> str:
     Args:
         search_id: The flight search ID to retrieve details for
     """
-    file_path = os.path.join(FLIGHTS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"# Flight Search Not Found: {search_id}\n\nNo flight search found with this ID."
-    
     try:
-        with open(file_path, 'r') as f:
-            flight_data = json.load(f)
+        flight_data = _result_store().load(search_id)
+        if flight_data is None:
+            return f"# Flight Search Not Found: {search_id}\n\nNo flight search found with this ID."
         
         metadata = flight_data.get('search_metadata', {})
         best_flights = flight_data.get('best_flights', [])
@@ -407,7 +392,7 @@ def get_flight_search_details(search_id: str) -> str:
         
         return content
         
-    except json.JSONDecodeError:
+    except ValueError:
         return f"# Error\n\nCorrupted flight data for search ID: {search_id}"
 
 @mcp.prompt()
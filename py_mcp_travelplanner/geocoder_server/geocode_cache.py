@@ -0,0 +1,253 @@
+"""Persistent cache for Nominatim geocoding results.
+
+Every Nominatim miss costs at least one second because of the usage-policy
+rate limit, while trip planners geocode the same handful of places over and
+over. This module keeps results in a small SQLite database so they survive
+restarts:
+
+- forward lookups are keyed on the normalized query text (case-folded,
+  whitespace collapsed) plus the options that change the answer (result
+  count, language, address details, country filter)
+- reverse lookups are keyed on the lat/lon rounded to a grid cell
+  (``GEOCODE_CACHE_REVERSE_DECIMALS`` decimals, ~11 m at 4) plus zoom,
+  language and result count
+
+Entries expire after ``GEOCODE_CACHE_TTL`` seconds ("not found" answers after
+``GEOCODE_CACHE_NEGATIVE_TTL``) and the least recently used entries are
+evicted once ``GEOCODE_CACHE_MAX_ENTRIES`` is exceeded. Hit/miss counters
+are available via ``stats()``.
+
+Example Usage:
+    from py_mcp_travelplanner.geocoder_server.geocode_cache import (
+        forward_key, get_geocode_cache,
+    )
+
+    cache = get_geocode_cache("./outputs/geocode_cache.sqlite3")
+    key = forward_key("Paris, France", exactly_one=True, language="en")
+    value = cache.get(key)
+    if value is None:
+        value = {"query": "Paris, France", "locations": lookup("Paris, France")}
+        cache.put(key, value)
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from py_mcp_travelplanner.config import get_config
+
+LOG = logging.getLogger("py_mcp_travelplanner.geocode_cache")
+
+DEFAULT_TTL = 30 * 24 * 3600.0
+DEFAULT_NEGATIVE_TTL = 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_REVERSE_DECIMALS = 4
+
+FORWARD = "forward"
+REVERSE = "reverse"
+
+
+def normalize_query(text: str) -> str:
+    """Case-fold a free-form location query and collapse its whitespace."""
+    return " ".join(str(text).casefold().split())
+
+
+def forward_key(query: str, exactly_one: bool = True, language: str = "en",
+                addressdetails: bool = True, country_codes: Optional[str] = None) -> str:
+    """Return the cache key for a forward geocoding request."""
+    countries = ",".join(sorted(
+        code.strip().lower() for code in (country_codes or "").split(",") if code.strip()
+    ))
+    options = json.dumps([bool(exactly_one), language.lower(), bool(addressdetails), countries])
+    return f"{FORWARD}:{normalize_query(query)}:{options}"
+
+
+def grid_cell(latitude: float, longitude: float, decimals: int = DEFAULT_REVERSE_DECIMALS) -> str:
+    """Return the rounded lat/lon grid cell a coordinate falls into."""
+    return f"{round(float(latitude), decimals):.{decimals}f},{round(float(longitude), decimals):.{decimals}f}"
+
+
+def reverse_key(latitude: float, longitude: float, zoom: int = 18, language: str = "en",
+                exactly_one: bool = True, decimals: int = DEFAULT_REVERSE_DECIMALS) -> str:
+    """Return the cache key for a reverse geocoding request."""
+    cell = grid_cell(latitude, longitude, decimals)
+    return f"{REVERSE}:{cell}:{int(zoom)}:{language.lower()}:{int(bool(exactly_one))}"
+
+
+class GeocodeCache:
+    """SQLite-backed TTL + LRU cache of geocoding results.
+
+    Values are JSON-serializable dicts. A value is "negative" (cached with
+    the shorter TTL) when it records that the lookup found nothing.
+    """
+
+    def __init__(self, path: str | pathlib.Path,
+                 ttl: float = DEFAULT_TTL,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 reverse_decimals: int = DEFAULT_REVERSE_DECIMALS,
+                 clock: Callable[[], float] = time.time):
+        self.path = pathlib.Path(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.reverse_decimals = reverse_decimals
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counters = {kind: {"hits": 0, "misses": 0} for kind in (FORWARD, REVERSE)}
+        self.evictions = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode ("
+                " key TEXT PRIMARY KEY,"
+                " kind TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS geocode_accessed_at ON geocode (accessed_at)")
+            self._entries = self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for a key, or None if missing or expired."""
+        kind = key.split(":", 1)[0]
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM geocode WHERE key = ?", (key,)
+            ).fetchone()
+            counters = self._counters.setdefault(kind, {"hits": 0, "misses": 0})
+            if row is None or row[1] <= now:
+                counters["misses"] += 1
+                return None
+            counters["hits"] += 1
+            with self._conn:
+                self._conn.execute("UPDATE geocode SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Dict[str, Any], negative: bool = False) -> None:
+        """Store a value (with the negative TTL for "not found" answers)."""
+        now = self._clock()
+        ttl = self.negative_ttl if negative else self.ttl
+        with self._lock, self._conn:
+            exists = self._conn.execute("SELECT 1 FROM geocode WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode"
+                " (key, kind, value, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    key.split(":", 1)[0],
+                    json.dumps(value, separators=(',', ':')),
+                    now + ttl,
+                    now,
+                ),
+            )
+            if exists is None:
+                self._entries += 1
+            if self._entries > self.max_entries:
+                self._evict(now)
+
+    def entries(self, kind: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return ``(key, value)`` for every unexpired entry, optionally of one kind."""
+        sql = "SELECT key, value FROM geocode WHERE expires_at > ?"
+        params: List[Any] = [self._clock()]
+        if kind is not None:
+            sql += " AND kind = ?"
+            params.append(kind)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(key, json.loads(value)) for key, value in rows]
+
+    def _evict(self, now: float) -> None:
+        # Caller holds the lock inside a transaction
+        expired = self._conn.execute("DELETE FROM geocode WHERE expires_at <= ?", (now,)).rowcount
+        self._entries -= expired
+        excess = self._entries - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM geocode WHERE key IN"
+                " (SELECT key FROM geocode ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+            self._entries -= excess
+        self.evictions += expired + max(excess, 0)
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM geocode")
+            self._entries = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "entries": self._entries,
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+            }
+            for kind, counters in self._counters.items():
+                lookups = counters["hits"] + counters["misses"]
+                stats[kind] = {
+                    **counters,
+                    "hit_rate": round(counters["hits"] / lookups, 3) if lookups else None,
+                }
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Global geocode cache instances, keyed on database path
+_geocode_caches: Dict[str, GeocodeCache] = {}
+_geocode_caches_lock = threading.Lock()
+
+
+def get_geocode_cache(default_path: str | pathlib.Path) -> Optional[GeocodeCache]:
+    """Return the process-wide geocode cache.
+
+    Args:
+        default_path: Database file used unless ``GEOCODE_CACHE_PATH`` is set
+
+    Returns None when caching is disabled via ``GEOCODE_CACHE_ENABLED``.
+    """
+    config = get_config()
+    if not config.get('GEOCODE_CACHE_ENABLED', True):
+        return None
+
+    path = os.path.abspath(config.get('GEOCODE_CACHE_PATH') or default_path)
+    cache = _geocode_caches.get(path)
+    if cache is None:
+        with _geocode_caches_lock:
+            cache = _geocode_caches.get(path)
+            if cache is None:
+                cache = GeocodeCache(
+                    path,
+                    ttl=float(config.get('GEOCODE_CACHE_TTL', DEFAULT_TTL)),
+                    negative_ttl=float(config.get('GEOCODE_CACHE_NEGATIVE_TTL', DEFAULT_NEGATIVE_TTL)),
+                    max_entries=int(config.get('GEOCODE_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)),
+                    reverse_decimals=int(config.get('GEOCODE_CACHE_REVERSE_DECIMALS', DEFAULT_REVERSE_DECIMALS)),
+                )
+                _geocode_caches[path] = cache
+    return cache
+
+
+def reset_geocode_caches() -> None:
+    """Close and discard the global geocode cache instances.
+
+    This is primarily useful for testing.
+    """
+    with _geocode_caches_lock:
+        for cache in _geocode_caches.values():
+            cache.close()
+        _geocode_caches.clear()
@@ -1,26 +1,254 @@
 import json
+import logging
 import os
-import uuid
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from datetime import datetime
 from geopy.geocoders import Nominatim
-from geopy.extra.rate_limiter import RateLimiter
 from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
 from mcp.server.fastmcp import FastMCP
+from py_mcp_travelplanner.config import get_config
+from py_mcp_travelplanner.rate_limit import get_rate_limiter, rate_limiter_stats, reset_rate_limiters
+from py_mcp_travelplanner.geocoder_server.geocode_cache import (
+    GeocodeCache,
+    forward_key,
+    get_geocode_cache,
+    normalize_query,
+    reverse_key,
+)
+from py_mcp_travelplanner.geocoder_server.spatial_index import SpatialIndex
+from py_mcp_travelplanner.geocoder_server.text_index import TextIndex
+
+LOG = logging.getLogger("py_mcp_travelplanner.geocoder_server")
 
 # Directory to store geocoded location data
 GEOCODE_DIR = "./outputs/geocoded_locations"
 
+# Nominatim's usage policy requires an identifying user agent
+DEFAULT_USER_AGENT = "py_mcp_travelplanner-geocoder"
+
 # Initialize FastMCP server
 mcp = FastMCP("geocoder")
 
+def _geocode_cache() -> Optional[GeocodeCache]:
+    """Return the persistent geocode cache (next to GEOCODE_DIR by default)."""
+    return get_geocode_cache(os.path.join(os.path.dirname(os.path.abspath(GEOCODE_DIR)), "geocode_cache.sqlite3"))
+
+def _location_data(loc) -> Dict[str, Any]:
+    """Convert a geopy Location into the stored location record."""
+    return {
+        "latitude": float(loc.latitude),
+        "longitude": float(loc.longitude),
+        "display_name": loc.address,
+        "raw_data": loc.raw
+    }
+
+def _query_nominatim(location: str, exactly_one: bool, timeout: int, language: str,
+                     addressdetails: bool, country_codes: Optional[str]) -> List[Dict[str, Any]]:
+    """Geocode one query through the shared, rate-limited Nominatim client."""
+    geocode, _ = get_geolocator()
+    
+    # Build geocoding parameters
+    params = {
+        'exactly_one': exactly_one,
+        'timeout': timeout,
+        'language': language,
+        'addressdetails': addressdetails
+    }
+    
+    if country_codes:
+        params['country_codes'] = country_codes
+    
+    # Perform geocoding
+    result = geocode(location, **params)
+    
+    if not result:
+        return []
+    if isinstance(result, list):
+        return [_location_data(loc) for loc in result]
+    return [_location_data(result)]
+
+def _record_forward(cache: Optional[GeocodeCache], cache_key: str, location: str,
+                    locations_data: List[Dict[str, Any]]) -> None:
+    """Record a forward lookup result in the geocode cache and location indexes."""
+    _location_indexes().add_forward(location, locations_data)
+    if cache is not None:
+        cache.put(
+            cache_key,
+            {"query": location, "locations": locations_data},
+            negative=not locations_data
+        )
+
+def _forward_response(location: str, locations_data: List[Dict[str, Any]],
+                      exactly_one: bool, cached: bool) -> Dict[str, Any]:
+    """Build the geocode_location response for a resolved query."""
+    if not locations_data:
+        return {
+            "success": False,
+            "error": f"No coordinates found for location: {location}",
+            "query": location,
+            "cached": cached
+        }
+    
+    # Handle multiple results
+    if not exactly_one:
+        return {
+            "success": True,
+            "query": location,
+            "multiple_results": True,
+            "count": len(locations_data),
+            "locations": locations_data,
+            "timestamp": datetime.now().isoformat(),
+            "cached": cached
+        }
+    
+    # Single result
+    return {
+        "success": True,
+        "query": location,
+        "multiple_results": False,
+        "location_data": locations_data[0],
+        "timestamp": datetime.now().isoformat(),
+        "cached": cached
+    }
+
+class _LocationIndexes:
+    """Spatial and full-text indexes over every geocoded location."""
+    
+    def __init__(self):
+        self.spatial = SpatialIndex()
+        self.text = TextIndex(field_weights={"query": 2.0, "name": 1.0})
+    
+    def add_forward(self, query: str, locations_data: List[Dict[str, Any]]) -> None:
+        for loc in locations_data:
+            latitude, longitude = float(loc["latitude"]), float(loc["longitude"])
+            self.spatial.add(
+                f"place:{latitude:.6f},{longitude:.6f}:{loc.get('display_name')}",
+                latitude,
+                longitude,
+                {"kind": "place", "name": loc.get("display_name"), "query": query,
+                 "latitude": latitude, "longitude": longitude}
+            )
+        if locations_data:
+            self.text.add(
+                f"query:{normalize_query(query)}:{locations_data[0].get('display_name')}",
+                {"query": query, "name": " ".join(loc.get("display_name") or "" for loc in locations_data)},
+                _forward_response(query, locations_data, len(locations_data) == 1, True)
+            )
+    
+    def add_reverse(self, latitude: float, longitude: float, address: str,
+                    cache_key: Optional[str] = None) -> None:
+        latitude, longitude = float(latitude), float(longitude)
+        key = cache_key or f"address:{latitude:.6f},{longitude:.6f}"
+        self.spatial.add(
+            key,
+            latitude,
+            longitude,
+            {
+                "kind": "address",
+                "name": address,
+                "latitude": latitude,
+                "longitude": longitude,
+                # zoom:language:exactly_one, the part of the key a proximity hit must match
+                "options": cache_key.split(":", 2)[2] if cache_key else None
+            }
+        )
+        self.text.add(key, {"name": address}, {
+            "success": True,
+            "coordinates": {"latitude": latitude, "longitude": longitude},
+            "address": address,
+            "cached": True
+        })
+    
+    def load(self) -> None:
+        """Index the locations held in the geocode cache and in saved result files."""
+        cache = _geocode_cache()
+        if cache is not None:
+            for key, value in cache.entries():
+                if "locations" in value:
+                    self.add_forward(value.get("query", ""), value["locations"])
+                elif value.get("found"):
+                    latitude, longitude = key.split(":")[1].split(",")
+                    self.add_reverse(float(latitude), float(longitude), value["found"]["address"], key)
+        
+        if not os.path.exists(GEOCODE_DIR):
+            return
+        for filename in os.listdir(GEOCODE_DIR):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(GEOCODE_DIR, filename), 'r') as f:
+                    data = json.load(f)
+                for item in data.get('results') or [data]:
+                    if not item.get('success'):
+                        continue
+                    if item.get('address') and item.get('coordinates'):
+                        coordinates = item['coordinates']
+                        self.add_reverse(coordinates['latitude'], coordinates['longitude'], item['address'])
+                    else:
+                        self.add_forward(item.get('query', ''), item.get('locations') or [item['location_data']])
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError, OSError):
+                continue
+
+# Location indexes, loaded from the cache and GEOCODE_DIR on first use
+_LOCATION_INDEXES: Optional[_LocationIndexes] = None
+_LOCATION_INDEXES_SOURCE: Optional[str] = None
+_LOCATION_INDEXES_LOCK = threading.Lock()
+
+def _location_indexes() -> _LocationIndexes:
+    """Return the location indexes for the current GEOCODE_DIR, loading them on first use."""
+    global _LOCATION_INDEXES, _LOCATION_INDEXES_SOURCE
+    
+    source = os.path.abspath(GEOCODE_DIR)
+    if _LOCATION_INDEXES is None or _LOCATION_INDEXES_SOURCE != source:
+        with _LOCATION_INDEXES_LOCK:
+            if _LOCATION_INDEXES is None or _LOCATION_INDEXES_SOURCE != source:
+                indexes = _LocationIndexes()
+                indexes.load()
+                _LOCATION_INDEXES, _LOCATION_INDEXES_SOURCE = indexes, source
+    return _LOCATION_INDEXES
+
+def reset_location_indexes() -> None:
+    """Discard the in-memory location indexes; they are rebuilt on next use.
+    
+    This is primarily useful for testing.
+    """
+    global _LOCATION_INDEXES, _LOCATION_INDEXES_SOURCE
+    with _LOCATION_INDEXES_LOCK:
+        _LOCATION_INDEXES, _LOCATION_INDEXES_SOURCE = None, None
+
+# Process-wide (geocode, reverse) callables sharing one Nominatim client
+_GEOLOCATOR: Optional[Tuple[Callable[..., Any], Callable[..., Any]]] = None
+_GEOLOCATOR_LOCK = threading.Lock()
+
 def get_geolocator():
-    """Initialize and return a geolocator with rate limiting."""
-    # Generate a unique email identifier using UUID
-    email_identifier = f"{uuid.uuid4()}.com"
-    geolocator = Nominatim(user_agent=email_identifier)
-    # Rate limiter automatically handles the 1-second delay
-    return RateLimiter(geolocator.geocode, min_delay_seconds=1), RateLimiter(geolocator.reverse, min_delay_seconds=1)
+    """Return the shared, rate-limited Nominatim geocode and reverse functions.
+    
+    One Nominatim client (and HTTP adapter) is reused for the process and both
+    functions draw from the same token bucket, so Nominatim's one request per
+    second policy holds across concurrent calls; excess callers queue in order.
+    """
+    global _GEOLOCATOR
+    
+    if _GEOLOCATOR is None:
+        with _GEOLOCATOR_LOCK:
+            if _GEOLOCATOR is None:
+                config = get_config()
+                geolocator = Nominatim(user_agent=config.get('NOMINATIM_USER_AGENT') or DEFAULT_USER_AGENT)
+                min_delay = float(config.get('NOMINATIM_MIN_DELAY_SECONDS', 1.0))
+                limiter = get_rate_limiter("nominatim", rate=1.0 / min_delay)
+                _GEOLOCATOR = (limiter.wrap(geolocator.geocode), limiter.wrap(geolocator.reverse))
+    return _GEOLOCATOR
+
+def reset_geolocator() -> None:
+    """Discard the shared geolocator (e.g. after changing NOMINATIM_* settings).
+    
+    This is primarily useful for testing.
+    """
+    global _GEOLOCATOR
+    _GEOLOCATOR = None
+    reset_rate_limiters("nominatim")
 
 @mcp.tool()
 def geocode_location(
@@ -47,64 +275,20 @@ def geocode_location(
     """
     
     try:
-        geocode, _ = get_geolocator()
-        
-        # Build geocoding parameters
-        params = {
-            'exactly_one': exactly_one,
-            'timeout': timeout,
-            'language': language,
-            'addressdetails': addressdetails
-        }
+        cache = _geocode_cache()
+        cache_key = forward_key(location, exactly_one, language, addressdetails, country_codes)
+        cached = cache.get(cache_key) if cache is not None else None
         
-        if country_codes:
-            params['country_codes'] = country_codes
-        
-        # Perform geocoding
-        result = geocode(location, **params)
-        
-        if not result:
-            return {
-                "success": False,
-                "error": f"No coordinates found for location: {location}",
-                "query": location
-            }
-        
-        # Handle multiple results
-        if not exactly_one and isinstance(result, list):
-            locations_data = []
-            for loc in result:
-                locations_data.append({
-                    "latitude": float(loc.latitude),
-                    "longitude": float(loc.longitude),
-                    "display_name": loc.address,
-                    "raw_data": loc.raw
-                })
-            
-            response = {
-                "success": True,
-                "query": location,
-                "multiple_results": True,
-                "count": len(locations_data),
-                "locations": locations_data,
-                "timestamp": datetime.now().isoformat()
-            }
+        if cached is not None:
+            locations_data = cached["locations"]
         else:
-            # Single result
-            location_data = {
-                "latitude": float(result.latitude),
-                "longitude": float(result.longitude),
-                "display_name": result.address,
-                "raw_data": result.raw
-            }
-            
-            response = {
-                "success": True,
-                "query": location,
-                "multiple_results": False,
-                "location_data": location_data,
-                "timestamp": datetime.now().isoformat()
-            }
+            locations_data = _query_nominatim(location, exactly_one, timeout, language,
+                                              addressdetails, country_codes)
+            _record_forward(cache, cache_key, location, locations_data)
+        
+        response = _forward_response(location, locations_data, exactly_one, cached is not None)
+        if not response["success"]:
+            return response
         
         # Save to file for resource access
         location_id = f"{location.replace(' ', '_').replace(',', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -132,6 +316,27 @@ def geocode_location(
             "query": location
         }
 
+def _nearby_reverse(cache: GeocodeCache, cache_key: str,
+                    latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+    """Look up a cached reverse result for the nearest indexed point in range.
+    
+    Falls back to the exact grid-cell key when no indexed point lies within
+    GEOCODE_REVERSE_PROXIMITY_METERS (or the proximity lookup is disabled).
+    """
+    radius_m = float(get_config().get('GEOCODE_REVERSE_PROXIMITY_METERS', 25.0))
+    if radius_m > 0:
+        options = cache_key.split(":", 2)[2]
+        nearby = _location_indexes().spatial.within(
+            latitude, longitude, radius_m / 1000.0,
+            where=lambda data: data.get("options") == options,
+            limit=3
+        )
+        for _, key, _ in nearby:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+    return cache.get(cache_key)
+
 @mcp.tool()
 def reverse_geocode(
     latitude: float,
@@ -157,30 +362,50 @@ def reverse_geocode(
     """
     
     try:
-        _, reverse_geocode_func = get_geolocator()
-        
-        # Perform reverse geocoding
-        result = reverse_geocode_func(
-            (latitude, longitude),
-            exactly_one=exactly_one,
-            timeout=timeout,
-            language=language,
-            zoom=zoom
-        )
+        cache = _geocode_cache()
+        cache_key = None
+        cached = None
+        if cache is not None:
+            cache_key = reverse_key(latitude, longitude, zoom, language, exactly_one, cache.reverse_decimals)
+            cached = _nearby_reverse(cache, cache_key, latitude, longitude)
+        
+        if cached is not None:
+            found = cached["found"]
+        else:
+            _, reverse_geocode_func = get_geolocator()
+            
+            # Perform reverse geocoding
+            result = reverse_geocode_func(
+                (latitude, longitude),
+                exactly_one=exactly_one,
+                timeout=timeout,
+                language=language,
+                zoom=zoom
+            )
+            if isinstance(result, list):
+                result = result[0] if result else None
+            
+            found = {"address": result.address, "raw_data": result.raw} if result else None
+            if cache is not None:
+                cache.put(cache_key, {"found": found}, negative=found is None)
+            if found:
+                _location_indexes().add_reverse(latitude, longitude, found["address"], cache_key)
         
-        if not result:
+        if not found:
             return {
                 "success": False,
                 "error": f"No address found for coordinates: {latitude}, {longitude}",
-                "coordinates": {"latitude": latitude, "longitude": longitude}
+                "coordinates": {"latitude": latitude, "longitude": longitude},
+                "cached": cached is not None
             }
         
         response = {
             "success": True,
             "coordinates": {"latitude": latitude, "longitude": longitude},
-            "address": result.address,
-            "raw_data": result.raw,
-            "timestamp": datetime.now().isoformat()
+            "address": found["address"],
+            "raw_data": found["raw_data"],
+            "timestamp": datetime.now().isoformat(),
+            "cached": cached is not None
         }
         
         # Save to file
@@ -202,34 +427,113 @@ def reverse_geocode(
         }
 
 @mcp.tool()
-def batch_geocode(locations: List[str]) -> Dict[str, Any]:
+def batch_geocode(
+    locations: List[str],
+    language: str = "en",
+    country_codes: Optional[str] = None,
+    timeout: int = 10
+) -> Dict[str, Any]:
     """
     Geocode multiple locations in a single request.
     
+    Inputs are normalized (case and spacing) and deduplicated, cached locations
+    are answered immediately, and only the remaining misses are sent to
+    Nominatim through the shared rate limiter. The batch is saved as one file.
+    
     Args:
         locations: List of location names to geocode
+        language: Language for the results (default: "en")
+        country_codes: Limit search to specific countries (e.g., "us,ca")
+        timeout: Timeout in seconds for each geocoding request
         
     Returns:
-        Dict containing results for all locations
+        Dict containing results for all locations (in input order, each with
+        its source and lookup time) plus batch counters and timing
     """
+    started = time.perf_counter()
+    batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    cache = _geocode_cache()
+    
+    # Normalize and dedupe, keeping the first spelling of each query
+    unique: Dict[str, str] = {}
+    for location in locations:
+        if normalize_query(location):
+            unique.setdefault(forward_key(location, True, language, True, country_codes), location)
+    
+    # Serve cache hits immediately
+    resolved: Dict[str, Dict[str, Any]] = {}
+    misses: List[Tuple[str, str]] = []
+    for cache_key, location in unique.items():
+        lookup_started = time.perf_counter()
+        cached = cache.get(cache_key) if cache is not None else None
+        if cached is not None:
+            resolved[cache_key] = {
+                "locations": cached["locations"],
+                "source": "cache",
+                "elapsed_ms": round((time.perf_counter() - lookup_started) * 1000, 2)
+            }
+        else:
+            misses.append((cache_key, location))
+    cache_ms = (time.perf_counter() - started) * 1000
+    
+    # Stream the misses through the shared Nominatim rate limiter
+    for done, (cache_key, location) in enumerate(misses, 1):
+        lookup_started = time.perf_counter()
+        entry: Dict[str, Any] = {"source": "nominatim"}
+        try:
+            entry["locations"] = _query_nominatim(location, True, timeout, language, True, country_codes)
+            _record_forward(cache, cache_key, location, entry["locations"])
+        except (GeocoderTimedOut, GeocoderUnavailable) as e:
+            entry["error"] = f"Geocoding service error: {str(e)}"
+        except Exception as e:
+            entry["error"] = f"Unexpected error: {str(e)}"
+        entry["elapsed_ms"] = round((time.perf_counter() - lookup_started) * 1000, 2)
+        resolved[cache_key] = entry
+        LOG.info("%s: geocoded %d/%d uncached locations (%s, %.0f ms)",
+                 batch_id, done, len(misses), location, entry["elapsed_ms"])
     
     results = {
-        "batch_id": f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+        "batch_id": batch_id,
         "total_locations": len(locations),
+        "unique_locations": len(unique),
+        "cache_hits": len(unique) - len(misses),
+        "geocoded": len(misses),
         "successful": 0,
         "failed": 0,
         "results": []
     }
     
-    for location in locations:
-        result = geocode_location(location)
-        results["results"].append(result)
+    seen = set()
+    for index, location in enumerate(locations):
+        if not normalize_query(location):
+            item = {"success": False, "error": "Empty location", "query": location, "cached": False,
+                    "source": None, "elapsed_ms": 0.0}
+        else:
+            cache_key = forward_key(location, True, language, True, country_codes)
+            entry = resolved[cache_key]
+            if "error" in entry:
+                item = {"success": False, "error": entry["error"], "query": location}
+            else:
+                item = _forward_response(location, entry["locations"], True, entry["source"] == "cache")
+            if cache_key in seen:
+                item.update(source="duplicate", elapsed_ms=0.0)
+            else:
+                seen.add(cache_key)
+                item.update(source=entry["source"], elapsed_ms=entry["elapsed_ms"])
+        item["index"] = index
+        results["results"].append(item)
         
-        if result.get("success"):
+        if item.get("success"):
             results["successful"] += 1
         else:
             results["failed"] += 1
     
+    results["timing"] = {
+        "total_ms": round((time.perf_counter() - started) * 1000, 2),
+        "cache_ms": round(cache_ms, 2),
+        "geocode_ms": round(sum(resolved[key]["elapsed_ms"] for key, _ in misses), 2)
+    }
+    
     # Save batch results
     os.makedirs(GEOCODE_DIR, exist_ok=True)
     file_path = os.path.join(GEOCODE_DIR, f"{results['batch_id']}.json")
@@ -290,11 +594,133 @@ def calculate_distance(
             "error": f"Distance calculation error: {str(e)}"
         }
 
+def _as_point(point: Any) -> Tuple[float, float]:
+    """Accept [lat, lon] pairs or {"latitude", "longitude"} dicts."""
+    if isinstance(point, dict):
+        return float(point["latitude"]), float(point["longitude"])
+    latitude, longitude = point
+    return float(latitude), float(longitude)
+
+@mcp.tool()
+def distance_matrix(
+    origins: List[Any],
+    destinations: Optional[List[Any]] = None,
+    unit: str = "km",
+    method: str = "haversine"
+) -> Dict[str, Any]:
+    """
+    Calculate the distances between many points in one call.
+    
+    Args:
+        origins: Points as [latitude, longitude] pairs or {"latitude", "longitude"} dicts
+        destinations: Points to measure to; defaults to origins (an N x N matrix)
+        unit: Unit for distances ("km", "miles", "nm" for nautical miles)
+        method: "haversine" (fast, spherical, within ~0.6%) or "geodesic" (exact, slower)
+        
+    Returns:
+        Dict containing the distance matrix (matrix[i][j] = origin i to destination j)
+    """
+    
+    try:
+        from py_mcp_travelplanner.geocoder_server.distance import geodesic_matrix, haversine_matrix
+        
+        if method not in ("haversine", "geodesic"):
+            raise ValueError(f"Unknown method {method!r}; expected 'haversine' or 'geodesic'")
+        
+        origin_points = [_as_point(p) for p in origins]
+        destination_points = None if destinations is None else [_as_point(p) for p in destinations]
+        compute = haversine_matrix if method == "haversine" else geodesic_matrix
+        matrix = compute(origin_points, destination_points, unit=unit.lower())
+        
+        return {
+            "success": True,
+            "unit": unit,
+            "calculation_method": method,
+            "origins": [{"latitude": lat, "longitude": lon} for lat, lon in origin_points],
+            "destinations": None if destination_points is None else [
+                {"latitude": lat, "longitude": lon} for lat, lon in destination_points
+            ],
+            "matrix": matrix.round(2).tolist()
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Distance calculation error: {str(e)}"
+        }
+
+def _spatial_matches(matches: List[Tuple[float, str, Dict[str, Any]]],
+                     started: float) -> Dict[str, Any]:
+    results = []
+    for distance, _, data in matches:
+        result = {
+            "name": data["name"],
+            "kind": data["kind"],
+            "latitude": data["latitude"],
+            "longitude": data["longitude"],
+            "distance_km": round(distance, 3)
+        }
+        if data.get("query"):
+            result["query"] = data["query"]
+        results.append(result)
+    return {
+        "success": True,
+        "count": len(results),
+        "results": results,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+    }
+
+@mcp.tool()
+def nearest_locations(latitude: float, longitude: float, k: int = 5) -> Dict[str, Any]:
+    """
+    Find the previously geocoded locations closest to a coordinate.
+    
+    Args:
+        latitude: Latitude of the reference point
+        longitude: Longitude of the reference point
+        k: Number of locations to return
+        
+    Returns:
+        Dict containing the nearest locations, closest first, with distances in km
+    """
+    started = time.perf_counter()
+    matches = _location_indexes().spatial.nearest(latitude, longitude, k)
+    return {"query": {"latitude": latitude, "longitude": longitude, "k": k},
+            **_spatial_matches(matches, started)}
+
+@mcp.tool()
+def locations_within(
+    latitude: float,
+    longitude: float,
+    radius: float = 10.0,
+    max_results: int = 50
+) -> Dict[str, Any]:
+    """
+    Find the previously geocoded locations within a radius of a coordinate.
+    
+    Args:
+        latitude: Latitude of the center point
+        longitude: Longitude of the center point
+        radius: Search radius in km
+        max_results: Maximum number of locations to return
+        
+    Returns:
+        Dict containing the matching locations, closest first, with distances in km
+    """
+    started = time.perf_counter()
+    matches = _location_indexes().spatial.within(latitude, longitude, radius, limit=max_results)
+    return {"query": {"latitude": latitude, "longitude": longitude, "radius_km": radius},
+            **_spatial_matches(matches, started)}
+
 @mcp.tool()
 def search_locations(query: str, max_results: int = 10) -> str:
     """
     Search through previously geocoded locations.
     
+    Matches every word of the query against the original queries and the
+    display names/addresses of saved results; words also match as prefixes
+    (e.g. "par fra" finds "Paris, France"). Results are ranked best first.
+    
     Args:
         query: Search term to find in saved locations
         max_results: Maximum number of results to return
@@ -303,42 +729,33 @@ def search_locations(query: str, max_results: int = 10) -> str:
         JSON string with matching locations
     """
     
-    if not os.path.exists(GEOCODE_DIR):
+    index = _location_indexes().text
+    if not len(index):
         return json.dumps({"message": "No geocoded locations found."})
     
-    matches = []
-    
-    for filename in os.listdir(GEOCODE_DIR):
-        if filename.endswith('.json'):
-            file_path = os.path.join(GEOCODE_DIR, filename)
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    
-                # Search in query and display_name
-                if query.lower() in data.get('query', '').lower():
-                    matches.append(data)
-                    continue
-                    
-                # Search in location data
-                if data.get('location_data'):
-                    if query.lower() in data['location_data'].get('display_name', '').lower():
-                        matches.append(data)
-                elif data.get('locations'):  # Multiple results
-                    for loc in data['locations']:
-                        if query.lower() in loc.get('display_name', '').lower():
-                            matches.append(data)
-                            break
-                            
-            except (json.JSONDecodeError, KeyError):
-                continue
+    matches = index.search(query, limit=max_results)
     
     return json.dumps({
         "query": query,
         "matches_found": len(matches),
-        "results": matches[:max_results]
+        "results": [dict(data, score=round(score, 3)) for score, _, data in matches]
     }, indent=2)
 
+@mcp.tool()
+def get_geocode_cache_stats() -> Dict[str, Any]:
+    """
+    Report geocode cache usage: entry count, evictions and forward/reverse hit rates,
+    plus how many Nominatim requests went through the shared rate limiter.
+    
+    Returns:
+        Dict containing cache statistics
+    """
+    limiter = rate_limiter_stats().get("nominatim")
+    cache = _geocode_cache()
+    if cache is None:
+        return {"enabled": False, "rate_limiter": limiter}
+    return {"enabled": True, **cache.stats(), "rate_limiter": limiter}
+
 @mcp.resource("geocoder://locations")
 def get_geocoded_locations() -> str:
     """
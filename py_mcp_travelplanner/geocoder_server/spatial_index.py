@@ -0,0 +1,162 @@
+"""In-memory spatial index over geocoded points.
+
+Points are bucketed into a fixed lat/lon grid (``cell_degrees`` per cell,
+0.1° ≈ 11 km by default). A radius query only visits the cells overlapping
+the search circle's bounding box (widened by 1/cos(latitude) and wrapped at
+the antimeridian). A k-nearest query grows a square of cells around the
+point until it holds k candidates, then runs a radius query at the k-th
+candidate's distance, so the answer is exact. The index is built
+incrementally with ``add()``; adding an existing key replaces its point.
+
+Example Usage:
+    from py_mcp_travelplanner.geocoder_server.spatial_index import SpatialIndex
+
+    index = SpatialIndex()
+    index.add("paris", 48.8566, 2.3522, {"name": "Paris"})
+    index.add("versailles", 48.8049, 2.1204, {"name": "Versailles"})
+
+    index.nearest(48.86, 2.34, k=1)        # [(0.99, "paris", {...})]
+    index.within(48.86, 2.34, radius_km=25)
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from py_mcp_travelplanner.geocoder_server.distance import EARTH_RADIUS_KM, haversine_km
+
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180.0
+
+Cell = Tuple[int, int]
+Match = Tuple[float, str, Dict[str, Any]]
+
+
+class SpatialIndex:
+    """Thread-safe grid index of keyed points with attached data dicts.
+
+    Args:
+        cell_degrees: Grid cell size in degrees
+    """
+
+    def __init__(self, cell_degrees: float = 0.1):
+        self.cell_degrees = cell_degrees
+        self._rows = int(math.ceil(180.0 / cell_degrees))
+        self._cols = int(math.ceil(360.0 / cell_degrees))
+        self._lock = threading.Lock()
+        self._cells: Dict[Cell, Dict[str, Tuple[float, float, Dict[str, Any]]]] = {}
+        self._points: Dict[str, Cell] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _cell(self, latitude: float, longitude: float) -> Cell:
+        row = min(int((latitude + 90.0) / self.cell_degrees), self._rows - 1)
+        col = int((longitude + 180.0) / self.cell_degrees) % self._cols
+        return row, col
+
+    def add(self, key: str, latitude: float, longitude: float, data: Dict[str, Any]) -> None:
+        """Insert or replace the point stored under ``key``."""
+        latitude, longitude = float(latitude), float(longitude)
+        if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+            raise ValueError(f"Invalid coordinates: {latitude}, {longitude}")
+        cell = self._cell(latitude, longitude)
+        with self._lock:
+            previous = self._points.get(key)
+            if previous is not None:
+                self._discard(key, previous)
+            self._cells.setdefault(cell, {})[key] = (latitude, longitude, data)
+            self._points[key] = cell
+
+    def remove(self, key: str) -> bool:
+        with self._lock:
+            cell = self._points.get(key)
+            if cell is None:
+                return False
+            self._discard(key, cell)
+            return True
+
+    def _discard(self, key: str, cell: Cell) -> None:
+        # Caller holds the lock
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+        del self._points[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cells.clear()
+            self._points.clear()
+
+    def _all(self) -> Iterable[Tuple[str, Tuple[float, float, Dict[str, Any]]]]:
+        for bucket in self._cells.values():
+            yield from bucket.items()
+
+    def _box(self, latitude: float, longitude: float, radius_km: float) -> Optional[List[Cell]]:
+        """Cells overlapping the circle's bounding box, or None if scanning everything is cheaper."""
+        dlat = radius_km / KM_PER_DEGREE
+        max_lat = min(90.0, abs(latitude) + dlat)
+        cos_lat = math.cos(math.radians(max_lat))
+        if max_lat >= 90.0 or cos_lat * 180.0 * KM_PER_DEGREE <= radius_km:
+            return None  # Circle reaches a pole or spans all longitudes
+        dlon = radius_km / (KM_PER_DEGREE * cos_lat)
+
+        row_lo, _ = self._cell(max(-90.0, latitude - dlat), longitude)
+        row_hi, _ = self._cell(min(90.0, latitude + dlat), longitude)
+        col_lo = math.floor((longitude - dlon + 180.0) / self.cell_degrees) % self._cols
+        cols = int(math.ceil(2 * dlon / self.cell_degrees)) + 1
+        if (row_hi - row_lo + 1) * cols > len(self._cells):
+            return None
+        return [(row, (col_lo + offset) % self._cols)
+                for row in range(row_lo, row_hi + 1) for offset in range(cols)]
+
+    def within(self, latitude: float, longitude: float, radius_km: float,
+               where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+               limit: Optional[int] = None) -> List[Match]:
+        """Return ``(distance_km, key, data)`` for points within ``radius_km``, nearest first."""
+        with self._lock:
+            cells = self._box(latitude, longitude, radius_km)
+            if cells is None:
+                candidates = list(self._all())
+            else:
+                candidates = [item for cell in cells for item in self._cells.get(cell, {}).items()]
+        matches = []
+        for key, (lat, lon, data) in candidates:
+            if where is not None and not where(data):
+                continue
+            distance = haversine_km(latitude, longitude, lat, lon)
+            if distance <= radius_km:
+                matches.append((distance, key, data))
+        if limit is not None:
+            return heapq.nsmallest(limit, matches, key=lambda m: m[0])
+        return sorted(matches, key=lambda m: m[0])
+
+    def nearest(self, latitude: float, longitude: float, k: int = 5,
+                where: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Match]:
+        """Return the ``k`` points closest to a coordinate, nearest first."""
+        if k <= 0:
+            return []
+        row, col = self._cell(latitude, longitude)
+        with self._lock:
+            occupied = len(self._cells)
+            candidates: List[Tuple[float, float, Dict[str, Any]]] = []
+            ring = 0
+            # Grow a square of cells until it holds k candidates or covers the index
+            while len(candidates) < k and (2 * ring - 1) ** 2 <= occupied:
+                for r in range(row - ring, row + ring + 1):
+                    if not 0 <= r < self._rows:
+                        continue
+                    for c in range(col - ring, col + ring + 1):
+                        if ring and r not in (row - ring, row + ring) and c not in (col - ring, col + ring):
+                            continue  # Interior cells were visited by earlier rings
+                        for point in self._cells.get((r, c % self._cols), {}).values():
+                            if where is None or where(point[2]):
+                                candidates.append(point)
+                ring += 1
+        if len(candidates) < k:
+            return self.within(latitude, longitude, 2 * math.pi * EARTH_RADIUS_KM, where, limit=k)
+        radius = heapq.nsmallest(k, (haversine_km(latitude, longitude, lat, lon)
+                                     for lat, lon, _ in candidates))[-1]
+        return self.within(latitude, longitude, radius, where, limit=k)
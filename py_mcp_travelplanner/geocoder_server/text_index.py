@@ -0,0 +1,145 @@
+"""In-memory inverted index for searching geocoded location names.
+
+Text is case-folded, stripped of accents and split into alphanumeric tokens.
+Each token maps to the documents containing it (a postings dict), and a
+sorted vocabulary list lets a query token match every token it is a prefix
+of with one bisect. A search only touches the postings of the matched
+tokens, so its cost does not grow with the number of indexed documents.
+
+Documents must match every query token. They are ranked by the sum over query
+tokens of ``field weight x idf``, with prefix-only matches counting half as
+much as whole-token matches; ties go to the most recently added document.
+
+Example Usage:
+    from py_mcp_travelplanner.geocoder_server.text_index import TextIndex
+
+    index = TextIndex(field_weights={"query": 2.0, "name": 1.0})
+    index.add("paris", {"query": "Paris", "name": "Paris, Île-de-France, France"}, {...})
+
+    index.search("par fra")   # [(score, "paris", {...})]
+"""
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+import math
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+_TOKEN = re.compile(r"\w+")
+
+# Score multiplier for a query token that is only a prefix of the indexed token
+PREFIX_WEIGHT = 0.5
+
+Match = Tuple[float, str, Dict[str, Any]]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into case-folded, accent-free word tokens."""
+    if not text:
+        return []
+    folded = unicodedata.normalize("NFKD", str(text).casefold())
+    stripped = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    return _TOKEN.findall(stripped)
+
+
+class TextIndex:
+    """Thread-safe inverted index with prefix matching and ranked results.
+
+    Args:
+        field_weights: Weight of a token occurrence per field name; fields
+            not listed weigh 1.0
+    """
+
+    def __init__(self, field_weights: Optional[Dict[str, float]] = None):
+        self.field_weights = dict(field_weights or {})
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._vocabulary: List[str] = []
+        self._documents: Dict[str, Tuple[int, Set[str], Dict[str, Any]]] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, key: str, fields: Dict[str, Optional[str]], data: Dict[str, Any]) -> None:
+        """Index (or re-index) a document's text fields; ``data`` is returned by ``search()``."""
+        weights: Dict[str, float] = {}
+        for field, text in fields.items():
+            weight = self.field_weights.get(field, 1.0)
+            for token in tokenize(text):
+                weights[token] = weights.get(token, 0.0) + weight
+        with self._lock:
+            if key in self._documents:
+                self._discard(key)
+            for token, weight in weights.items():
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = {}
+                    bisect.insort(self._vocabulary, token)
+                postings[key] = weight
+            self._documents[key] = (next(self._sequence), set(weights), data)
+
+    def remove(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._documents:
+                return False
+            self._discard(key)
+            return True
+
+    def _discard(self, key: str) -> None:
+        # Caller holds the lock
+        _, tokens, _ = self._documents.pop(key)
+        for token in tokens:
+            postings = self._postings[token]
+            del postings[key]
+            if not postings:
+                del self._postings[token]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._vocabulary.clear()
+            self._documents.clear()
+
+    def _matching_tokens(self, token: str, prefix: bool) -> List[str]:
+        if not prefix:
+            return [token] if token in self._postings else []
+        start = bisect.bisect_left(self._vocabulary, token)
+        end = bisect.bisect_left(self._vocabulary, token + "\U0010ffff", start)
+        return self._vocabulary[start:end]
+
+    def search(self, text: str, limit: int = 10, prefix: bool = True) -> List[Match]:
+        """Return ``(score, key, data)`` for documents matching every token of ``text``, best first."""
+        query_tokens = list(dict.fromkeys(tokenize(text)))
+        if not query_tokens or limit <= 0:
+            return []
+        with self._lock:
+            total = len(self._documents)
+            scores: Optional[Dict[str, float]] = None
+            for query_token in query_tokens:
+                token_scores: Dict[str, float] = {}
+                for token in self._matching_tokens(query_token, prefix):
+                    postings = self._postings[token]
+                    idf = math.log(1.0 + total / len(postings))
+                    factor = idf * (1.0 if token == query_token else PREFIX_WEIGHT)
+                    for key, weight in postings.items():
+                        if scores is not None and key not in scores:
+                            continue
+                        score = weight * factor
+                        if score > token_scores.get(key, 0.0):
+                            token_scores[key] = score
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {key: scores[key] + score for key, score in token_scores.items()}
+                if not scores:
+                    return []
+            documents = self._documents
+            best = heapq.nlargest(limit, scores.items(),
+                                  key=lambda item: (item[1], documents[item[0]][0]))
+            return [(score, key, documents[key][2]) for key, score in best]
@@ -1,9 +1,11 @@
-import requests
+import httpx
 import json
 import os
 from typing import List, Dict, Optional, Any, Union
 from datetime import datetime, timedelta
 from mcp.server.fastmcp import FastMCP
+from py_mcp_travelplanner.http_client import serpapi_get_async, serpapi_search_async
+from py_mcp_travelplanner.result_store import ResultStore, get_result_store
 
 # Directory to store hotel search results
 HOTELS_DIR = "./outputs/hotels"
@@ -11,6 +13,20 @@ HOTELS_DIR = "./outputs/hotels"
 # Initialize FastMCP server
 mcp = FastMCP("hotel-assistant")
 
+def _index_hotel_search(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive the indexed price columns of a stored hotel search."""
+    properties = document.get("properties", [])
+    prices = [
+        p.get("rate_per_night", {}).get("extracted_lowest")
+        for p in properties
+    ]
+    prices = [price for price in prices if isinstance(price, (int, float))]
+    return {"min_price": min(prices, default=None), "result_count": len(properties)}
+
+def _result_store() -> ResultStore:
+    """Return the store holding saved hotel searches."""
+    return get_result_store("hotels", HOTELS_DIR, index=_index_hotel_search)
+
 def get_serpapi_key() -> str:
     """Get SerpAPI key from environment variable."""
     api_key = os.getenv("SERPAPI_KEY")
@@ -19,7 +35,7 @@ def get_serpapi_key() -> str:
     return api_key
 
 @mcp.tool()
-def search_hotels(
+async def search_hotels(
     location: str,
     check_in_date: str,
     check_out_date: str,
@@ -117,18 +133,12 @@ def search_hotels(
             params["bedrooms"] = bedrooms
         
         # Make API request
-        response = requests.get("https://serpapi.com/search", params=params)
-        response.raise_for_status()
-        
-        hotel_data = response.json()
+        hotel_data = await serpapi_search_async(params)
         
         # Create search identifier
         search_id = f"{location.replace(' ', '_')}_{check_in_date}_{check_out_date}"
         search_id += f"_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Create directory structure
-        os.makedirs(HOTELS_DIR, exist_ok=True)
-        
         # Process and store hotel results
         processed_results = {
             "search_metadata": {
@@ -161,12 +171,10 @@ def search_hotels(
             "serpapi_pagination": hotel_data.get("serpapi_pagination", {})
         }
         
-        # Save results to file
-        file_path = os.path.join(HOTELS_DIR, f"{search_id}.json")
-        with open(file_path, "w") as f:
-            json.dump(processed_results, f, indent=2)
+        # Save results to the result store
+        saved_to = _result_store().save(search_id, processed_results)
         
-        print(f"Hotel search results saved to: {file_path}")
+        print(f"Hotel search results saved to: {saved_to}")
         
         # Calculate price range
         properties = processed_results["properties"]
@@ -199,7 +207,7 @@ def search_hotels(
         
         return summary
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
@@ -218,20 +226,16 @@ def get_hotel_details(search_id: str) -> str:
         JSON string with detailed hotel information
     """
     
-    file_path = os.path.join(HOTELS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No hotel search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            hotel_data = json.load(f)
+        hotel_data = _result_store().load(search_id)
+        if hotel_data is None:
+            return f"No hotel search found with ID: {search_id}"
         return json.dumps(hotel_data, indent=2)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error reading hotel data for {search_id}: {str(e)}"
 
 @mcp.tool()
-def get_property_details(
+async def get_property_details(
     property_token: str,
     currency: str = "USD",
     country: str = "us",
@@ -262,13 +266,13 @@ def get_property_details(
             "hl": language
         }
         
-        response = requests.get("https://serpapi.com/search", params=params)
+        response = await serpapi_get_async(params)
         response.raise_for_status()
         
         property_data = response.json()
         return json.dumps(property_data, indent=2)
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return f"API request failed: {str(e)}"
     except ValueError as e:
         return str(e)
@@ -293,14 +297,10 @@ def filter_hotels_by_price(
         JSON string with filtered hotel results
     """
     
-    file_path = os.path.join(HOTELS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No hotel search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            hotel_data = json.load(f)
+        hotel_data = _result_store().load(search_id)
+        if hotel_data is None:
+            return f"No hotel search found with ID: {search_id}"
         
         def price_filter(hotel):
             rate = hotel.get("rate_per_night", {})
@@ -325,7 +325,7 @@ def filter_hotels_by_price(
         
         return json.dumps(result, indent=2)
         
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error processing hotel data for {search_id}: {str(e)}"
 
 @mcp.tool()
@@ -344,14 +344,10 @@ def filter_hotels_by_rating(
         JSON string with filtered hotel results
     """
     
-    file_path = os.path.join(HOTELS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No hotel search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            hotel_data = json.load(f)
+        hotel_data = _result_store().load(search_id)
+        if hotel_data is None:
+            return f"No hotel search found with ID: {search_id}"
         
         def rating_filter(hotel):
             rating = hotel.get("overall_rating", 0)
@@ -370,7 +366,7 @@ def filter_hotels_by_rating(
         
         return json.dumps(result, indent=2)
         
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error processing hotel data for {search_id}: {str(e)}"
 
 @mcp.tool()
@@ -389,14 +385,10 @@ def filter_hotels_by_amenities(
         JSON string with filtered hotel results
     """
     
-    file_path = os.path.join(HOTELS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No hotel search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            hotel_data = json.load(f)
+        hotel_data = _result_store().load(search_id)
+        if hotel_data is None:
+            return f"No hotel search found with ID: {search_id}"
         
         def amenity_filter(hotel):
             hotel_amenities = hotel.get("amenities", [])
@@ -416,7 +408,7 @@ def filter_hotels_by_amenities(
         
         return json.dumps(result, indent=2)
         
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error processing hotel data for {search_id}: {str(e)}"
 
 @mcp.tool()
@@ -435,14 +427,10 @@ def filter_hotels_by_class(
         JSON string with filtered hotel results
     """
     
-    file_path = os.path.join(HOTELS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"No hotel search found with ID: {search_id}"
-    
     try:
-        with open(file_path, "r") as f:
-            hotel_data = json.load(f)
+        hotel_data = _result_store().load(search_id)
+        if hotel_data is None:
+            return f"No hotel search found with ID: {search_id}"
         
         def class_filter(hotel):
             hotel_class = hotel.get("extracted_hotel_class", 0)
@@ -461,7 +449,7 @@ def filter_hotels_by_class(
         
         return json.dumps(result, indent=2)
         
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         return f"Error processing hotel data for {search_id}: {str(e)}"
 
 @mcp.resource("hotels://searches")
@@ -473,26 +461,17 @@ def get_hotel_searches() -> str:
     """
     searches = []
     
-    if os.path.exists(HOTELS_DIR):
-        for filename in os.listdir(HOTELS_DIR):
-            if filename.endswith('.json'):
-                search_id = filename[:-5]  # Remove .json extension
-                file_path = os.path.join(HOTELS_DIR, filename)
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        metadata = data.get('search_metadata', {})
-                        searches.append({
-                            'search_id': search_id,
-                            'location': metadata.get('location', 'N/A'),
-                            'dates': f"{metadata.get('check_in_date', 'N/A')} - {metadata.get('check_out_date', 'N/A')}",
-                            'guests': metadata.get('guests', {}),
-                            'search_type': metadata.get('search_type', 'hotels'),
-                            'search_time': metadata.get('search_timestamp', 'N/A'),
-                            'total_properties': len(data.get('properties', []))
-                        })
-                except (json.JSONDecodeError, KeyError):
-                    continue
+    for stored in _result_store().list_searches():
+        metadata = stored['metadata']
+        searches.append({
+            'search_id': stored['search_id'],
+            'location': metadata.get('location', 'N/A'),
+            'dates': f"{metadata.get('check_in_date', 'N/A')} - {metadata.get('check_out_date', 'N/A')}",
+            'guests': metadata.get('guests', {}),
+            'search_type': metadata.get('search_type', 'hotels'),
+            'search_time': metadata.get('search_timestamp', 'N/A'),
+            'total_properties': stored['result_count'] or 0
+        })
     
     content = "# Hotel Searches\n\n"
     if searches:
@@ -523,14 +502,10 @@ def get_hotel_search_details(search_id: str) -> str:
     Args:
         search_id: The hotel search ID to retrieve details for
     """
-    file_path = os.path.join(HOTELS_DIR, f"{search_id}.json")
-    
-    if not os.path.exists(file_path):
-        return f"# Hotel Search Not Found: {search_id}\n\nNo hotel search found with this ID."
-    
     try:
-        with open(file_path, 'r') as f:
-            hotel_data = json.load(f)
+        hotel_data = _result_store().load(search_id)
+        if hotel_data is None:
+            return f"# Hotel Search Not Found: {search_id}\n\nNo hotel search found with this ID."
         
         metadata = hotel_data.get('search_metadata', {})
         properties = hotel_data.get('properties', [])
@@ -647,7 +622,7 @@ def get_hotel_search_details(search_id: str) -> str:
         
         return content
         
-    except json.JSONDecodeError:
+    except ValueError:
         return f"# Error\n\nCorrupted hotel data for search ID: {search_id}"
 
 @mcp.prompt()
@@ -0,0 +1,256 @@
+"""HTTP-semantics cache for upstream GET responses.
+
+Unlike ``response_cache`` (which keys SerpAPI results on their parameters
+with TTLs we choose), this cache follows what the upstream server says:
+
+- ``Cache-Control: max-age`` (minus ``Age``) or ``Expires`` make a response
+  fresh; fresh responses are served without any request
+- stale responses carrying an ``ETag`` and/or ``Last-Modified`` validator are
+  revalidated with ``If-None-Match``/``If-Modified-Since``; a ``304 Not
+  Modified`` reuses the stored body and refreshes its freshness
+- ``no-store`` responses are never stored and ``no-cache`` ones are always
+  revalidated
+
+Entries are kept in memory in an LRU bounded by ``HTTP_CACHE_MAX_BYTES``.
+Only ``200`` responses are stored. Hit/revalidation/miss counters are
+available via ``stats()``.
+
+Example Usage:
+    from py_mcp_travelplanner.http_cache import get_http_cache, request_key
+
+    cache = get_http_cache()
+    key = request_key(url, params, headers)
+    entry = cache.lookup(key)
+    if entry is not None and entry.is_fresh(cache.now()):
+        response = entry.to_response(url)
+"""
+from __future__ import annotations
+
+import email.utils
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import httpx
+
+from .config import get_config
+
+LOG = logging.getLogger("py_mcp_travelplanner.http_cache")
+
+# Response headers kept with a cached body
+STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "expires", "date")
+
+_DIRECTIVE = re.compile(r"([a-z-]+)(?:=\"?([^\",]*)\"?)?")
+
+
+def request_key(url: str, params: Optional[Mapping[str, Any]] = None,
+                headers: Optional[Mapping[str, str]] = None) -> str:
+    """Return the cache key of a GET request (full URL plus its Accept header)."""
+    full_url = httpx.URL(url, params=dict(params) if params is not None else None)
+    accept = next((v for k, v in (headers or {}).items() if k.lower() == "accept"), "")
+    return f"{full_url}|{accept}"
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into a directive -> argument mapping."""
+    return {name: arg for name, arg in _DIRECTIVE.findall((value or "").lower())}
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: Mapping[str, str], now: float) -> float:
+    """Return how many more seconds a response is fresh for (0 = revalidate now)."""
+    directives = parse_cache_control(headers.get("cache-control"))
+    if "no-cache" in directives or "no-store" in directives:
+        return 0.0
+    max_age = directives.get("s-maxage") or directives.get("max-age")
+    if max_age is not None:
+        try:
+            age = float(headers.get("age") or 0)
+            return max(0.0, float(max_age) - age)
+        except ValueError:
+            return 0.0
+    expires = _http_date(headers.get("expires"))
+    if expires is not None:
+        date = _http_date(headers.get("date")) or now
+        return max(0.0, expires - date)
+    return 0.0
+
+
+@dataclass
+class HttpCacheEntry:
+    """A stored response body with its validators and freshness deadline."""
+
+    content: bytes
+    headers: Dict[str, str]
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    size: int = field(init=False)
+
+    def __post_init__(self):
+        self.size = len(self.content)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the validator headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, url: str) -> httpx.Response:
+        """Rebuild a ``200`` response from the stored body."""
+        return httpx.Response(200, headers=self.headers, content=self.content,
+                              request=httpx.Request("GET", url))
+
+
+class HttpCache:
+    """Thread-safe in-memory LRU of validated GET responses."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024,
+                 clock: Callable[[], float] = time.time):
+        self.max_bytes = int(max_bytes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, HttpCacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._counters = {"fresh_hits": 0, "revalidated": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def now(self) -> float:
+        return self._clock()
+
+    def lookup(self, key: str) -> Optional[HttpCacheEntry]:
+        """Return the stored entry (fresh or stale) for a key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def record_fresh_hit(self) -> None:
+        with self._lock:
+            self._counters["fresh_hits"] += 1
+
+    def store(self, key: str, response: httpx.Response) -> Optional[HttpCacheEntry]:
+        """Store a ``200`` response if it is cacheable; returns the entry."""
+        with self._lock:
+            self._counters["misses"] += 1
+        if response.status_code != 200:
+            return None
+        headers = response.headers
+        if "no-store" in parse_cache_control(headers.get("cache-control")):
+            return None
+
+        now = self._clock()
+        entry = HttpCacheEntry(
+            content=response.content,
+            headers={name: headers[name] for name in STORED_HEADERS if name in headers},
+            expires_at=now + freshness_lifetime(headers, now),
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+        )
+        if not (entry.etag or entry.last_modified or entry.expires_at > now):
+            return None  # Neither fresh nor revalidatable
+        if entry.size > self.max_bytes:
+            return None
+
+        with self._lock:
+            self._put(key, entry)
+            self._counters["stores"] += 1
+        return entry
+
+    def revalidated(self, key: str, entry: HttpCacheEntry, response: httpx.Response) -> HttpCacheEntry:
+        """Apply a ``304 Not Modified`` to a stored entry and return it."""
+        now = self._clock()
+        headers = dict(entry.headers)
+        for name in STORED_HEADERS:
+            if name != "content-type" and name in response.headers:
+                headers[name] = response.headers[name]
+        merged = httpx.Headers(headers)
+        if "age" in response.headers:
+            merged["age"] = response.headers["age"]
+        updated = HttpCacheEntry(
+            content=entry.content,
+            headers=headers,
+            expires_at=now + freshness_lifetime(merged, now),
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+        )
+        with self._lock:
+            self._put(key, updated)
+            self._counters["revalidated"] += 1
+        return updated
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _put(self, key: str, entry: HttpCacheEntry) -> None:
+        # Caller holds the lock
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._counters["evictions"] += 1
+
+
+# Global HTTP cache instance
+_http_cache: Optional[HttpCache] = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Return the process-wide HTTP cache.
+
+    Returns None when caching is disabled via ``HTTP_CACHE_ENABLED``.
+    """
+    global _http_cache
+
+    config = get_config()
+    if not config.get('HTTP_CACHE_ENABLED', True):
+        return None
+
+    if _http_cache is None:
+        with _http_cache_lock:
+            if _http_cache is None:
+                _http_cache = HttpCache(max_bytes=int(config.get('HTTP_CACHE_MAX_BYTES', 32 * 1024 * 1024)))
+    return _http_cache
+
+
+def reset_http_cache() -> None:
+    """Discard the global HTTP cache instance.
+
+    This is primarily useful for testing.
+    """
+    global _http_cache
+    _http_cache = None
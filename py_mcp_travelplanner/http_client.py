@@ -0,0 +1,422 @@
+"""Shared HTTP client for the travel planner subservers.
+
+All outbound HTTP traffic to SerpAPI goes through a single process-wide
+``requests.Session`` so that TCP/TLS connections are kept alive and reused
+between tool calls instead of paying a fresh handshake on every request.
+
+The session is configured with:
+- a bounded connection pool (``HTTP_POOL_CONNECTIONS`` host pools, each
+  capped at ``HTTP_POOL_MAXSIZE`` connections; callers block rather than
+  opening unbounded extra sockets)
+- default connect/read timeouts (``HTTP_CONNECT_TIMEOUT`` / ``HTTP_READ_TIMEOUT``)
+  so a hung socket can never pin a worker forever
+- retry with exponential backoff on 429 and 5xx responses
+  (``HTTP_MAX_RETRIES`` / ``HTTP_BACKOFF_FACTOR``), honouring ``Retry-After``
+  up to ``HTTP_MAX_RETRY_AFTER`` seconds
+
+``serpapi_search()`` additionally consults the shared response cache (see
+``response_cache``) so identical searches do not burn SerpAPI quota.
+``async_cached_get()`` follows the upstream's own caching headers instead
+(see ``http_cache``): fresh responses are reused without a request and stale
+ones are revalidated with ``If-None-Match``/``If-Modified-Since``.
+
+Async tools use the non-blocking counterparts (``async_http_get()``,
+``serpapi_get_async()``, ``serpapi_search_async()``), which share one
+``httpx.AsyncClient`` per event loop with the same pool limits, timeouts
+and retry policy, so many tool calls can be in flight on a single loop.
+
+Example Usage:
+    from py_mcp_travelplanner.http_client import serpapi_get
+
+    response = serpapi_get({"engine": "google_flights", "api_key": key, ...})
+    response.raise_for_status()
+    data = response.json()
+
+    # From a coroutine
+    data = await serpapi_search_async({"engine": "google_flights", ...})
+"""
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import time
+import threading
+import weakref
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import get_config
+from .http_cache import get_http_cache, request_key
+from .rate_limit import TokenBucket
+from .response_cache import get_response_cache
+
+LOG = logging.getLogger("py_mcp_travelplanner.http_client")
+
+SERPAPI_URL = "https://serpapi.com/search"
+
+# Status codes that are safe to retry for idempotent GET requests
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+Timeout = Union[float, Tuple[float, float]]
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# httpx.AsyncClient pools are bound to the loop that created them
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _setting(key: str, default: Any) -> Any:
+    """Read an HTTP setting from the runtime configuration."""
+    value = get_config().get(key, default)
+    return default if value is None else value
+
+
+def default_timeout() -> Tuple[float, float]:
+    """Return the configured ``(connect, read)`` timeout tuple."""
+    return (
+        float(_setting('HTTP_CONNECT_TIMEOUT', 5.0)),
+        float(_setting('HTTP_READ_TIMEOUT', 30.0)),
+    )
+
+
+def build_session(pool_connections: int = 10,
+                  pool_maxsize: int = 10,
+                  max_retries: int = 3,
+                  backoff_factor: float = 0.5) -> requests.Session:
+    """Create a keep-alive session with a bounded pool and retry policy.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum connections kept open per host
+        max_retries: Retries for connection errors and 429/5xx responses
+        backoff_factor: Exponential backoff factor between retries
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+        pool_block=True,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide shared session, creating it on first use."""
+    global _SESSION
+
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = build_session(
+                    pool_connections=int(_setting('HTTP_POOL_CONNECTIONS', 10)),
+                    pool_maxsize=int(_setting('HTTP_POOL_MAXSIZE', 10)),
+                    max_retries=int(_setting('HTTP_MAX_RETRIES', 3)),
+                    backoff_factor=float(_setting('HTTP_BACKOFF_FACTOR', 0.5)),
+                )
+                LOG.debug("Created shared HTTP session")
+    return _SESSION
+
+
+def reset_session() -> None:
+    """Close and discard the shared session.
+
+    This is primarily useful for testing or after configuration changes.
+    """
+    global _SESSION
+
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+        _SESSION = None
+
+
+def http_get(url: str,
+             params: Optional[Mapping[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None,
+             timeout: Optional[Timeout] = None) -> requests.Response:
+    """Issue a GET through the shared session with a default timeout.
+
+    Args:
+        url: Target URL
+        params: Optional query parameters
+        headers: Optional request headers
+        timeout: Seconds or ``(connect, read)`` tuple; defaults to the
+                 configured HTTP timeouts
+
+    Returns:
+        The requests.Response (callers decide whether to raise_for_status)
+    """
+    return get_session().get(
+        url,
+        params=params,
+        headers=headers,
+        timeout=timeout if timeout is not None else default_timeout(),
+    )
+
+
+def serpapi_get(params: Mapping[str, Any], timeout: Optional[Timeout] = None) -> requests.Response:
+    """Issue a SerpAPI search request through the shared session.
+
+    Args:
+        params: SerpAPI query parameters (including ``engine`` and ``api_key``)
+        timeout: Optional timeout override
+
+    Returns:
+        The requests.Response
+    """
+    return http_get(SERPAPI_URL, params=params, timeout=timeout)
+
+
+def serpapi_search(params: Mapping[str, Any], timeout: Optional[Timeout] = None) -> Dict[str, Any]:
+    """Run a SerpAPI search, serving identical requests from the response cache.
+
+    The cache key ignores ``api_key``; only successful responses (HTTP 2xx
+    without an ``error`` field) are cached.
+
+    Args:
+        params: SerpAPI query parameters (including ``engine`` and ``api_key``)
+        timeout: Optional timeout override
+
+    Returns:
+        The decoded JSON response
+
+    Raises:
+        requests.exceptions.RequestException: On transport or HTTP errors
+    """
+    cache = get_response_cache()
+    if cache is not None:
+        cached = cache.get(params)
+        if cached is not None:
+            LOG.debug("SerpAPI cache hit for engine=%s", params.get("engine"))
+            return cached
+
+    response = serpapi_get(params, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()
+
+    if cache is not None and isinstance(data, dict) and "error" not in data:
+        cache.set(params, data)
+    return data
+
+
+# -- asyncio variants ----------------------------------------------------------
+
+def _httpx_timeout(timeout: Optional[Timeout]) -> httpx.Timeout:
+    """Convert a requests-style timeout into an ``httpx.Timeout``."""
+    if timeout is None:
+        timeout = default_timeout()
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def build_async_client(pool_connections: int = 10,
+                       pool_maxsize: int = 10,
+                       max_retries: int = 3) -> httpx.AsyncClient:
+    """Create a keep-alive ``httpx.AsyncClient`` with bounded pool limits.
+
+    Connection errors are retried by the transport; 429/5xx retries with
+    backoff are handled by ``async_http_get()``.
+
+    Args:
+        pool_connections: Number of hosts expected to be kept warm
+        pool_maxsize: Maximum connections kept open per host
+        max_retries: Retries for failed connection attempts
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    limits = httpx.Limits(
+        max_connections=pool_connections * pool_maxsize,
+        max_keepalive_connections=pool_maxsize,
+    )
+    return httpx.AsyncClient(
+        timeout=_httpx_timeout(None),
+        transport=httpx.AsyncHTTPTransport(limits=limits, retries=max_retries),
+    )
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = build_async_client(
+            pool_connections=int(_setting('HTTP_POOL_CONNECTIONS', 10)),
+            pool_maxsize=int(_setting('HTTP_POOL_MAXSIZE', 10)),
+            max_retries=int(_setting('HTTP_MAX_RETRIES', 3)),
+        )
+        _ASYNC_CLIENTS[loop] = client
+        LOG.debug("Created shared async HTTP client")
+    return client
+
+
+async def reset_async_client() -> None:
+    """Close and discard the async client of the running event loop.
+
+    This is primarily useful for testing or after configuration changes.
+    """
+    client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _retry_delay(response: httpx.Response, attempt: int, backoff_factor: float) -> float:
+    """Return the wait before retry ``attempt``, honouring ``Retry-After``.
+
+    ``Retry-After`` may be delta-seconds or an HTTP date; either way the wait
+    is capped at ``HTTP_MAX_RETRY_AFTER`` seconds.
+    """
+    max_delay = float(_setting('HTTP_MAX_RETRY_AFTER', 60.0))
+    retry_after = (response.headers.get("Retry-After") or "").strip()
+    if retry_after:
+        try:
+            return min(max_delay, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after).timestamp()
+        except (TypeError, ValueError):
+            pass
+        else:
+            return min(max_delay, max(0.0, retry_at - time.time()))
+    return backoff_factor * (2 ** attempt)
+
+
+async def async_http_get(url: str,
+                         params: Optional[Mapping[str, Any]] = None,
+                         headers: Optional[Dict[str, str]] = None,
+                         timeout: Optional[Timeout] = None) -> httpx.Response:
+    """Issue a non-blocking GET through the shared async client.
+
+    429 and 5xx responses are retried with exponential backoff
+    (``HTTP_MAX_RETRIES`` / ``HTTP_BACKOFF_FACTOR``).
+
+    Args:
+        url: Target URL
+        params: Optional query parameters
+        headers: Optional request headers
+        timeout: Seconds or ``(connect, read)`` tuple; defaults to the
+                 configured HTTP timeouts
+
+    Returns:
+        The httpx.Response (callers decide whether to raise_for_status)
+    """
+    client = get_async_client()
+    max_retries = int(_setting('HTTP_MAX_RETRIES', 3))
+    backoff_factor = float(_setting('HTTP_BACKOFF_FACTOR', 0.5))
+    request_timeout = _httpx_timeout(timeout)
+
+    attempt = 0
+    while True:
+        response = await client.get(
+            url,
+            params=dict(params) if params is not None else None,
+            headers=headers,
+            timeout=request_timeout,
+        )
+        if response.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+            return response
+        delay = _retry_delay(response, attempt, backoff_factor)
+        LOG.debug("Retrying %s after HTTP %s in %.2fs", url, response.status_code, delay)
+        await response.aclose()
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def async_cached_get(url: str,
+                           params: Optional[Mapping[str, Any]] = None,
+                           headers: Optional[Dict[str, str]] = None,
+                           timeout: Optional[Timeout] = None,
+                           limiter: Optional[TokenBucket] = None) -> httpx.Response:
+    """Like ``async_http_get()``, but honouring HTTP caching headers.
+
+    Responses that are still fresh (``Cache-Control: max-age`` / ``Expires``)
+    are served from the HTTP cache without a request; stale ones are
+    revalidated with their ``ETag``/``Last-Modified`` validators and a
+    ``304 Not Modified`` reuses the stored body. When a ``limiter`` is given,
+    a token is acquired before every request actually sent upstream.
+
+    Returns:
+        The httpx.Response (rebuilt from the cache when not re-downloaded)
+    """
+    cache = get_http_cache()
+    if cache is None:
+        if limiter is not None:
+            await limiter.acquire_async()
+        return await async_http_get(url, params=params, headers=headers, timeout=timeout)
+
+    key = request_key(url, params, headers)
+    entry = cache.lookup(key)
+    if entry is not None and entry.is_fresh(cache.now()):
+        cache.record_fresh_hit()
+        LOG.debug("HTTP cache hit (fresh) for %s", url)
+        return entry.to_response(url)
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        request_headers.update(entry.conditional_headers())
+    if limiter is not None:
+        await limiter.acquire_async()
+    response = await async_http_get(url, params=params, headers=request_headers, timeout=timeout)
+
+    if response.status_code == 304 and entry is not None:
+        LOG.debug("HTTP cache revalidated %s", url)
+        return cache.revalidated(key, entry, response).to_response(url)
+    cache.store(key, response)
+    return response
+
+
+async def serpapi_get_async(params: Mapping[str, Any],
+                            timeout: Optional[Timeout] = None) -> httpx.Response:
+    """Async counterpart of ``serpapi_get()``, honouring HTTP caching headers."""
+    return await async_cached_get(SERPAPI_URL, params=params, timeout=timeout)
+
+
+async def serpapi_search_async(params: Mapping[str, Any],
+                               timeout: Optional[Timeout] = None) -> Dict[str, Any]:
+    """Async counterpart of ``serpapi_search()``, sharing the same response cache.
+
+    Raises:
+        httpx.HTTPError: On transport or HTTP errors
+    """
+    cache = get_response_cache()
+    if cache is not None:
+        cached = cache.get(params)
+        if cached is not None:
+            LOG.debug("SerpAPI cache hit for engine=%s", params.get("engine"))
+            return cached
+
+    response = await serpapi_get_async(params, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()
+
+    if cache is not None and isinstance(data, dict) and "error" not in data:
+        cache.set(params, data)
+    return data
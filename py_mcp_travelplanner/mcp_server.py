@@ -10,15 +10,26 @@ and manage the individual travel planner servers.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import importlib
+import inspect
+import json
 import logging
-from typing import Any, Dict, List
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from mcp.server import Server
+from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from . import cli_handlers
+from .config import get_config
+from .response_cache import get_response_cache
+from .result_store import get_parsed_result_cache
+from .tool_executor import get_tool_executor
+from .tool_manifest import build_manifest, load_manifest, manifest_entries, write_manifest
 
 LOG = logging.getLogger("py_mcp_travelplanner.mcp_server")
 
@@ -30,6 +41,18 @@ _SERVICE_REGISTRY: Dict[str, Any] = {}
 _TOOL_REGISTRY: Dict[str, Dict[str, Any]] = {}
 # Whether _initialize_service_registry() was run during this process
 _REGISTRY_INITIALIZED = False
+# Bumped whenever tools are (re)registered; lets clients detect list changes
+_REGISTRY_GENERATION = 0
+# Client sessions that have listed tools; told when the generation changes
+_LISTING_SESSIONS: "weakref.WeakSet[Any]" = weakref.WeakSet()
+# Pending notifications/tools/list_changed sends (keeps the tasks referenced)
+_NOTIFY_TASKS: "set[asyncio.Task]" = set()
+
+# Seconds spent importing each subservice module
+_SERVICE_IMPORT_TIMES: Dict[str, float] = {}
+
+# Resolved calling convention for a subservice tool: arguments dict -> result
+Invoker = Callable[[Dict[str, Any]], Awaitable[Any]]
 
 
 def _discover_subservices() -> List[str]:
@@ -38,11 +61,22 @@ def _discover_subservices() -> List[str]:
     Returns:
         List of subservice names (e.g., ['event_server', 'flight_server', ...])
     """
-    servers = cli_handlers.list_servers()
+    # _find_server_dirs() rather than list_servers(): the latter prints to
+    # stdout, which is the protocol stream when serving over stdio
+    servers = [p.name for p in cli_handlers._find_server_dirs()]
     LOG.info(f"Discovered {len(servers)} subservices: {servers}")
     return servers
 
 
+def _subservice_module_path(service_name: str) -> str:
+    """Return the module holding a subservice's ``mcp`` instance.
+
+    Pattern: py_mcp_travelplanner.event_server.event_server
+    """
+    base_name = service_name.replace('_server', '')
+    return f"py_mcp_travelplanner.{service_name}.{base_name}_server"
+
+
 def _load_subservice_mcp(service_name: str) -> Any:
     """Dynamically import and return the MCP instance from a subservice.
 
@@ -57,17 +91,18 @@ def _load_subservice_mcp(service_name: str) -> Any:
 
     try:
         # Try to import the service's main MCP server module
-        # Pattern: py_mcp_travelplanner.event_server.event_server (contains 'mcp' instance)
-        base_name = service_name.replace('_server', '')
-        module_path = f"py_mcp_travelplanner.{service_name}.{base_name}_server"
+        module_path = _subservice_module_path(service_name)
 
         LOG.debug(f"Attempting to import {module_path}")
+        started = time.perf_counter()
         module = importlib.import_module(module_path)
+        _SERVICE_IMPORT_TIMES[service_name] = time.perf_counter() - started
 
         if hasattr(module, 'mcp'):
             mcp_instance = module.mcp
             _SERVICE_REGISTRY[service_name] = mcp_instance
-            LOG.info(f"Successfully loaded {service_name} MCP instance")
+            LOG.info(f"Successfully loaded {service_name} MCP instance "
+                     f"(import {_SERVICE_IMPORT_TIMES[service_name] * 1000:.1f} ms)")
             return mcp_instance
         else:
             LOG.warning(f"Module {module_path} does not have 'mcp' attribute")
@@ -139,184 +174,422 @@ async def _extract_tools_from_subservice(service_name: str, mcp_instance: Any) -
     return tools
 
 
-async def _initialize_service_registry():
-    """Discover and register all subservices and their tools."""
-    global _TOOL_REGISTRY, _REGISTRY_INITIALIZED
+def _lazy_loading_enabled() -> bool:
+    """Return True if tools should be served from the static manifest."""
+    return bool(get_config().get('UNIFIED_LAZY_LOADING', False))
+
+
+def _registered_services() -> List[str]:
+    """Return loaded and manifest-only service names, in registration order."""
+    names = dict.fromkeys(_SERVICE_REGISTRY)
+    names.update(dict.fromkeys(t['service'] for t in _TOOL_REGISTRY.values()))
+    return list(names)
+
+
+async def _load_service_tools(service_name: str) -> List[Dict[str, Any]]:
+    """Import one subservice off the event loop and extract its tools."""
+    mcp_instance = await asyncio.to_thread(_load_subservice_mcp, service_name)
+    if not mcp_instance:
+        return []
+    return await _extract_tools_from_subservice(service_name, mcp_instance)
+
+
+async def _ensure_service_loaded(service_name: str) -> Any:
+    """Import a manifest-only service and bind the invokers of its tools.
+
+    Raises:
+        RuntimeError: If the service module cannot be loaded
+    """
+    mcp_instance = await asyncio.to_thread(_load_subservice_mcp, service_name)
+    if not mcp_instance:
+        raise RuntimeError(f"Failed to load subservice {service_name}")
+
+    for tool_info in _TOOL_REGISTRY.values():
+        if tool_info['service'] == service_name and tool_info['mcp_instance'] is None:
+            tool_info['mcp_instance'] = mcp_instance
+            _bind_invoker(tool_info)
+    return mcp_instance
+
+
+def _bump_registry_generation() -> int:
+    """Mark the tool registry as changed and return the new generation.
+
+    Sessions that have listed tools are sent ``notifications/tools/list_changed``.
+    """
+    global _REGISTRY_GENERATION
+    _REGISTRY_GENERATION += 1
+    _notify_tool_list_changed()
+    return _REGISTRY_GENERATION
+
+
+def _notify_tool_list_changed() -> None:
+    """Send notifications/tools/list_changed to every session that listed tools."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # Not serving; nobody to tell
+
+    async def _send(session: Any) -> None:
+        try:
+            await session.send_tool_list_changed()
+        except Exception as e:
+            LOG.debug("Could not send tools/list_changed: %s", e)
+            _LISTING_SESSIONS.discard(session)
+
+    for session in list(_LISTING_SESSIONS):
+        task = loop.create_task(_send(session))
+        _NOTIFY_TASKS.add(task)
+        task.add_done_callback(_NOTIFY_TASKS.discard)
+
+
+def _load_manifest_snapshot() -> bool:
+    """Register tools from the manifest snapshot if it matches the code on disk.
+
+    Services are not imported; each one loads on its first tool call (or
+    when _initialize_service_registry(lazy=False) runs).
+
+    Returns:
+        True if the registry is populated
+    """
+    global _REGISTRY_INITIALIZED
+
+    if _TOOL_REGISTRY:
+        return True
+
+    manifest = load_manifest(expected_services=_discover_subservices())
+    if manifest is None:
+        return False
+
+    for tool_info in manifest_entries(manifest):
+        _TOOL_REGISTRY[tool_info['namespaced_name']] = tool_info
+    _REGISTRY_INITIALIZED = True
+    _bump_registry_generation()
+    LOG.info(f"Registered {len(_TOOL_REGISTRY)} tools from the manifest snapshot")
+    return True
+
+
+def _snapshot_manifest() -> Dict[str, Any]:
+    """Build a manifest document from the current (eagerly loaded) registry."""
+    services = _discover_subservices()
+    module_paths = {name: _subservice_module_path(name) for name in services}
+    return build_manifest(_TOOL_REGISTRY, module_paths, discovered=services)
+
+
+async def _initialize_service_registry(lazy: Optional[bool] = None):
+    """Discover and register all subservices and their tools.
+
+    Args:
+        lazy: Register tools from the static manifest and defer imports until
+              first call. Defaults to the ``UNIFIED_LAZY_LOADING`` setting;
+              passing False also loads any services still pending import.
+    """
+    global _REGISTRY_INITIALIZED
+
+    if lazy is None:
+        lazy = _lazy_loading_enabled()
 
     if _TOOL_REGISTRY:
         # Already initialized
+        if not lazy:
+            pending = list(dict.fromkeys(
+                t['service'] for t in _TOOL_REGISTRY.values() if t['mcp_instance'] is None
+            ))
+            results = await asyncio.gather(
+                *(_ensure_service_loaded(name) for name in pending), return_exceptions=True
+            )
+            # Runs as a background warm-up task nobody awaits, so report failures here;
+            # the affected tools stay lazy and retry the import on their first call
+            for name, result in zip(pending, results):
+                if isinstance(result, BaseException):
+                    LOG.error("Could not load subservice %s: %s", name, result)
         _REGISTRY_INITIALIZED = True
         return
 
+    if lazy:
+        if _load_manifest_snapshot():
+            return
+        LOG.warning("Lazy loading enabled but no current tool manifest found; importing all subservices")
+
     LOG.info("Initializing unified service registry...")
 
     services = _discover_subservices()
 
-    for service_name in services:
-        mcp_instance = _load_subservice_mcp(service_name)
-
-        if mcp_instance:
-            tools = await _extract_tools_from_subservice(service_name, mcp_instance)
+    # Import and extract all services concurrently; register in discovery order
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_load_service_tools(name) for name in services))
 
-            for tool_info in tools:
-                _TOOL_REGISTRY[tool_info['namespaced_name']] = tool_info
+    for tools in results:
+        for tool_info in tools:
+            _bind_invoker(tool_info)
+            _TOOL_REGISTRY[tool_info['namespaced_name']] = tool_info
 
     _REGISTRY_INITIALIZED = True
+    _bump_registry_generation()
 
-    LOG.info(f"Initialized {len(_TOOL_REGISTRY)} tools from {len(_SERVICE_REGISTRY)} services")
+    LOG.info(f"Initialized {len(_TOOL_REGISTRY)} tools from {len(_SERVICE_REGISTRY)} services "
+             f"in {(time.perf_counter() - started) * 1000:.1f} ms")
+    for service_name in services:
+        if service_name in _SERVICE_IMPORT_TIMES:
+            LOG.info(f"  {service_name}: import {_SERVICE_IMPORT_TIMES[service_name] * 1000:.1f} ms")
 
 
-@mcp.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools for managing travel planner servers and subservice tools."""
+def _is_sync_tool(tool_obj: Any) -> bool:
+    """Return True if a FastMCP tool wraps a plain (blocking) function."""
+    return (
+        hasattr(tool_obj, 'fn')
+        and hasattr(tool_obj, 'fn_metadata')
+        and not getattr(tool_obj, 'is_async', True)
+    )
 
-    # NOTE: Do NOT auto-initialize the service registry here. Some tests expect
-    # the baseline list_tools() call to return only the control tools (8 total).
-    # Tests that require subservice tools call `_initialize_service_registry()`
-    # explicitly before calling list_tools().
 
-    # Initialize service registry on first call
-    # await _initialize_service_registry()  # registry initialization is explicit
+async def _run_sync_tool(service_name: str, tool_obj: Any, arguments: Dict[str, Any]) -> Any:
+    """Validate arguments on the loop, then run a sync tool on the tool executor.
 
-    # Control/Management tools
-    control_tools = [
-        Tool(
-            name="list_servers",
-            description="List all discovered travel planner servers",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="list_services",
-            description="List all integrated subservices and their available tools",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_service_manifest",
-            description="Get detailed manifest of all services and their tools",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service": {
-                        "type": "string",
-                        "description": "Optional: specific service name to get manifest for"
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="start_server",
-            description="Start a specific travel planner server",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": {
-                        "type": "string",
-                        "description": "Name of the server to start (e.g., event_server, flight_server)"
-                    },
-                    "dry_run": {
-                        "type": "boolean",
-                        "description": "If true, only show what would be started without actually starting",
-                        "default": False
-                    }
-                },
-                "required": ["server"]
-            }
-        ),
-        Tool(
-            name="start_all_servers",
-            description="Start all discovered travel planner servers (requires SERPAPI_KEY)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "dry_run": {
-                        "type": "boolean",
-                        "description": "If true, only show what would be started without actually starting",
-                        "default": False
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="stop_server",
-            description="Stop a running server by name or PID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": {
-                        "type": "string",
-                        "description": "Server name or numeric PID to stop"
-                    },
-                    "timeout": {
-                        "type": "number",
-                        "description": "Timeout in seconds to wait for graceful shutdown",
-                        "default": 5.0
-                    }
-                },
-                "required": ["server"]
-            }
-        ),
-        Tool(
-            name="health_check",
-            description="Check health of a specific server (verifies main.py exists and is readable)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "server": {
-                        "type": "string",
-                        "description": "Name of the server to check"
-                    }
+    Mirrors FastMCP's ``Tool.run()`` argument handling so results are
+    identical to an inline call, without blocking the event loop.
+    """
+    metadata = tool_obj.fn_metadata
+    parsed = metadata.arg_model.model_validate(metadata.pre_parse_json(arguments))
+    kwargs = parsed.model_dump_one_level()
+    if getattr(tool_obj, 'context_kwarg', None):
+        kwargs[tool_obj.context_kwarg] = None
+    return await get_tool_executor().run(service_name, tool_obj.fn, **kwargs)
+
+
+def _resolve_invoker(tool_info: Dict[str, Any]) -> Invoker:
+    """Decide once how a subservice tool is called and return its invoker.
+
+    The invoker takes the raw arguments dict and returns the tool result:
+    - FastMCP tools wrapping sync functions run on the tool executor
+    - FastMCP tools wrapping coroutines are awaited via ``Tool.run()``
+    - plain callables are awaited directly (async) or run on the executor (sync)
+    """
+    service_name = tool_info['service']
+    original_name = tool_info['original_name']
+    mcp_instance = tool_info['mcp_instance']
+
+    if mcp_instance is None:
+        # Registered from the static manifest: import the service on first call
+        async def _invoke_lazy(arguments: Dict[str, Any]) -> Any:
+            tool_info['mcp_instance'] = await _ensure_service_loaded(service_name)
+            return await _bind_invoker(tool_info)(arguments)
+        return _invoke_lazy
+
+    def _message(text: str) -> Invoker:
+        async def _invoke(arguments: Dict[str, Any]) -> str:
+            return text
+        return _invoke
+
+    tool_manager = getattr(mcp_instance, '_tool_manager', None)
+    if not hasattr(tool_manager, '_tools'):
+        return _message(f"Cannot delegate to {service_name}: unsupported MCP instance")
+
+    tool_obj = tool_manager._tools.get(original_name)
+    if not tool_obj:
+        return _message(f"Tool function not found: {original_name}")
+
+    if _is_sync_tool(tool_obj):
+        return functools.partial(_run_sync_tool, service_name, tool_obj)
+
+    if hasattr(tool_obj, 'run') and not callable(tool_obj):
+        return tool_obj.run
+
+    if inspect.iscoroutinefunction(tool_obj):
+        async def _invoke_async(arguments: Dict[str, Any]) -> Any:
+            return await tool_obj(**arguments)
+        return _invoke_async
+
+    if callable(tool_obj):
+        async def _invoke_sync(arguments: Dict[str, Any]) -> Any:
+            return await get_tool_executor().run(service_name, tool_obj, **arguments)
+        return _invoke_sync
+
+    return _message(f"Unsupported tool wrapper type for {tool_info['namespaced_name']}: {type(tool_obj)}")
+
+
+def _bind_invoker(tool_info: Dict[str, Any]) -> Invoker:
+    """Resolve and cache the invoker for a registry entry that lacks one."""
+    invoker = tool_info['invoker'] = _resolve_invoker(tool_info)
+    return invoker
+
+
+# Control/Management tools; built once, never mutated
+_CONTROL_TOOLS: List[Tool] = [
+    Tool(
+        name="list_servers",
+        description="List all discovered travel planner servers",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="list_services",
+        description="List all integrated subservices and their available tools",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_service_manifest",
+        description="Get detailed manifest of all services and their tools",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service": {
+                    "type": "string",
+                    "description": "Optional: specific service name to get manifest for"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="start_server",
+        description="Start a specific travel planner server",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server": {
+                    "type": "string",
+                    "description": "Name of the server to start (e.g., event_server, flight_server)"
                 },
-                "required": ["server"]
-            }
-        ),
-        Tool(
-            name="get_status",
-            description="Get overall status including discovered servers and SERPAPI_KEY presence",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="list_pids",
-            description="List all registered server PIDs",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="verify_serpapi_key",
-            description="Verify that the SERPAPI_KEY is valid by making a test query",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "timeout": {
-                        "type": "number",
-                        "description": "Timeout in seconds for the verification request",
-                        "default": 10.0
-                    }
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If true, only show what would be started without actually starting",
+                    "default": False
+                }
+            },
+            "required": ["server"]
+        }
+    ),
+    Tool(
+        name="start_all_servers",
+        description="Start all discovered travel planner servers (requires SERPAPI_KEY)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If true, only show what would be started without actually starting",
+                    "default": False
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="stop_server",
+        description="Stop a running server by name or PID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server": {
+                    "type": "string",
+                    "description": "Server name or numeric PID to stop"
                 },
-                "required": []
-            }
-        )
-    ]
+                "timeout": {
+                    "type": "number",
+                    "description": "Timeout in seconds to wait for graceful shutdown",
+                    "default": 5.0
+                }
+            },
+            "required": ["server"]
+        }
+    ),
+    Tool(
+        name="health_check",
+        description="Check health of a specific server (verifies main.py exists and is readable)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server": {
+                    "type": "string",
+                    "description": "Name of the server to check"
+                }
+            },
+            "required": ["server"]
+        }
+    ),
+    Tool(
+        name="get_status",
+        description="Get overall status including discovered servers and SERPAPI_KEY presence",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="list_pids",
+        description="List all registered server PIDs",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="verify_serpapi_key",
+        description="Verify that the SERPAPI_KEY is valid by making a test query",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "timeout": {
+                    "type": "number",
+                    "description": "Timeout in seconds for the verification request",
+                    "default": 10.0
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_metrics",
+        description="Get runtime metrics: SerpAPI response and parsed-result cache counters and sync tool executor queue depth",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+]
+
+
+class _ToolListSnapshot:
+    """Assembled list_tools response for one registry generation."""
+
+    __slots__ = ('key', 'generation', 'tools')
+
+    def __init__(self, key: Tuple[Any, ...], generation: int, tools: List[Tool]):
+        self.key = key
+        self.generation = generation
+        self.tools = tools
+
+
+_TOOL_LIST_SNAPSHOT: Optional[_ToolListSnapshot] = None
+
+
+def _tool_list_snapshot() -> _ToolListSnapshot:
+    """Return the assembled tool list, rebuilding it only if the registry changed."""
+    global _TOOL_LIST_SNAPSHOT
+
+    # The generation covers registrations made through this module; the dict
+    # identity and size also catch a registry swapped or edited in place.
+    key = (_REGISTRY_GENERATION, _REGISTRY_INITIALIZED, id(_TOOL_REGISTRY), len(_TOOL_REGISTRY))
+    snapshot = _TOOL_LIST_SNAPSHOT
+    if snapshot is not None:
+        if snapshot.key == key:
+            return snapshot
+        if snapshot.generation == _REGISTRY_GENERATION:
+            # Changed behind our back; still advertise a new generation
+            key = (_bump_registry_generation(),) + key[1:]
 
-    # Add all subservice tools with namespaced names
-    subservice_tools = []
     # Only include subservice tools if the registry has been explicitly initialized
+    subservice_tools = []
     if _REGISTRY_INITIALIZED:
         for tool_name, tool_info in _TOOL_REGISTRY.items():
             subservice_tools.append(
@@ -327,224 +600,293 @@ async def list_tools() -> list[Tool]:
                 )
             )
 
-    LOG.info(f"Listing {len(control_tools)} control tools and {len(subservice_tools)} subservice tools")
+    snapshot = _TOOL_LIST_SNAPSHOT = _ToolListSnapshot(
+        key, _REGISTRY_GENERATION, _CONTROL_TOOLS + subservice_tools
+    )
+    LOG.info(f"Built tool list generation {snapshot.generation}: "
+             f"{len(_CONTROL_TOOLS)} control tools and {len(subservice_tools)} subservice tools")
+    return snapshot
 
-    return control_tools + subservice_tools
 
+@mcp.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools for managing travel planner servers and subservice tools."""
 
-@mcp.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls for server management and subservice tools."""
+    # NOTE: Do NOT auto-initialize the service registry here. Some tests expect
+    # the baseline list_tools() call to return only the control tools (8 total).
+    # Tests that require subservice tools call `_initialize_service_registry()`
+    # explicitly before calling list_tools().
 
-    # Control/Management tools
-    if name == "list_servers":
-        servers = cli_handlers.list_servers()
-        return [TextContent(
-            type="text",
-            text=f"Discovered servers: {', '.join(servers) if servers else 'None'}"
-        )]
-
-    elif name == "list_services":
-        await _initialize_service_registry()
-
-        services_info = []
-        for service_name, mcp_instance in _SERVICE_REGISTRY.items():
-            service_tools = [t for t in _TOOL_REGISTRY.values() if t['service'] == service_name]
-            tool_names = [t['original_name'] for t in service_tools]
-            services_info.append(f"  - {service_name}: {len(tool_names)} tools ({', '.join(tool_names)})")
-
-        text = f"Integrated Services ({len(_SERVICE_REGISTRY)}):\n" + "\n".join(services_info)
-        return [TextContent(type="text", text=text)]
+    try:
+        _LISTING_SESSIONS.add(mcp.request_context.session)
+    except LookupError:
+        pass  # Called directly rather than over the protocol
 
-    elif name == "get_service_manifest":
-        await _initialize_service_registry()
+    snapshot = _tool_list_snapshot()
+    LOG.debug("Listing %d tools (generation %d)", len(snapshot.tools), snapshot.generation)
 
-        service_filter = arguments.get("service")
+    # Shallow copy so callers cannot alter the cached list
+    return list(snapshot.tools)
 
-        manifest = {
-            "unified_server": "py_mcp_travelplanner_unified",
-            "total_services": len(_SERVICE_REGISTRY),
-            "total_tools": len(_TOOL_REGISTRY),
-            "services": {}
-        }
 
-        for service_name, mcp_instance in _SERVICE_REGISTRY.items():
-            if service_filter and service_filter != service_name:
-                continue
+async def _handle_list_servers(arguments: Dict[str, Any]) -> list[TextContent]:
+    servers = cli_handlers.list_servers()
+    return [TextContent(
+        type="text",
+        text=f"Discovered servers: {', '.join(servers) if servers else 'None'}"
+    )]
 
-            service_tools = [t for t in _TOOL_REGISTRY.values() if t['service'] == service_name]
 
-            manifest["services"][service_name] = {
-                "tool_count": len(service_tools),
-                "tools": [
-                    {
-                        "name": t['namespaced_name'],
-                        "original_name": t['original_name'],
-                        "description": t['description']
-                    }
-                    for t in service_tools
-                ]
-            }
+async def _handle_list_services(arguments: Dict[str, Any]) -> list[TextContent]:
+    await _initialize_service_registry()
 
-        import json
-        return [TextContent(type="text", text=json.dumps(manifest, indent=2))]
+    services = _registered_services()
+    services_info = []
+    for service_name in services:
+        service_tools = [t for t in _TOOL_REGISTRY.values() if t['service'] == service_name]
+        tool_names = [t['original_name'] for t in service_tools]
+        services_info.append(f"  - {service_name}: {len(tool_names)} tools ({', '.join(tool_names)})")
 
-    elif name == "start_server":
-        server = arguments["server"]
-        dry_run = arguments.get("dry_run", False)
-        env_overrides = None
+    text = f"Integrated Services ({len(services)}):\n" + "\n".join(services_info)
+    return [TextContent(type="text", text=text)]
 
-        # Try to get SERPAPI_KEY for server environment
-        serpapi_key = cli_handlers._resolve_serpapi_key()
-        if serpapi_key:
-            env_overrides = {"SERPAPI_KEY": serpapi_key}
 
-        ok = cli_handlers.start_server(server, dry_run=dry_run, env_overrides=env_overrides)
-        result = f"Server '{server}' {'would be started' if dry_run else 'started'}: {ok}"
+async def _handle_get_service_manifest(arguments: Dict[str, Any]) -> list[TextContent]:
+    await _initialize_service_registry()
 
-        if ok and not dry_run:
-            pid = cli_handlers.get_registered_pid(server)
-            result += f" (PID: {pid})" if pid else ""
+    service_filter = arguments.get("service")
 
-        return [TextContent(type="text", text=result)]
+    services = _registered_services()
+    manifest = {
+        "unified_server": "py_mcp_travelplanner_unified",
+        "total_services": len(services),
+        "total_tools": len(_TOOL_REGISTRY),
+        "tools_generation": _tool_list_snapshot().generation,
+        "services": {}
+    }
 
-    elif name == "start_all_servers":
-        dry_run = arguments.get("dry_run", False)
-        try:
-            results = cli_handlers.start_all_servers(dry_run=dry_run)
-            summary = "\n".join([f"  - {name}: {'started' if ok else 'failed'}" for name, ok in results.items()])
-            text = f"Start all servers {'(dry-run)' if dry_run else ''}:\n{summary}"
-            return [TextContent(type="text", text=text)]
-        except RuntimeError as e:
-            return [TextContent(type="text", text=f"Error: {e}")]
-
-    elif name == "stop_server":
-        server = arguments["server"]
-        timeout = arguments.get("timeout", 5.0)
-
-        # Try to parse as PID
-        try:
-            server_val = int(server)
-        except ValueError:
-            server_val = server
+    for service_name in services:
+        if service_filter and service_filter != service_name:
+            continue
+
+        service_tools = [t for t in _TOOL_REGISTRY.values() if t['service'] == service_name]
+
+        import_seconds = _SERVICE_IMPORT_TIMES.get(service_name)
+        manifest["services"][service_name] = {
+            "loaded": service_name in _SERVICE_REGISTRY,
+            "import_ms": round(import_seconds * 1000, 1) if import_seconds is not None else None,
+            "tool_count": len(service_tools),
+            "tools": [
+                {
+                    "name": t['namespaced_name'],
+                    "original_name": t['original_name'],
+                    "description": t['description']
+                }
+                for t in service_tools
+            ]
+        }
+
+    return [TextContent(type="text", text=json.dumps(manifest, indent=2))]
+
+
+async def _handle_start_server(arguments: Dict[str, Any]) -> list[TextContent]:
+    server = arguments["server"]
+    dry_run = arguments.get("dry_run", False)
+    env_overrides = None
+
+    # Try to get SERPAPI_KEY for server environment
+    serpapi_key = cli_handlers._resolve_serpapi_key()
+    if serpapi_key:
+        env_overrides = {"SERPAPI_KEY": serpapi_key}
+
+    ok = cli_handlers.start_server(server, dry_run=dry_run, env_overrides=env_overrides)
+    result = f"Server '{server}' {'would be started' if dry_run else 'started'}: {ok}"
+
+    if ok and not dry_run:
+        pid = cli_handlers.get_registered_pid(server)
+        result += f" (PID: {pid})" if pid else ""
+
+    return [TextContent(type="text", text=result)]
 
-        result = cli_handlers.stop_server(server_val, timeout=timeout)
-        text = f"Stop server '{server}': ok={result.get('ok')}, pid={result.get('pid')}"
-        if "error" in result:
-            text += f", error={result['error']}"
 
+async def _handle_start_all_servers(arguments: Dict[str, Any]) -> list[TextContent]:
+    dry_run = arguments.get("dry_run", False)
+    try:
+        results = cli_handlers.start_all_servers(dry_run=dry_run)
+        summary = "\n".join([f"  - {name}: {'started' if ok else 'failed'}" for name, ok in results.items()])
+        text = f"Start all servers {'(dry-run)' if dry_run else ''}:\n{summary}"
         return [TextContent(type="text", text=text)]
+    except RuntimeError as e:
+        return [TextContent(type="text", text=f"Error: {e}")]
+
+
+async def _handle_stop_server(arguments: Dict[str, Any]) -> list[TextContent]:
+    server = arguments["server"]
+    timeout = arguments.get("timeout", 5.0)
+
+    # Try to parse as PID
+    try:
+        server_val = int(server)
+    except ValueError:
+        server_val = server
 
-    elif name == "health_check":
-        server = arguments["server"]
-        ok = cli_handlers.health_check(server)
-        return [TextContent(type="text", text=f"Health check '{server}': {'healthy' if ok else 'unhealthy'}")]
+    result = cli_handlers.stop_server(server_val, timeout=timeout)
+    text = f"Stop server '{server}': ok={result.get('ok')}, pid={result.get('pid')}"
+    if "error" in result:
+        text += f", error={result['error']}"
 
-    elif name == "get_status":
-        await _initialize_service_registry()
+    return [TextContent(type="text", text=text)]
 
-        servers = [p.name for p in cli_handlers._find_server_dirs()]
-        serpapi = cli_handlers._resolve_serpapi_key()
-        pids = cli_handlers.list_registered_pids()
 
-        status_text = f"""Status:
+async def _handle_health_check(arguments: Dict[str, Any]) -> list[TextContent]:
+    server = arguments["server"]
+    ok = cli_handlers.health_check(server)
+    return [TextContent(type="text", text=f"Health check '{server}': {'healthy' if ok else 'unhealthy'}")]
+
+
+async def _handle_get_status(arguments: Dict[str, Any]) -> list[TextContent]:
+    await _initialize_service_registry()
+
+    servers = [p.name for p in cli_handlers._find_server_dirs()]
+    serpapi = cli_handlers._resolve_serpapi_key()
+    pids = cli_handlers.list_registered_pids()
+
+    status_text = f"""Status:
   Discovered servers: {len(servers)} ({', '.join(servers) if servers else 'none'})
-  Integrated services: {len(_SERVICE_REGISTRY)}
-  Available tools: {len(_TOOL_REGISTRY)} subservice tools + 10 control tools
+  Integrated services: {len(_registered_services())} ({len(_SERVICE_REGISTRY)} loaded)
+  Available tools: {len(_TOOL_REGISTRY)} subservice tools + {len(_CONTROL_HANDLERS)} control tools (generation {_tool_list_snapshot().generation})
   SERPAPI_KEY: {'present' if serpapi else 'missing'}
   Running servers: {len(pids)} ({', '.join(pids.keys()) if pids else 'none'})"""
 
-        return [TextContent(type="text", text=status_text)]
+    return [TextContent(type="text", text=status_text)]
 
-    elif name == "list_pids":
-        pids = cli_handlers.list_registered_pids()
-        if not pids:
-            return [TextContent(type="text", text="No registered server PIDs")]
 
-        pid_text = "Registered PIDs:\n"
-        for name, info in pids.items():
-            pid_text += f"  - {name}: PID={info.get('pid')}, started={info.get('started_at')}\n"
+async def _handle_list_pids(arguments: Dict[str, Any]) -> list[TextContent]:
+    pids = cli_handlers.list_registered_pids()
+    if not pids:
+        return [TextContent(type="text", text="No registered server PIDs")]
 
-        return [TextContent(type="text", text=pid_text)]
+    pid_text = "Registered PIDs:\n"
+    for name, info in pids.items():
+        pid_text += f"  - {name}: PID={info.get('pid')}, started={info.get('started_at')}\n"
 
-    elif name == "verify_serpapi_key":
-        timeout = arguments.get("timeout", 10.0)
-        ok, info = cli_handlers.verify_serpapi_key(timeout=timeout)
+    return [TextContent(type="text", text=pid_text)]
 
-        if ok:
-            text = f"SERPAPI_KEY verification: SUCCESS\n  HTTP status: {info.get('http_status')}\n  Response keys: {info.get('keys')}"
-        else:
-            text = f"SERPAPI_KEY verification: FAILED\n  Error: {info.get('error', 'unknown')}"
 
-        return [TextContent(type="text", text=text)]
+async def _handle_verify_serpapi_key(arguments: Dict[str, Any]) -> list[TextContent]:
+    timeout = arguments.get("timeout", 10.0)
+    ok, info = cli_handlers.verify_serpapi_key(timeout=timeout)
 
-    # Subservice tool delegation
-    elif name in _TOOL_REGISTRY:
-        tool_info = _TOOL_REGISTRY[name]
-        mcp_instance = tool_info['mcp_instance']
-        original_name = tool_info['original_name']
+    if ok:
+        text = f"SERPAPI_KEY verification: SUCCESS\n  HTTP status: {info.get('http_status')}\n  Response keys: {info.get('keys')}"
+    else:
+        text = f"SERPAPI_KEY verification: FAILED\n  Error: {info.get('error', 'unknown')}"
+
+    return [TextContent(type="text", text=text)]
+
+
+async def _handle_get_metrics(arguments: Dict[str, Any]) -> list[TextContent]:
+    cache = get_response_cache()
+    result_cache = get_parsed_result_cache()
+    metrics = {
+        "response_cache": cache.stats() if cache is not None else {"enabled": False},
+        "result_cache": result_cache.stats() if result_cache is not None else {"enabled": False},
+        "tool_executor": get_tool_executor().stats(),
+        "tools_generation": _tool_list_snapshot().generation,
+        "service_import_ms": {
+            name: round(seconds * 1000, 1) for name, seconds in _SERVICE_IMPORT_TIMES.items()
+        },
+    }
+
+    return [TextContent(type="text", text=json.dumps(metrics, indent=2))]
+
+
+# Control tool name -> handler; one dict lookup per call in call_tool()
+_CONTROL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[list[TextContent]]]] = {
+    "list_servers": _handle_list_servers,
+    "list_services": _handle_list_services,
+    "get_service_manifest": _handle_get_service_manifest,
+    "start_server": _handle_start_server,
+    "start_all_servers": _handle_start_all_servers,
+    "stop_server": _handle_stop_server,
+    "health_check": _handle_health_check,
+    "get_status": _handle_get_status,
+    "list_pids": _handle_list_pids,
+    "verify_serpapi_key": _handle_verify_serpapi_key,
+    "get_metrics": _handle_get_metrics,
+}
 
-        try:
-            # Delegate to the subservice's MCP instance
-            # FastMCP instances have a call_tool method we can invoke
-            if hasattr(mcp_instance, '_tool_manager') and hasattr(mcp_instance._tool_manager, '_tools'):
-                # Get the actual tool function (may be a FastMCP Tool wrapper) from FastMCP
-                tool_obj = mcp_instance._tool_manager._tools.get(original_name)
-
-                if tool_obj:
-                    LOG.info(f"Delegating {name} -> {tool_info['service']}.{original_name}")
-
-                    result = None
-                    try:
-                        if callable(tool_obj):
-                            # Some tool wrappers are plain callables (may return sync or awaitable)
-                            result = tool_obj(**arguments)
-                            if hasattr(result, '__await__'):
-                                result = await result
-                        elif hasattr(tool_obj, 'run'):
-                            # FastMCP Tool wrapper exposes async run(arguments_dict)
-                            run_result = tool_obj.run(arguments)
-                            if hasattr(run_result, '__await__'):
-                                result = await run_result
-                            else:
-                                result = run_result
-                        else:
-                            return [TextContent(type="text", text=f"Unsupported tool wrapper type for {name}: {type(tool_obj)}")]
-                    except TypeError as e:
-                        # Retry using .run if direct call failed due to signature mismatch
-                        if hasattr(tool_obj, 'run'):
-                            LOG.debug(f"Direct call failed for {name} ({e}); retrying with .run()")
-                            run_result = tool_obj.run(arguments)
-                            result = await run_result if hasattr(run_result, '__await__') else run_result
-                        else:
-                            raise
 
-                    # Convert result to TextContent
-                    import json
-                    if isinstance(result, dict):
-                        result_text = json.dumps(result, indent=2)
-                    else:
-                        result_text = str(result)
+@mcp.call_tool()
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle tool calls for server management and subservice tools."""
 
-                    return [TextContent(type="text", text=result_text)]
-                else:
-                    return [TextContent(type="text", text=f"Tool function not found: {original_name}")]
-            else:
-                return [TextContent(type="text", text=f"Cannot delegate to {tool_info['service']}: unsupported MCP instance")]
+    # Control/Management tools
+    handler = _CONTROL_HANDLERS.get(name)
+    if handler is not None:
+        return await handler(arguments)
 
-        except Exception as e:
-            LOG.exception(f"Error calling subservice tool {name}: {e}")
-            return [TextContent(type="text", text=f"Error executing {name}: {str(e)}")]
+    # Subservice tool delegation
+    tool_info = _TOOL_REGISTRY.get(name)
+    if tool_info is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+    invoker = tool_info.get('invoker') or _bind_invoker(tool_info)
+    LOG.debug("Delegating %s -> %s.%s", name, tool_info['service'], tool_info['original_name'])
+
+    try:
+        result = await invoker(arguments)
+    except Exception as e:
+        LOG.exception(f"Error calling subservice tool {name}: {e}")
+        return [TextContent(type="text", text=f"Error executing {name}: {str(e)}")]
 
+    # Convert result to TextContent
+    if isinstance(result, dict):
+        result_text = json.dumps(result, indent=2)
     else:
-        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        result_text = str(result)
+
+    return [TextContent(type="text", text=result_text)]
+
+
+async def _boot_registry() -> Optional[asyncio.Task]:
+    """Populate the tool registry before serving the first request.
+
+    A current manifest snapshot makes list_tools answerable immediately;
+    unless lazy loading is enabled the services are then imported in the
+    background. Without a usable snapshot the registry is built eagerly and
+    a fresh snapshot is written for the next start.
+
+    Returns:
+        The background warm-up task, if one was started
+    """
+    if _load_manifest_snapshot():
+        if _lazy_loading_enabled():
+            return None
+        return asyncio.create_task(_initialize_service_registry(lazy=False))
+
+    await _initialize_service_registry(lazy=False)
+    try:
+        path = write_manifest(_snapshot_manifest())
+        LOG.info(f"Wrote tool manifest snapshot to {path}")
+    except OSError as e:
+        LOG.warning(f"Could not write tool manifest snapshot: {e}")
+    return None
 
 
 async def serve_mcp():
     """Run the unified MCP server via stdio."""
     LOG.info("Starting unified MCP server...")
+    started = time.perf_counter()
+    # Holds a reference to the background warm-up task while serving
+    warmup = await _boot_registry()
+    LOG.info(f"Tool registry ready in {(time.perf_counter() - started) * 1000:.1f} ms")
     async with stdio_server() as (read_stream, write_stream):
-        await mcp.run(read_stream, write_stream, mcp.create_initialization_options())
+        await mcp.run(
+            read_stream,
+            write_stream,
+            mcp.create_initialization_options(NotificationOptions(tools_changed=True)),
+        )
 
 
 def run_mcp_server():
@@ -0,0 +1,132 @@
+"""Process-wide rate limiters for upstream APIs with usage policies.
+
+``TokenBucket`` implements a token bucket as a reservation schedule (the
+generic cell rate algorithm): each caller reserves the next free slot under
+a lock and then sleeps until it, outside the lock. Callers are therefore
+served in arrival order, the limit holds across threads and asyncio tasks
+sharing one bucket, and nobody polls.
+
+Example Usage:
+    from py_mcp_travelplanner.rate_limit import get_rate_limiter
+
+    limiter = get_rate_limiter("nominatim", rate=1.0)
+
+    limiter.acquire()            # from a worker thread
+    await limiter.acquire_async()  # from a coroutine
+
+    geocode = limiter.wrap(geolocator.geocode)
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Thread- and asyncio-safe token bucket.
+
+    Args:
+        rate: Tokens added per second (sustained calls per second)
+        capacity: Bucket size, i.e. how many calls may burst back to back
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(self, rate: float, capacity: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._interval = 1.0 / rate
+        self._tolerance = self._interval * (capacity - 1)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Theoretical arrival time of the next conforming call
+        self._tat = 0.0
+        self.acquired = 0
+        self.waited_seconds = 0.0
+
+    def reserve(self) -> float:
+        """Reserve the next slot and return how long to wait for it (seconds)."""
+        with self._lock:
+            now = self._clock()
+            tat = max(self._tat, now)
+            wait = max(0.0, tat - self._tolerance - now)
+            self._tat = tat + self._interval
+            self.acquired += 1
+            self.waited_seconds += wait
+        return wait
+
+    def acquire(self) -> float:
+        """Block the calling thread until a token is available; returns the wait."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Suspend the calling task until a token is available; returns the wait."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def wrap(self, fn: Callable[..., T]) -> Callable[..., T]:
+        """Return ``fn`` wrapped so every call first acquires a token."""
+        @functools.wraps(fn)
+        def limited(*args: Any, **kwargs: Any) -> T:
+            self.acquire()
+            return fn(*args, **kwargs)
+        return limited
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "capacity": self.capacity,
+                "acquired": self.acquired,
+                "waited_seconds": round(self.waited_seconds, 3),
+            }
+
+
+# Global rate limiters, keyed on name
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: float, capacity: int = 1) -> TokenBucket:
+    """Return the process-wide limiter for an upstream service.
+
+    ``rate`` and ``capacity`` only apply when the limiter is first created.
+    """
+    limiter = _rate_limiters.get(name)
+    if limiter is None:
+        with _rate_limiters_lock:
+            limiter = _rate_limiters.get(name)
+            if limiter is None:
+                limiter = _rate_limiters[name] = TokenBucket(rate, capacity)
+    return limiter
+
+
+def rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Return ``stats()`` for every limiter created so far."""
+    return {name: limiter.stats() for name, limiter in list(_rate_limiters.items())}
+
+
+def reset_rate_limiters(name: Optional[str] = None) -> None:
+    """Discard one (or all) global rate limiters.
+
+    This is primarily useful for testing.
+    """
+    with _rate_limiters_lock:
+        if name is None:
+            _rate_limiters.clear()
+        else:
+            _rate_limiters.pop(name, None)
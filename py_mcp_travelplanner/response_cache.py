@@ -0,0 +1,281 @@
+"""Content-addressed cache for upstream API responses.
+
+Responses are keyed on a SHA-256 digest of the normalized request
+parameters (sorted, stringified, with credentials such as ``api_key``
+stripped), so identical searches share one entry no matter which key or
+argument order was used to issue them.
+
+The cache has two tiers:
+- an in-memory LRU tier bounded by a byte budget
+- an optional on-disk tier (one JSON file per key) that survives restarts
+
+Every entry carries an expiry derived from a per-engine TTL (for example a
+short TTL for ``google_finance`` quotes and a longer one for
+``google_hotels``). Hit/miss/eviction counters are available via ``stats()``.
+
+Example Usage:
+    from py_mcp_travelplanner.response_cache import get_response_cache
+
+    cache = get_response_cache()
+    data = cache.get(params)
+    if data is None:
+        data = fetch(params)
+        cache.set(params, data)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from .config import get_config
+
+LOG = logging.getLogger("py_mcp_travelplanner.response_cache")
+
+# Request parameters that identify the caller rather than the query
+CREDENTIAL_PARAMS = frozenset({"api_key", "access_key"})
+
+# Default time-to-live (seconds) per SerpAPI engine
+DEFAULT_ENGINE_TTLS: Dict[str, float] = {
+    "google_finance": 60.0,
+    "google_flights": 900.0,
+    "google_events": 3600.0,
+    "google_hotels": 3600.0,
+}
+
+
+def make_cache_key(params: Mapping[str, Any]) -> str:
+    """Return the content address for a set of request parameters.
+
+    Credentials are stripped and values are stringified so that e.g.
+    ``adults=1`` and ``adults="1"`` map to the same entry.
+    """
+    normalized = {
+        str(k): str(v)
+        for k, v in params.items()
+        if k not in CREDENTIAL_PARAMS and v is not None
+    }
+    encoded = json.dumps(normalized, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + optional disk) TTL cache for JSON responses.
+
+    Values are stored as compact JSON bytes and decoded on every hit, so
+    callers always receive a private copy they are free to mutate.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024,
+                 default_ttl: Optional[float] = 900.0,
+                 ttls: Optional[Mapping[str, Optional[float]]] = None,
+                 disk_dir: Optional[str | pathlib.Path] = None,
+                 ttl_param: str = "engine",
+                 clock: Callable[[], float] = time.time):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget for the in-memory tier
+            default_ttl: TTL in seconds for parameters without a specific
+                         TTL; None means entries never expire, 0 disables caching
+            ttls: Mapping of ``params[ttl_param]`` value -> TTL override
+            disk_dir: Directory for the on-disk tier; None disables it
+            ttl_param: Request parameter used to select a TTL (e.g. 'engine')
+            clock: Time source (wall clock seconds), injectable for tests
+        """
+        self.max_bytes = int(max_bytes)
+        self.default_ttl = default_ttl
+        self.ttls: Dict[str, Optional[float]] = dict(ttls or {})
+        self.disk_dir = pathlib.Path(disk_dir) if disk_dir else None
+        self.ttl_param = ttl_param
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at or None, encoded payload)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._counters = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def ttl_for(self, params: Mapping[str, Any]) -> Optional[float]:
+        """Return the TTL that applies to a request."""
+        selector = params.get(self.ttl_param)
+        if selector is not None and str(selector) in self.ttls:
+            return self.ttls[str(selector)]
+        return self.default_ttl
+
+    def get(self, params: Mapping[str, Any]) -> Optional[Any]:
+        """Return the cached value for ``params`` or None on a miss."""
+        key = make_cache_key(params)
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    self._counters["memory_hits"] += 1
+                    return json.loads(payload)
+                self._drop(key)
+                self._counters["expirations"] += 1
+
+        disk_entry = self._read_disk(key, now)
+        with self._lock:
+            if disk_entry is None:
+                self._counters["misses"] += 1
+                return None
+            expires_at, payload = disk_entry
+            self._store(key, expires_at, payload)
+            self._counters["hits"] += 1
+            self._counters["disk_hits"] += 1
+        return json.loads(payload)
+
+    def set(self, params: Mapping[str, Any], value: Any) -> None:
+        """Store ``value`` (JSON-serializable) for ``params``."""
+        ttl = self.ttl_for(params)
+        if ttl is not None and ttl <= 0:
+            return
+
+        key = make_cache_key(params)
+        expires_at = None if ttl is None else self._clock() + ttl
+        payload = json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+        with self._lock:
+            self._store(key, expires_at, payload)
+            self._counters["sets"] += 1
+        self._write_disk(key, expires_at, payload)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the disk tier is left untouched)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "disk_tier": str(self.disk_dir) if self.disk_dir else None,
+            }
+
+    # -- internals (callers hold self._lock) ---------------------------------
+
+    def _store(self, key: str, expires_at: Optional[float], payload: bytes) -> None:
+        if len(payload) > self.max_bytes:
+            # Larger than the whole budget: keep it on disk only
+            return
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (expires_at, payload)
+        self._bytes += len(payload)
+        while self._bytes > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self._counters["evictions"] += 1
+
+    def _drop(self, key: str) -> None:
+        _, payload = self._entries.pop(key)
+        self._bytes -= len(payload)
+
+    # -- disk tier -------------------------------------------------------------
+
+    def _disk_path(self, key: str) -> pathlib.Path:
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str, now: float) -> Optional[Tuple[Optional[float], bytes]]:
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'rb') as f:
+                header = json.loads(f.readline())
+                payload = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOG.debug("Ignoring unreadable cache file %s: %s", path, exc)
+            return None
+
+        expires_at = header.get("expires_at")
+        if expires_at is not None and expires_at <= now:
+            with self._lock:
+                self._counters["expirations"] += 1
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return expires_at, payload
+
+    def _write_disk(self, key: str, expires_at: Optional[float], payload: bytes) -> None:
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(json.dumps({"expires_at": expires_at}).encode('utf-8') + b"\n")
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            LOG.warning("Failed to write cache file %s: %s", path, exc)
+
+
+# Global response cache instance
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide SerpAPI response cache.
+
+    Returns None when caching is disabled via ``RESPONSE_CACHE_ENABLED``.
+    """
+    global _response_cache
+
+    config = get_config()
+    if not config.get('RESPONSE_CACHE_ENABLED', True):
+        return None
+
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                ttls: Dict[str, Optional[float]] = dict(DEFAULT_ENGINE_TTLS)
+                ttls.update(config.get('RESPONSE_CACHE_TTLS') or {})
+                _response_cache = ResponseCache(
+                    max_bytes=int(config.get('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+                    default_ttl=config.get('RESPONSE_CACHE_DEFAULT_TTL', 900.0),
+                    ttls=ttls,
+                    disk_dir=config.get('RESPONSE_CACHE_DIR'),
+                )
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Discard the global response cache instance.
+
+    This is primarily useful for testing.
+    """
+    global _response_cache
+    _response_cache = None
@@ -0,0 +1,587 @@
+"""Storage backends for saved search results.
+
+Every subserver persists the processed result of a search (flights, hotels,
+events, finance) under a ``search_id`` and reads it back for detail, filter
+and listing calls. Two interchangeable backends are provided:
+
+- ``JsonFileResultStore``: one pretty-printed JSON file per search in
+  ``./outputs/<kind>/`` (the historical layout; the default)
+- ``SqliteResultStore``: one table per result kind in a single SQLite
+  database. ``search_id``, the search timestamp, route, location and lowest
+  price are stored in indexed columns next to a zlib-compressed compact
+  JSON payload, so listing and filtering saved searches is an indexed query
+  that never decodes the payloads.
+
+The backend is selected with ``RESULT_STORE_BACKEND`` (``json`` or
+``sqlite``); ``RESULT_STORE_PATH`` sets the database file (default:
+``results.sqlite3`` next to the per-kind output directories). When a SQLite
+table is first created, any JSON files already present in the kind's output
+directory are imported into it.
+
+Parsed documents are kept in a process-wide LRU (``ParsedResultCache``)
+shared by every store, so chained filter/detail calls on the same
+``search_id`` decode the result once. Each entry is validated against the
+stored version (file mtime/size, or the row's update stamp) on every hit and
+the cache is bounded by ``RESULT_CACHE_MAX_BYTES`` of serialized JSON.
+Documents returned by ``load()`` are shared and must be treated as read-only.
+
+Example Usage:
+    from py_mcp_travelplanner.result_store import get_result_store
+
+    store = get_result_store("flights", "./outputs/flights")
+    store.save(search_id, document)
+    document = store.load(search_id)
+    recent = store.list_searches(route="LAX-CDG", max_price=800, limit=20)
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pathlib
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .config import get_config
+
+LOG = logging.getLogger("py_mcp_travelplanner.result_store")
+
+# Summary columns stored (and indexed where useful) for every saved search
+INDEX_COLUMNS = ("search_type", "route", "location", "min_price", "result_count")
+_INDEXED_COLUMNS = ("search_timestamp", "route", "location", "min_price")
+
+DEFAULT_DB_FILENAME = "results.sqlite3"
+
+# Maps a stored document to (a subset of) INDEX_COLUMNS
+IndexFunction = Callable[[Mapping[str, Any]], Dict[str, Any]]
+
+_KIND_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+
+
+def _summarize(search_id: str, document: Mapping[str, Any],
+               index: Optional[IndexFunction]) -> Dict[str, Any]:
+    """Build the summary row (index columns plus metadata) for a document."""
+    metadata = document.get("search_metadata") or {}
+    summary: Dict[str, Any] = {column: None for column in INDEX_COLUMNS}
+    summary["search_type"] = metadata.get("search_type")
+    summary["location"] = metadata.get("location")
+    if index is not None:
+        summary.update({k: v for k, v in index(document).items() if k in INDEX_COLUMNS})
+    summary["search_id"] = search_id
+    summary["search_timestamp"] = metadata.get("search_timestamp")
+    summary["metadata"] = metadata
+    return summary
+
+
+def _matches(summary: Mapping[str, Any], route: Optional[str], location: Optional[str],
+             search_type: Optional[str], min_price: Optional[float],
+             max_price: Optional[float]) -> bool:
+    if route is not None and summary.get("route") != route:
+        return False
+    if location is not None and summary.get("location") != location:
+        return False
+    if search_type is not None and summary.get("search_type") != search_type:
+        return False
+    price = summary.get("min_price")
+    if min_price is not None and (price is None or price < min_price):
+        return False
+    if max_price is not None and (price is None or price > max_price):
+        return False
+    return True
+
+
+# Identifies one stored revision of a search: (stamp, size in bytes)
+Version = Tuple[int, int]
+
+
+class ParsedResultCache:
+    """LRU of parsed search documents, validated against the stored version.
+
+    Entries are charged the size of their serialized JSON; the least
+    recently used ones are evicted once ``max_bytes`` is exceeded.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Version, Dict[str, Any]]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple[str, str], version: Version) -> Optional[Dict[str, Any]]:
+        """Return the cached document for a key if it is still at ``version``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple[str, str], version: Version, document: Dict[str, Any]) -> None:
+        """Cache a parsed document; documents larger than the budget are skipped."""
+        size = version[1]
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (version, document)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (old_version, _) = self._entries.popitem(last=False)
+                self._bytes -= old_version[1]
+                self.evictions += 1
+
+    def invalidate(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _discard(self, key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[0][1]
+
+
+class ResultStore(ABC):
+    """Interface shared by the search result storage backends.
+
+    Args:
+        kind: Result kind, e.g. ``flights`` (one directory or table per kind)
+        index: Optional function deriving index columns from a document;
+               ``search_type`` and ``location`` default to the values in
+               ``search_metadata``
+    """
+
+    def __init__(self, kind: str, index: Optional[IndexFunction] = None):
+        if not _KIND_PATTERN.match(kind):
+            raise ValueError(f"Invalid result kind: {kind!r}")
+        self.kind = kind
+        self.index = index
+        # Distinguishes this store's entries in the shared parsed-result cache
+        self.namespace = kind
+
+    @abstractmethod
+    def save(self, search_id: str, document: Mapping[str, Any]) -> str:
+        """Store (or replace) a search result and return where it was written."""
+
+    @abstractmethod
+    def version(self, search_id: str) -> Optional[Version]:
+        """Return the stamp and serialized size of a stored result, or None."""
+
+    @abstractmethod
+    def _read(self, search_id: str) -> Optional[Tuple[Version, Dict[str, Any]]]:
+        """Read and parse a stored result together with its version."""
+
+    def load(self, search_id: str) -> Optional[Dict[str, Any]]:
+        """Return a stored search result, or None if there is none.
+
+        Served from the shared ``ParsedResultCache`` while the stored
+        version is unchanged; the returned document must not be mutated.
+
+        Raises:
+            ValueError: If the stored result is corrupted
+        """
+        cache = get_parsed_result_cache()
+        if cache is None:
+            found = self._read(search_id)
+            return found[1] if found is not None else None
+
+        version = self.version(search_id)
+        if version is None:
+            return None
+        key = (self.namespace, search_id)
+        document = cache.get(key, version)
+        if document is None:
+            found = self._read(search_id)
+            if found is None:
+                return None
+            version, document = found
+            cache.put(key, version, document)
+        return document
+
+    def _invalidate(self, search_id: str) -> None:
+        cache = get_parsed_result_cache()
+        if cache is not None:
+            cache.invalidate((self.namespace, search_id))
+
+    @abstractmethod
+    def delete(self, search_id: str) -> bool:
+        """Remove a stored search result; returns True if one existed."""
+
+    @abstractmethod
+    def list_searches(self, route: Optional[str] = None, location: Optional[str] = None,
+                      search_type: Optional[str] = None, min_price: Optional[float] = None,
+                      max_price: Optional[float] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List stored searches, newest first, without loading their payloads.
+
+        Each entry holds ``search_id``, ``search_timestamp``, the
+        ``INDEX_COLUMNS`` and the document's ``search_metadata``. Price
+        filters apply to ``min_price`` and exclude searches without one.
+        """
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+class JsonFileResultStore(ResultStore):
+    """One JSON file per search in a directory (``<directory>/<search_id>.json``)."""
+
+    def __init__(self, directory: str | pathlib.Path, kind: str,
+                 index: Optional[IndexFunction] = None):
+        super().__init__(kind, index)
+        self.directory = pathlib.Path(directory)
+        self.namespace = f"json:{self.directory}"
+
+    def _path(self, search_id: str) -> pathlib.Path:
+        return self.directory / f"{search_id}.json"
+
+    def save(self, search_id: str, document: Mapping[str, Any]) -> str:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(search_id)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(document, f, indent=2)
+        os.replace(tmp_path, path)
+        self._invalidate(search_id)
+        return str(path)
+
+    def version(self, search_id: str) -> Optional[Version]:
+        try:
+            stat = self._path(search_id).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self, search_id: str) -> Optional[Tuple[Version, Dict[str, Any]]]:
+        try:
+            with open(self._path(search_id), "rb") as f:
+                stat = os.fstat(f.fileno())
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, len(data)), json.loads(data)
+
+    def delete(self, search_id: str) -> bool:
+        self._invalidate(search_id)
+        try:
+            self._path(search_id).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def list_searches(self, route: Optional[str] = None, location: Optional[str] = None,
+                      search_type: Optional[str] = None, min_price: Optional[float] = None,
+                      max_price: Optional[float] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        if not self.directory.is_dir():
+            return []
+
+        searches = []
+        for path in self.directory.glob("*.json"):
+            try:
+                with open(path, "r") as f:
+                    document = json.load(f)
+                summary = _summarize(path.stem, document, self.index)
+            except (OSError, ValueError, AttributeError, TypeError):
+                continue
+            if _matches(summary, route, location, search_type, min_price, max_price):
+                searches.append(summary)
+
+        searches.sort(key=lambda s: s["search_timestamp"] or "", reverse=True)
+        return searches[:limit] if limit is not None else searches
+
+
+class SqliteResultStore(ResultStore):
+    """One table per result kind in a SQLite database, with indexed summary columns.
+
+    Args:
+        path: Database file (shared by all kinds)
+        kind: Result kind; also the table name
+        index: See ``ResultStore``
+        legacy_dir: Directory of JSON files imported when the table is created
+    """
+
+    def __init__(self, path: str | pathlib.Path, kind: str,
+                 index: Optional[IndexFunction] = None,
+                 legacy_dir: Optional[str | pathlib.Path] = None):
+        super().__init__(kind, index)
+        self.path = pathlib.Path(path)
+        self.namespace = f"sqlite:{self.path}:{kind}"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        created = self._create_schema()
+        if created and legacy_dir is not None:
+            self.import_directory(legacy_dir)
+
+    def _create_schema(self) -> bool:
+        table = self.kind
+        with self._lock, self._conn:
+            exists = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{table}" ('
+                " search_id TEXT PRIMARY KEY,"
+                " search_timestamp TEXT,"
+                " search_type TEXT,"
+                " route TEXT,"
+                " location TEXT,"
+                " min_price REAL,"
+                " result_count INTEGER,"
+                " metadata TEXT NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " payload_size INTEGER NOT NULL DEFAULT 0,"
+                " updated_ns INTEGER NOT NULL DEFAULT 0)"
+            )
+            columns = {row[1] for row in self._conn.execute(f'PRAGMA table_info("{table}")')}
+            for column in ("payload_size", "updated_ns"):
+                if column not in columns:
+                    self._conn.execute(
+                        f'ALTER TABLE "{table}" ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0'
+                    )
+            for column in _INDEXED_COLUMNS:
+                self._conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS "{table}_{column}" ON "{table}" ({column})'
+                )
+        return exists is None
+
+    def _row(self, search_id: str, document: Mapping[str, Any]) -> Tuple[Any, ...]:
+        summary = _summarize(search_id, document, self.index)
+        encoded = json.dumps(document, separators=(',', ':')).encode('utf-8')
+        return (
+            search_id,
+            summary["search_timestamp"],
+            summary["search_type"],
+            summary["route"],
+            summary["location"],
+            summary["min_price"],
+            summary["result_count"],
+            json.dumps(summary["metadata"], separators=(',', ':')),
+            zlib.compress(encoded),
+            len(encoded),
+            time.time_ns(),
+        )
+
+    def _write_rows(self, rows: List[Tuple[Any, ...]]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f'INSERT OR REPLACE INTO "{self.kind}" (search_id, search_timestamp, search_type,'
+                " route, location, min_price, result_count, metadata, payload, payload_size,"
+                " updated_ns) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        for row in rows:
+            self._invalidate(row[0])
+
+    def save(self, search_id: str, document: Mapping[str, Any]) -> str:
+        self._write_rows([self._row(search_id, document)])
+        return f"{self.path}#{self.kind}/{search_id}"
+
+    def version(self, search_id: str) -> Optional[Version]:
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT updated_ns, payload_size FROM "{self.kind}" WHERE search_id = ?',
+                (search_id,),
+            ).fetchone()
+        return (row[0], row[1]) if row is not None else None
+
+    def _read(self, search_id: str) -> Optional[Tuple[Version, Dict[str, Any]]]:
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT updated_ns, payload_size, payload FROM "{self.kind}" WHERE search_id = ?',
+                (search_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return (row[0], row[1]), json.loads(zlib.decompress(row[2]))
+        except zlib.error as exc:
+            raise ValueError(f"Corrupted payload: {exc}") from exc
+
+    def delete(self, search_id: str) -> bool:
+        self._invalidate(search_id)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f'DELETE FROM "{self.kind}" WHERE search_id = ?', (search_id,)
+            )
+        return cursor.rowcount > 0
+
+    def list_searches(self, route: Optional[str] = None, location: Optional[str] = None,
+                      search_type: Optional[str] = None, min_price: Optional[float] = None,
+                      max_price: Optional[float] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        clauses = []
+        params: List[Any] = []
+        for column, value in (("route", route), ("location", location), ("search_type", search_type)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if min_price is not None:
+            clauses.append("min_price >= ?")
+            params.append(min_price)
+        if max_price is not None:
+            clauses.append("min_price <= ?")
+            params.append(max_price)
+
+        sql = (f"SELECT search_id, search_timestamp, {', '.join(INDEX_COLUMNS)}, metadata"
+               f' FROM "{self.kind}"')
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY search_timestamp DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        searches = []
+        for row in rows:
+            summary = dict(zip(("search_id", "search_timestamp") + INDEX_COLUMNS, row[:-1]))
+            summary["metadata"] = json.loads(row[-1])
+            searches.append(summary)
+        return searches
+
+    def import_directory(self, directory: str | pathlib.Path) -> int:
+        """Import ``<search_id>.json`` files (the JSON backend layout).
+
+        Returns:
+            Number of searches imported
+        """
+        source = pathlib.Path(directory)
+        if not source.is_dir():
+            return 0
+
+        rows = []
+        for path in source.glob("*.json"):
+            try:
+                with open(path, "r") as f:
+                    rows.append(self._row(path.stem, json.load(f)))
+            except (OSError, ValueError, AttributeError, TypeError) as exc:
+                LOG.warning("Skipping unreadable search result %s: %s", path, exc)
+        if rows:
+            self._write_rows(rows)
+            LOG.info("Imported %d %s searches from %s into %s", len(rows), self.kind, source, self.path)
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Global parsed-result cache instance
+_parsed_result_cache: Optional[ParsedResultCache] = None
+_parsed_result_cache_lock = threading.Lock()
+
+
+def get_parsed_result_cache() -> Optional[ParsedResultCache]:
+    """Return the process-wide parsed-result cache.
+
+    Returns None when ``RESULT_CACHE_MAX_BYTES`` is 0.
+    """
+    global _parsed_result_cache
+
+    if _parsed_result_cache is None:
+        max_bytes = int(get_config().get('RESULT_CACHE_MAX_BYTES', 64 * 1024 * 1024) or 0)
+        if max_bytes <= 0:
+            return None
+        with _parsed_result_cache_lock:
+            if _parsed_result_cache is None:
+                _parsed_result_cache = ParsedResultCache(max_bytes=max_bytes)
+    return _parsed_result_cache
+
+
+def reset_parsed_result_cache() -> None:
+    """Discard the global parsed-result cache instance.
+
+    This is primarily useful for testing.
+    """
+    global _parsed_result_cache
+    _parsed_result_cache = None
+
+
+# Global result store instances, keyed on (backend, kind, location)
+_result_stores: Dict[Tuple[str, str, str], ResultStore] = {}
+_result_stores_lock = threading.Lock()
+
+
+def get_result_store(kind: str, directory: str | pathlib.Path,
+                     index: Optional[IndexFunction] = None) -> ResultStore:
+    """Return the process-wide result store for a kind of search result.
+
+    Args:
+        kind: Result kind (``flights``, ``hotels``, ...)
+        directory: Output directory of the kind; used by the JSON backend and
+                   as the legacy import source (and default database
+                   location) of the SQLite backend
+        index: See ``ResultStore``; only used when the store is first created
+
+    Raises:
+        ValueError: If ``RESULT_STORE_BACKEND`` names an unknown backend
+    """
+    config = get_config()
+    backend = str(config.get('RESULT_STORE_BACKEND') or 'json').lower()
+    directory = os.path.abspath(directory)
+
+    if backend == 'json':
+        location = directory
+    elif backend == 'sqlite':
+        location = os.path.abspath(
+            config.get('RESULT_STORE_PATH')
+            or os.path.join(os.path.dirname(directory), DEFAULT_DB_FILENAME)
+        )
+    else:
+        raise ValueError(f"Unknown RESULT_STORE_BACKEND: {backend!r} (expected 'json' or 'sqlite')")
+
+    key = (backend, kind, location)
+    store = _result_stores.get(key)
+    if store is None:
+        with _result_stores_lock:
+            store = _result_stores.get(key)
+            if store is None:
+                if backend == 'sqlite':
+                    store = SqliteResultStore(location, kind, index=index, legacy_dir=directory)
+                else:
+                    store = JsonFileResultStore(location, kind, index=index)
+                _result_stores[key] = store
+    return store
+
+
+def reset_result_stores() -> None:
+    """Close and discard the global result store instances.
+
+    This is primarily useful for testing.
+    """
+    with _result_stores_lock:
+        for store in _result_stores.values():
+            store.close()
+        _result_stores.clear()
@@ -0,0 +1,202 @@
+"""Bounded executor for synchronous subservice tools.
+
+The unified MCP server runs on a single asyncio event loop. Synchronous
+tools (for example the geopy-based geocoder tools, or the file-backed filter
+tools) would block that loop for their whole duration, stalling every other
+in-flight request. ``ToolExecutor`` runs them on a bounded thread pool
+instead, with:
+
+- a global worker cap (``TOOL_EXECUTOR_MAX_WORKERS``)
+- a per-service concurrency limit (``TOOL_EXECUTOR_SERVICE_LIMIT`` by default,
+  overridable per service via ``TOOL_EXECUTOR_SERVICE_LIMITS``) so a slow
+  service cannot occupy every worker
+- queue-depth / running / completed counters, globally and per service
+
+Example Usage:
+    from py_mcp_travelplanner.tool_executor import get_tool_executor
+
+    result = await get_tool_executor().run("geocoder_server", batch_geocode, locations)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from .config import get_config
+
+LOG = logging.getLogger("py_mcp_travelplanner.tool_executor")
+
+
+class ToolExecutor:
+    """Run blocking callables on a bounded pool with per-service limits."""
+
+    def __init__(self, max_workers: int = 8,
+                 default_service_limit: int = 4,
+                 service_limits: Optional[Mapping[str, int]] = None):
+        """Initialize the executor.
+
+        Args:
+            max_workers: Number of worker threads shared by all services
+            default_service_limit: Concurrent calls allowed per service
+            service_limits: Per-service overrides of default_service_limit
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.default_service_limit = max(1, int(default_service_limit))
+        self.service_limits: Dict[str, int] = {
+            name: max(1, int(limit)) for name, limit in (service_limits or {}).items()
+        }
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="mcp-tool",
+        )
+        # asyncio.Semaphore binds to the loop it is first used on
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._services: Dict[str, Dict[str, int]] = {}
+
+    def limit_for(self, service: str) -> int:
+        """Return the concurrency limit that applies to ``service``."""
+        return self.service_limits.get(service, self.default_service_limit)
+
+    def _semaphore(self, service: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        per_loop = self._semaphores.setdefault(loop, {})
+        semaphore = per_loop.get(service)
+        if semaphore is None:
+            semaphore = per_loop[service] = asyncio.Semaphore(self.limit_for(service))
+        return semaphore
+
+    def _counters(self, service: str) -> Dict[str, int]:
+        # Callers hold self._lock
+        counters = self._services.get(service)
+        if counters is None:
+            counters = self._services[service] = {
+                "queued": 0, "running": 0, "completed": 0, "failed": 0,
+            }
+        return counters
+
+    async def run(self, service: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn(*args, **kwargs)`` on the pool and await its result.
+
+        Args:
+            service: Service name used for the concurrency limit and metrics
+            fn: Blocking callable
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Whatever fn returns (exceptions propagate to the caller)
+        """
+        with self._lock:
+            self._counters(service)["queued"] += 1
+
+        def _invoke() -> Any:
+            with self._lock:
+                counters = self._counters(service)
+                counters["queued"] -= 1
+                counters["running"] += 1
+            ok = False
+            try:
+                result = fn(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                with self._lock:
+                    counters = self._counters(service)
+                    counters["running"] -= 1
+                    counters["completed" if ok else "failed"] += 1
+
+        semaphore = self._semaphore(service)
+        loop = asyncio.get_running_loop()
+
+        def _release(future: "Future[Any]") -> None:
+            # Runs once the pool is done with the call (on the worker thread),
+            # so a cancelled caller keeps its service slot until fn returns
+            if future.cancelled():
+                # A cancelled pool future never ran _invoke, so it is still queued
+                with self._lock:
+                    self._counters(service)["queued"] -= 1
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                pass  # Loop already closed; its semaphores went with it
+
+        started = False
+        try:
+            await semaphore.acquire()
+            try:
+                future = self._pool.submit(_invoke)
+            except BaseException:
+                semaphore.release()
+                raise
+            future.add_done_callback(_release)
+            started = True
+            return await asyncio.wrap_future(future)
+        finally:
+            if not started:
+                # Cancelled while waiting for a service slot (or the pool is shut down)
+                with self._lock:
+                    self._counters(service)["queued"] -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return global and per-service queue depth and throughput counters."""
+        with self._lock:
+            services = {
+                name: {**counters, "limit": self.limit_for(name)}
+                for name, counters in self._services.items()
+            }
+        totals = {
+            key: sum(s[key] for s in services.values())
+            for key in ("queued", "running", "completed", "failed")
+        }
+        return {
+            "max_workers": self.max_workers,
+            "default_service_limit": self.default_service_limit,
+            **totals,
+            "services": services,
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work and release the worker threads."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global executor instance
+_tool_executor: Optional[ToolExecutor] = None
+_tool_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> ToolExecutor:
+    """Return the process-wide tool executor, creating it on first use."""
+    global _tool_executor
+
+    if _tool_executor is None:
+        with _tool_executor_lock:
+            if _tool_executor is None:
+                config = get_config()
+                _tool_executor = ToolExecutor(
+                    max_workers=int(config.get('TOOL_EXECUTOR_MAX_WORKERS', 8)),
+                    default_service_limit=int(config.get('TOOL_EXECUTOR_SERVICE_LIMIT', 4)),
+                    service_limits=config.get('TOOL_EXECUTOR_SERVICE_LIMITS') or {},
+                )
+                LOG.debug("Created tool executor with %d workers", _tool_executor.max_workers)
+    return _tool_executor
+
+
+def reset_tool_executor() -> None:
+    """Shut down and discard the global tool executor.
+
+    This is primarily useful for testing.
+    """
+    global _tool_executor
+
+    with _tool_executor_lock:
+        if _tool_executor is not None:
+            _tool_executor.shutdown()
+        _tool_executor = None
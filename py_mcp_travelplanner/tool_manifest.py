@@ -0,0 +1,236 @@
+"""Static tool manifest for the unified MCP server.
+
+The manifest records every subservice tool the unified server exposes
+(namespaced name, description, normalized input schema) together with the
+module that implements it. The unified server loads it at boot so
+``list_tools`` is answered without importing any subservice; with
+``UNIFIED_LAZY_LOADING`` enabled a subservice module is only imported when
+one of its tools is first called.
+
+Each manifest is versioned and fingerprints the source of every module it
+describes (mtime, size and SHA-256) plus the installed ``mcp`` version that
+generated the schemas. ``load_manifest()`` rejects a snapshot as soon as any
+of these no longer match, so an edited tool signature never serves a stale
+schema. The size/mtime check is the fast path; the hash is only computed
+when the mtime changed (e.g. after a fresh checkout).
+
+The manifest is produced by running the normal (eager) registry
+initialization once and serializing the result:
+
+    python -m py_mcp_travelplanner.tool_manifest
+    # or
+    py_mcp_travelplanner build-manifest
+
+Example Usage:
+    from py_mcp_travelplanner.tool_manifest import load_manifest, manifest_entries
+
+    manifest = load_manifest()
+    if manifest is not None:
+        for tool_info in manifest_entries(manifest):
+            print(tool_info['namespaced_name'])
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import pathlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+from .config import get_config
+
+LOG = logging.getLogger("py_mcp_travelplanner.tool_manifest")
+
+# Bump when the manifest layout changes; older files are ignored
+MANIFEST_VERSION = 2
+
+PACKAGE_DIR = pathlib.Path(__file__).resolve().parent
+DEFAULT_MANIFEST_PATH = PACKAGE_DIR / "tool_manifest.json"
+
+
+def manifest_path() -> pathlib.Path:
+    """Return the configured manifest location (``UNIFIED_MANIFEST_PATH``)."""
+    configured = get_config().get('UNIFIED_MANIFEST_PATH')
+    return pathlib.Path(configured) if configured else DEFAULT_MANIFEST_PATH
+
+
+def _mcp_version() -> Optional[str]:
+    try:
+        return importlib.metadata.version("mcp")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def module_file(module_path: str) -> pathlib.Path:
+    """Return the source file of a package module without importing it."""
+    return PACKAGE_DIR.parent.joinpath(*module_path.split('.')).with_suffix('.py')
+
+
+def _sha256(path: pathlib.Path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def fingerprint_module(module_path: str) -> Dict[str, Any]:
+    """Return the mtime/size/hash fingerprint of a module's source file."""
+    path = module_file(module_path)
+    stat = path.stat()
+    return {
+        "file": str(path.relative_to(PACKAGE_DIR)),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": _sha256(path),
+    }
+
+
+def stale_reason(manifest: Mapping[str, Any],
+                 expected_services: Optional[Iterable[str]] = None) -> Optional[str]:
+    """Explain why a manifest no longer matches the installed code, or None.
+
+    Args:
+        manifest: Manifest document
+        expected_services: Services that should be present (e.g. the ones
+                           discovered on disk); None skips this check
+    """
+    if manifest.get("mcp_version") != _mcp_version():
+        return f"generated with mcp {manifest.get('mcp_version')}, running {_mcp_version()}"
+
+    services = manifest.get("services", {})
+    discovered = manifest.get("discovered", list(services))
+    if expected_services is not None and set(expected_services) != set(discovered):
+        return "set of subservices changed"
+
+    for service_name, service in services.items():
+        recorded = service.get("fingerprint") or {}
+        path = module_file(service["module"])
+        try:
+            stat = path.stat()
+        except OSError:
+            return f"{service_name} module missing"
+        if stat.st_size != recorded.get("size"):
+            return f"{service_name} module changed"
+        if stat.st_mtime_ns != recorded.get("mtime_ns") and _sha256(path) != recorded.get("sha256"):
+            return f"{service_name} module changed"
+    return None
+
+
+def build_manifest(tool_registry: Mapping[str, Dict[str, Any]],
+                   module_paths: Mapping[str, str],
+                   discovered: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Serialize a populated tool registry into a manifest document.
+
+    Args:
+        tool_registry: Namespaced tool name -> tool info (as built by mcp_server)
+        module_paths: Service name -> importable module path
+        discovered: All services found on disk, including ones that failed to
+                    load (defaults to the services present in the registry)
+
+    Returns:
+        JSON-serializable manifest dict
+    """
+    services: Dict[str, Dict[str, Any]] = {}
+    for tool_info in tool_registry.values():
+        service_name = tool_info['service']
+        if service_name not in services:
+            services[service_name] = {
+                "module": module_paths[service_name],
+                "fingerprint": fingerprint_module(module_paths[service_name]),
+                "tools": [],
+            }
+        service = services[service_name]
+        service["tools"].append({
+            "name": tool_info['original_name'],
+            "namespaced_name": tool_info['namespaced_name'],
+            "description": tool_info['description'],
+            "schema": tool_info['schema'],
+        })
+
+    return {
+        "version": MANIFEST_VERSION,
+        "generated_at": datetime.now().isoformat(),
+        "mcp_version": _mcp_version(),
+        "discovered": sorted(discovered if discovered is not None else services),
+        "services": services,
+    }
+
+
+def write_manifest(manifest: Dict[str, Any], path: Optional[str | pathlib.Path] = None) -> pathlib.Path:
+    """Atomically write a manifest document and return its path."""
+    target = pathlib.Path(path) if path else manifest_path()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, target)
+    return target
+
+
+def load_manifest(path: Optional[str | pathlib.Path] = None,
+                  validate: bool = True,
+                  expected_services: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+    """Load a manifest document, or return None if it is missing, unusable or stale.
+
+    Args:
+        path: Manifest location; defaults to ``manifest_path()``
+        validate: Reject the manifest if its module fingerprints are stale
+        expected_services: Passed to ``stale_reason()``
+    """
+    source = pathlib.Path(path) if path else manifest_path()
+    try:
+        with open(source, 'r') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        LOG.debug("Tool manifest not found: %s", source)
+        return None
+    except (OSError, ValueError) as exc:
+        LOG.warning("Ignoring unreadable tool manifest %s: %s", source, exc)
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        LOG.warning("Ignoring tool manifest %s with unsupported version", source)
+        return None
+
+    if validate:
+        reason = stale_reason(manifest, expected_services)
+        if reason:
+            LOG.info("Ignoring stale tool manifest %s: %s", source, reason)
+            return None
+    return manifest
+
+
+def manifest_entries(manifest: Mapping[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield registry-style tool info dicts (without an MCP instance)."""
+    for service_name, service in manifest.get("services", {}).items():
+        for tool in service.get("tools", []):
+            yield {
+                'service': service_name,
+                'original_name': tool['name'],
+                'namespaced_name': tool['namespaced_name'],
+                'description': tool.get('description', ''),
+                'schema': tool.get('schema', {}),
+                'module_path': service['module'],
+                'mcp_instance': None,
+            }
+
+
+async def generate_manifest(path: Optional[str | pathlib.Path] = None) -> pathlib.Path:
+    """Import every subservice, build the registry eagerly and write the manifest."""
+    from . import mcp_server
+
+    await mcp_server._initialize_service_registry(lazy=False)
+    return write_manifest(mcp_server._snapshot_manifest(), path)
+
+
+def main(path: Optional[str | pathlib.Path] = None) -> int:
+    """Build step: write a fresh manifest (used by ``build-manifest``)."""
+    target = asyncio.run(generate_manifest(path))
+    print(f"Tool manifest written to: {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
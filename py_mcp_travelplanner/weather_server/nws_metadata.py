@@ -0,0 +1,113 @@
+"""Long-lived cache of National Weather Service grid metadata.
+
+Every forecast or observation request starts from ``/points/{lat},{lon}``
+(which maps a coordinate to its forecast office, grid X/Y and station list
+URL) and current conditions additionally need the grid's observation
+station list. Both change only when NWS redraws its grids, so they are
+cached for a long time:
+
+- point metadata is keyed on the coordinate rounded to ``NWS_POINT_DECIMALS``
+  decimals (NWS itself redirects requests with more than 4 decimals) and
+  kept for ``NWS_POINT_CACHE_TTL`` seconds
+- station lists are keyed on the grid's ``observationStations`` URL and
+  kept for ``NWS_STATIONS_CACHE_TTL`` seconds
+
+Entries live in a ``ResponseCache`` (memory LRU plus an on-disk tier), so
+they survive server restarts.
+
+Example Usage:
+    from py_mcp_travelplanner.weather_server.nws_metadata import (
+        get_nws_metadata_cache, point_params,
+    )
+
+    cache = get_nws_metadata_cache("./outputs/nws_metadata")
+    params = point_params(39.7456, -97.0892)
+    metadata = cache.get(params)
+    if metadata is None:
+        metadata = parse(fetch(f"/points/{params['point']}"))
+        cache.set(params, metadata)
+"""
+from __future__ import annotations
+
+import os
+import pathlib
+import threading
+from typing import Dict, Optional
+
+from py_mcp_travelplanner.config import get_config
+from py_mcp_travelplanner.response_cache import ResponseCache
+
+DEFAULT_POINT_TTL = 30 * 24 * 3600.0
+DEFAULT_STATIONS_TTL = 7 * 24 * 3600.0
+DEFAULT_POINT_DECIMALS = 4
+
+POINT = "point"
+STATIONS = "stations"
+
+
+def point_params(latitude: float, longitude: float,
+                 decimals: Optional[int] = None) -> Dict[str, str]:
+    """Return the cache parameters for a coordinate's point metadata.
+
+    ``params["point"]`` is the rounded ``lat,lon`` string, which is also the
+    form the ``/points`` endpoint expects.
+    """
+    if decimals is None:
+        decimals = int(get_config().get('NWS_POINT_DECIMALS', DEFAULT_POINT_DECIMALS))
+
+    def fmt(value: float) -> str:
+        text = f"{round(float(value), decimals) + 0.0:.{decimals}f}"
+        return text.rstrip("0").rstrip(".") if "." in text else text
+
+    return {"kind": POINT, "point": f"{fmt(latitude)},{fmt(longitude)}"}
+
+
+def stations_params(stations_url: str) -> Dict[str, str]:
+    """Return the cache parameters for a grid's observation station list."""
+    return {"kind": STATIONS, "url": stations_url}
+
+
+# Global NWS metadata cache instances, keyed on disk directory
+_nws_metadata_caches: Dict[str, ResponseCache] = {}
+_nws_metadata_caches_lock = threading.Lock()
+
+
+def get_nws_metadata_cache(default_dir: str | pathlib.Path) -> Optional[ResponseCache]:
+    """Return the process-wide NWS metadata cache.
+
+    Args:
+        default_dir: On-disk tier directory used unless ``NWS_METADATA_CACHE_DIR`` is set
+
+    Returns None when caching is disabled via ``NWS_METADATA_CACHE_ENABLED``.
+    """
+    config = get_config()
+    if not config.get('NWS_METADATA_CACHE_ENABLED', True):
+        return None
+
+    disk_dir = os.path.abspath(config.get('NWS_METADATA_CACHE_DIR') or default_dir)
+    cache = _nws_metadata_caches.get(disk_dir)
+    if cache is None:
+        with _nws_metadata_caches_lock:
+            cache = _nws_metadata_caches.get(disk_dir)
+            if cache is None:
+                cache = ResponseCache(
+                    max_bytes=8 * 1024 * 1024,
+                    default_ttl=float(config.get('NWS_POINT_CACHE_TTL', DEFAULT_POINT_TTL)),
+                    ttls={
+                        POINT: float(config.get('NWS_POINT_CACHE_TTL', DEFAULT_POINT_TTL)),
+                        STATIONS: float(config.get('NWS_STATIONS_CACHE_TTL', DEFAULT_STATIONS_TTL)),
+                    },
+                    disk_dir=disk_dir,
+                    ttl_param="kind",
+                )
+                _nws_metadata_caches[disk_dir] = cache
+    return cache
+
+
+def reset_nws_metadata_caches() -> None:
+    """Discard the global NWS metadata cache instances.
+
+    This is primarily useful for testing.
+    """
+    with _nws_metadata_caches_lock:
+        _nws_metadata_caches.clear()
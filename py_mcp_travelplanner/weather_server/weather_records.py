@@ -0,0 +1,264 @@
+"""Typed weather records shared by the NWS and Weatherstack servers.
+
+Upstream numbers are parsed once, when a response is ingested, into
+slotted dataclasses holding floats and unit enums. Tools compare, filter
+and aggregate on those fields directly, results are persisted through
+``to_dict()`` (numbers plus unit codes, ``None`` fields omitted), and
+display strings such as ``"23°C"`` or ``"5 to 10 mph"`` are produced only
+by ``render()`` when a resource or prompt formats text for people.
+
+Example Usage:
+    from py_mcp_travelplanner.weather_server.weather_records import (
+        CurrentWeather, ForecastPeriod,
+    )
+
+    current = CurrentWeather.from_weatherstack(response["current"], units="m")
+    current.temperature              # 23.0
+    current.render()["temperature"]  # "23°C"
+
+    period = ForecastPeriod.from_nws(response["properties"]["periods"][0])
+    period.wind_speed_max            # 10.0 (from "5 to 10 mph")
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+_SPEED = re.compile(r"(\d+(?:\.\d+)?)(?:\s*to\s*(\d+(?:\.\d+)?))?\s*(mph|km/h|kmh|kph)?", re.IGNORECASE)
+
+
+class TemperatureUnit(str, Enum):
+    CELSIUS = "C"
+    FAHRENHEIT = "F"
+    KELVIN = "K"
+
+    def format(self, value: Optional[float]) -> str:
+        if value is None:
+            return "N/A"
+        return f"{value:g}K" if self is TemperatureUnit.KELVIN else f"{value:g}°{self.value}"
+
+
+class SpeedUnit(str, Enum):
+    KMH = "km/h"
+    MPH = "mph"
+
+    def convert(self, value: float, to: "SpeedUnit") -> float:
+        """Convert a speed in this unit to another unit."""
+        if self is to:
+            return value
+        return value / 1.609344 if to is SpeedUnit.MPH else value * 1.609344
+
+
+class DistanceUnit(str, Enum):
+    KM = "km"
+    MILES = "miles"
+
+
+class UnitSystem(str, Enum):
+    """Weatherstack ``units`` parameter values."""
+
+    METRIC = "m"
+    FAHRENHEIT = "f"
+    SCIENTIFIC = "s"
+
+    @property
+    def temperature(self) -> TemperatureUnit:
+        return {"m": TemperatureUnit.CELSIUS, "f": TemperatureUnit.FAHRENHEIT,
+                "s": TemperatureUnit.KELVIN}[self.value]
+
+    @property
+    def speed(self) -> SpeedUnit:
+        return SpeedUnit.MPH if self is UnitSystem.FAHRENHEIT else SpeedUnit.KMH
+
+    @property
+    def distance(self) -> DistanceUnit:
+        return DistanceUnit.MILES if self is UnitSystem.FAHRENHEIT else DistanceUnit.KM
+
+    def labels(self) -> Dict[str, str]:
+        """Return the unit of every measurement, for clients reading bare numbers."""
+        return {
+            "temperature": self.temperature.value,
+            "speed": self.speed.value,
+            "distance": self.distance.value,
+            "pressure": "mb",
+        }
+
+
+def _float(value: Any) -> Optional[float]:
+    """Return a numeric field as a float, or None if it is missing or not numeric."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_wind_speed(text: Optional[str]) -> Tuple[Optional[float], Optional[float], Optional[SpeedUnit]]:
+    """Parse an NWS wind speed such as ``"10 mph"`` or ``"5 to 10 mph"`` into (min, max, unit)."""
+    match = _SPEED.search(text or "")
+    if match is None:
+        return None, None, None
+    low = float(match.group(1))
+    high = float(match.group(2)) if match.group(2) else low
+    unit = (match.group(3) or "mph").lower()
+    return low, high, SpeedUnit.MPH if unit == "mph" else SpeedUnit.KMH
+
+
+class _Record:
+    """``to_dict()`` for slotted dataclasses: enums become their codes, None fields are dropped."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is not None:
+                data[field.name] = value.value if isinstance(value, Enum) else value
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class CurrentWeather(_Record):
+    """Current conditions reported by Weatherstack, in one unit system."""
+
+    units: UnitSystem
+    temperature: Optional[float] = None
+    feels_like: Optional[float] = None
+    humidity: Optional[float] = None
+    wind_speed: Optional[float] = None
+    wind_direction: Optional[str] = None
+    pressure: Optional[float] = None
+    visibility: Optional[float] = None
+    uv_index: Optional[float] = None
+    cloud_cover: Optional[float] = None
+    description: Optional[str] = None
+
+    @classmethod
+    def from_weatherstack(cls, current: Mapping[str, Any], units: str | UnitSystem) -> "CurrentWeather":
+        """Build a record from a Weatherstack ``current`` block."""
+        descriptions = current.get("weather_descriptions") or [None]
+        return cls(
+            units=UnitSystem(units),
+            temperature=_float(current.get("temperature")),
+            feels_like=_float(current.get("feelslike")),
+            humidity=_float(current.get("humidity")),
+            wind_speed=_float(current.get("wind_speed")),
+            wind_direction=current.get("wind_dir") or None,
+            pressure=_float(current.get("pressure")),
+            visibility=_float(current.get("visibility")),
+            uv_index=_float(current.get("uv_index")),
+            cloud_cover=_float(current.get("cloudcover")),
+            description=descriptions[0],
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], units: str | UnitSystem = UnitSystem.METRIC) -> "CurrentWeather":
+        """Rebuild a record from ``to_dict()`` output (or a raw Weatherstack block in older files)."""
+        if "feelslike" in data or "weather_descriptions" in data:
+            return cls.from_weatherstack(data, data.get("units", units))
+        values = {field.name: data.get(field.name) for field in fields(cls) if field.name != "units"}
+        return cls(units=UnitSystem(data.get("units", units)), **values)
+
+    def render(self) -> Dict[str, Any]:
+        """Return display strings for every measurement."""
+        def text(value: Optional[float], suffix: str = "") -> str:
+            return "N/A" if value is None else f"{value:g}{suffix}"
+
+        temperature = self.units.temperature
+        return {
+            "temperature": temperature.format(self.temperature),
+            "description": self.description or "N/A",
+            "feels_like": temperature.format(self.feels_like),
+            "humidity": text(self.humidity, "%"),
+            "wind": f"{text(self.wind_speed, ' ' + self.units.speed.value)} {self.wind_direction or ''}".strip(),
+            "pressure": text(self.pressure, " mb"),
+            "visibility": text(self.visibility, " " + self.units.distance.value),
+            "uv_index": text(self.uv_index),
+            "cloud_cover": text(self.cloud_cover, "%"),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ForecastPeriod(_Record):
+    """One period of an NWS daily or hourly forecast."""
+
+    number: Optional[int] = None
+    name: Optional[str] = None
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    is_daytime: Optional[bool] = None
+    temperature: Optional[float] = None
+    temperature_unit: Optional[TemperatureUnit] = None
+    temperature_trend: Optional[str] = None
+    probability_of_precipitation: Optional[float] = None
+    dewpoint: Optional[float] = None
+    relative_humidity: Optional[float] = None
+    wind_speed_min: Optional[float] = None
+    wind_speed_max: Optional[float] = None
+    wind_speed_unit: Optional[SpeedUnit] = None
+    wind_direction: Optional[str] = None
+    icon: Optional[str] = None
+    short_forecast: Optional[str] = None
+    detailed_forecast: Optional[str] = None
+
+    @classmethod
+    def from_nws(cls, period: Mapping[str, Any]) -> "ForecastPeriod":
+        """Build a record from an NWS forecast ``periods`` entry."""
+        wind_min, wind_max, wind_unit = parse_wind_speed(period.get("windSpeed"))
+        temperature_unit = period.get("temperatureUnit")
+        return cls(
+            number=period.get("number"),
+            name=period.get("name"),
+            start_time=period.get("startTime"),
+            end_time=period.get("endTime"),
+            is_daytime=period.get("isDaytime"),
+            temperature=_float(period.get("temperature")),
+            temperature_unit=TemperatureUnit(temperature_unit) if temperature_unit else None,
+            temperature_trend=period.get("temperatureTrend"),
+            probability_of_precipitation=_float((period.get("probabilityOfPrecipitation") or {}).get("value")),
+            dewpoint=_float((period.get("dewpoint") or {}).get("value")),
+            relative_humidity=_float((period.get("relativeHumidity") or {}).get("value")),
+            wind_speed_min=wind_min,
+            wind_speed_max=wind_max,
+            wind_speed_unit=wind_unit,
+            wind_direction=period.get("windDirection"),
+            icon=period.get("icon"),
+            short_forecast=period.get("shortForecast"),
+            detailed_forecast=period.get("detailedForecast"),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ForecastPeriod":
+        """Rebuild a record from ``to_dict()`` output (older files store ``wind_speed`` as text)."""
+        values = {field.name: data.get(field.name) for field in fields(cls)}
+        if isinstance(data.get("wind_speed"), str):
+            values["wind_speed_min"], values["wind_speed_max"], values["wind_speed_unit"] = \
+                parse_wind_speed(data["wind_speed"])
+        if values["temperature_unit"]:
+            values["temperature_unit"] = TemperatureUnit(values["temperature_unit"])
+        if values["wind_speed_unit"]:
+            values["wind_speed_unit"] = SpeedUnit(values["wind_speed_unit"])
+        return cls(**values)
+
+    def max_wind_speed(self, unit: SpeedUnit) -> Optional[float]:
+        """Return the top of the wind speed range converted to ``unit``."""
+        if self.wind_speed_max is None:
+            return None
+        return (self.wind_speed_unit or SpeedUnit.MPH).convert(self.wind_speed_max, unit)
+
+    def render(self) -> Dict[str, str]:
+        """Return display strings for the temperature and wind."""
+        if self.wind_speed_max is None:
+            wind = "N/A"
+        elif self.wind_speed_min is None or self.wind_speed_min == self.wind_speed_max:
+            wind = f"{self.wind_speed_max:g} {(self.wind_speed_unit or SpeedUnit.MPH).value}"
+        else:
+            wind = f"{self.wind_speed_min:g} to {self.wind_speed_max:g} {(self.wind_speed_unit or SpeedUnit.MPH).value}"
+        return {
+            "temperature": (self.temperature_unit or TemperatureUnit.FAHRENHEIT).format(self.temperature),
+            "wind_speed": wind,
+        }
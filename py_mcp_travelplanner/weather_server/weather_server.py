@@ -1,9 +1,21 @@
-import requests
+import asyncio
+import httpx
 import json
 import os
+import time
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from mcp.server.fastmcp import FastMCP
+from py_mcp_travelplanner.config import get_config
+from py_mcp_travelplanner.http_client import async_cached_get
+from py_mcp_travelplanner.rate_limit import TokenBucket, get_rate_limiter
+from py_mcp_travelplanner.response_cache import ResponseCache
+from py_mcp_travelplanner.weather_server.nws_metadata import (
+    get_nws_metadata_cache,
+    point_params,
+    stations_params,
+)
+from py_mcp_travelplanner.weather_server.weather_records import ForecastPeriod, SpeedUnit, parse_wind_speed
 
 # Directory to store weather data
 WEATHER_DIR = "tests/outputs/weather_data"
@@ -21,13 +33,27 @@ def get_headers() -> Dict[str, str]:
         "Accept": "application/geo+json"
     }
 
-def make_nws_request(endpoint: str) -> Optional[Dict[str, Any]]:
-    """Make a request to the NWS API with proper error handling."""
+def _nws_limiter() -> TokenBucket:
+    """Return the limiter shared by every request sent to api.weather.gov."""
+    config = get_config()
+    return get_rate_limiter(
+        "nws",
+        rate=float(config.get('NWS_RATE_LIMIT', 5.0)),
+        capacity=int(config.get('NWS_RATE_BURST', 5)),
+    )
+
+async def make_nws_request(endpoint: str) -> Optional[Dict[str, Any]]:
+    """Make a request to the NWS API with proper error handling.
+    
+    Responses are reused while NWS marks them fresh and revalidated with
+    their ETag/Last-Modified afterwards (forecasts only change hourly).
+    Requests actually sent are paced by the NWS_RATE_LIMIT token bucket.
+    """
     try:
-        response = requests.get(endpoint, headers=get_headers(), timeout=10)
+        response = await async_cached_get(endpoint, headers=get_headers(), timeout=10, limiter=_nws_limiter())
         response.raise_for_status()
         return response.json()
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:
         print(f"Error making request to {endpoint}: {str(e)}")
         return None
 
@@ -41,8 +67,186 @@ def save_weather_data(data: Dict[str, Any], filename: str) -> str:
     
     return file_path
 
+def _nws_metadata_cache() -> Optional[ResponseCache]:
+    """Return the NWS grid metadata cache (next to WEATHER_DIR by default)."""
+    return get_nws_metadata_cache(os.path.join(os.path.dirname(os.path.abspath(WEATHER_DIR)), "nws_metadata"))
+
+async def _point_metadata(latitude: float, longitude: float) -> Dict[str, Any]:
+    """Resolve a coordinate to its NWS grid, serving repeats from the metadata cache."""
+    cache = _nws_metadata_cache()
+    params = point_params(latitude, longitude)
+    result = cache.get(params) if cache is not None else None
+    cached = result is not None
+    
+    if result is None:
+        endpoint = f"{NWS_BASE_URL}/points/{params['point']}"
+        data = await make_nws_request(endpoint)
+        
+        if not data:
+            return {"error": f"Failed to get location info for {latitude},{longitude}"}
+        
+        try:
+            properties = data.get("properties", {})
+            result = {
+                "location": {
+                    "city": properties.get("relativeLocation", {}).get("properties", {}).get("city", "Unknown"),
+                    "state": properties.get("relativeLocation", {}).get("properties", {}).get("state", "Unknown")
+                },
+                "grid": {
+                    "office": properties.get("cwa"),
+                    "gridX": properties.get("gridX"),
+                    "gridY": properties.get("gridY")
+                },
+                "forecast_endpoints": {
+                    "forecast": properties.get("forecast"),
+                    "forecast_hourly": properties.get("forecastHourly"),
+                    "forecast_grid_data": properties.get("forecastGridData")
+                },
+                "observation_stations": properties.get("observationStations"),
+                "fire_weather_zone": properties.get("fireWeatherZone"),
+                "forecast_zone": properties.get("forecastZone"),
+                "county": properties.get("county"),
+                "time_zone": properties.get("timeZone")
+            }
+        except Exception as e:
+            return {"error": f"Error processing location data: {str(e)}"}
+        
+        if cache is not None and result["grid"]["office"]:
+            cache.set(params, result)
+    
+    result["location"] = {"latitude": latitude, "longitude": longitude, **result["location"]}
+    result["cached"] = cached
+    return result
+
+async def _observation_stations(stations_url: str) -> Optional[List[Dict[str, Any]]]:
+    """Return a grid's observation stations (id and name), nearest first, cached per grid."""
+    cache = _nws_metadata_cache()
+    params = stations_params(stations_url)
+    stations = cache.get(params) if cache is not None else None
+    if stations is not None:
+        return stations
+    
+    stations_data = await make_nws_request(stations_url)
+    if not stations_data or not stations_data.get("features"):
+        return None
+    
+    stations = [
+        {
+            "id": feature["properties"]["stationIdentifier"],
+            "name": feature["properties"].get("name", "Unknown")
+        }
+        for feature in stations_data["features"]
+    ]
+    if cache is not None:
+        cache.set(params, stations)
+    return stations
+
+# Station probing strategies: how long to wait on a station before also trying the next one
+STATION_PROBE_DELAYS = {"sequential": None, "hedged": 1.0, "concurrent": 0.0}
+
+def _station_probe_strategy() -> Tuple[str, Optional[float]]:
+    """Return the configured station probe strategy and its hedge delay.
+    
+    Raises:
+        ValueError: If NWS_STATION_PROBE_STRATEGY is not a known strategy
+    """
+    config = get_config()
+    strategy = config.get('NWS_STATION_PROBE_STRATEGY', 'hedged')
+    if strategy not in STATION_PROBE_DELAYS:
+        raise ValueError(f"Unknown NWS_STATION_PROBE_STRATEGY: {strategy!r} "
+                         f"(expected one of {', '.join(STATION_PROBE_DELAYS)})")
+    delay = STATION_PROBE_DELAYS[strategy]
+    if strategy == "hedged":
+        delay = float(config.get('NWS_STATION_HEDGE_DELAY', delay))
+    return strategy, delay
+
+async def _probe_stations(stations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fetch the latest observation from the first responsive station.
+    
+    Stations are tried nearest first. A station that fails (or, when hedging,
+    has not answered within NWS_STATION_HEDGE_DELAY seconds) causes the next
+    one to be started; the first valid observation wins and the remaining
+    requests are cancelled. "sequential" never starts a second request early,
+    "concurrent" starts them all at once.
+    
+    Returns:
+        Dict with the winning "station" and "observation" (None when every
+        station failed) plus "metadata" describing the strategy and latency
+    """
+    strategy, delay = _station_probe_strategy()
+    candidates = stations[:int(get_config().get('NWS_STATION_PROBE_LIMIT', 3))]
+    
+    started = time.perf_counter()
+    tasks: Dict[asyncio.Task, Dict[str, Any]] = {}
+    attempted: List[str] = []
+    station, observation = None, None
+    try:
+        while True:
+            if len(attempted) < len(candidates):
+                next_station = candidates[len(attempted)]
+                attempted.append(next_station["id"])
+                endpoint = f"{NWS_BASE_URL}/stations/{next_station['id']}/observations/latest"
+                tasks[asyncio.ensure_future(make_nws_request(endpoint))] = next_station
+            if not tasks:
+                break
+            
+            # Wait for a response, or until it is time to hedge with the next station
+            hedge = delay if len(attempted) < len(candidates) else None
+            done, _ = await asyncio.wait(tasks, timeout=hedge, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                finished = tasks.pop(task)
+                data = None if task.cancelled() or task.exception() else task.result()
+                if observation is None and data and data.get("properties"):
+                    station, observation = finished, data
+            if observation is not None:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    return {
+        "station": station,
+        "observation": observation,
+        "metadata": {
+            "strategy": strategy,
+            "hedge_delay": delay,
+            "stations_attempted": attempted,
+            "winner": station["id"] if station else None,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+    }
+
+def _forecast_endpoint(grid: Dict[str, Any], hourly: bool) -> str:
+    """Return the forecast URL of an NWS grid cell."""
+    forecast_type = "forecast/hourly" if hourly else "forecast"
+    return f"{NWS_BASE_URL}/gridpoints/{grid['office']}/{grid['gridX']},{grid['gridY']}/{forecast_type}"
+
+def _parse_forecast(forecast_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the update times, elevation and periods of an NWS forecast response."""
+    properties = forecast_data.get("properties", {})
+    return {
+        "updated": properties.get("updated"),
+        "generated_at": properties.get("generatedAt"),
+        "elevation": properties.get("elevation"),
+        "periods": [
+            ForecastPeriod.from_nws(period).to_dict()
+            for period in properties.get("periods", [])
+        ]
+    }
+
+def _batch_point(point: Any) -> Tuple[float, float]:
+    """Read a {"latitude", "longitude"} dict (or a [lat, lon] pair) as floats."""
+    if isinstance(point, dict):
+        latitude = point.get("latitude", point.get("lat"))
+        longitude = point.get("longitude", point.get("lon"))
+    else:
+        latitude, longitude = point
+    return float(latitude), float(longitude)
+
 @mcp.tool()
-def get_location_info(latitude: float, longitude: float) -> Dict[str, Any]:
+async def get_location_info(latitude: float, longitude: float) -> Dict[str, Any]:
     """
     Get location information and grid data for coordinates.
     
@@ -54,50 +258,19 @@ def get_location_info(latitude: float, longitude: float) -> Dict[str, Any]:
         Dict containing location info, grid coordinates, and forecast endpoints
     """
     
-    endpoint = f"{NWS_BASE_URL}/points/{latitude},{longitude}"
-    data = make_nws_request(endpoint)
-    
-    if not data:
-        return {"error": f"Failed to get location info for {latitude},{longitude}"}
-    
-    try:
-        properties = data.get("properties", {})
-        result = {
-            "location": {
-                "latitude": latitude,
-                "longitude": longitude,
-                "city": properties.get("relativeLocation", {}).get("properties", {}).get("city", "Unknown"),
-                "state": properties.get("relativeLocation", {}).get("properties", {}).get("state", "Unknown")
-            },
-            "grid": {
-                "office": properties.get("cwa"),
-                "gridX": properties.get("gridX"),
-                "gridY": properties.get("gridY")
-            },
-            "forecast_endpoints": {
-                "forecast": properties.get("forecast"),
-                "forecast_hourly": properties.get("forecastHourly"),
-                "forecast_grid_data": properties.get("forecastGridData")
-            },
-            "observation_stations": properties.get("observationStations"),
-            "fire_weather_zone": properties.get("fireWeatherZone"),
-            "forecast_zone": properties.get("forecastZone"),
-            "county": properties.get("county"),
-            "time_zone": properties.get("timeZone")
-        }
-        
-        # Save location data
-        search_id = f"location_{latitude}_{longitude}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        save_weather_data(result, search_id)
-        result["search_id"] = search_id
-        
+    result = await _point_metadata(latitude, longitude)
+    if "error" in result:
         return result
     
-    except Exception as e:
-        return {"error": f"Error processing location data: {str(e)}"}
+    # Save location data
+    search_id = f"location_{latitude}_{longitude}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    save_weather_data(result, search_id)
+    result["search_id"] = search_id
+    
+    return result
 
 @mcp.tool()
-def get_current_conditions(latitude: float, longitude: float) -> Dict[str, Any]:
+async def get_current_conditions(latitude: float, longitude: float) -> Dict[str, Any]:
     """
     Get current weather conditions for a location.
     
@@ -109,8 +282,13 @@ def get_current_conditions(latitude: float, longitude: float) -> Dict[str, Any]:
         Dict containing current weather observations
     """
     
+    try:
+        _station_probe_strategy()
+    except ValueError as e:
+        return {"error": str(e)}
+    
     # First get location info to find observation stations
-    location_info = get_location_info(latitude, longitude)
+    location_info = await _point_metadata(latitude, longitude)
     if "error" in location_info:
         return location_info
     
@@ -119,108 +297,103 @@ def get_current_conditions(latitude: float, longitude: float) -> Dict[str, Any]:
     if not stations_url:
         return {"error": "No observation stations found for this location"}
     
-    stations_data = make_nws_request(stations_url)
-    if not stations_data or not stations_data.get("features"):
+    stations = await _observation_stations(stations_url)
+    if not stations:
         return {"error": "Failed to get observation stations"}
     
-    # Try to get observations from the first few stations
-    for station_feature in stations_data["features"][:3]:
-        station_id = station_feature["properties"]["stationIdentifier"]
-        obs_endpoint = f"{NWS_BASE_URL}/stations/{station_id}/observations/latest"
-        obs_data = make_nws_request(obs_endpoint)
-        
-        if obs_data and obs_data.get("properties"):
-            properties = obs_data["properties"]
-            
-            result = {
-                "location": location_info["location"],
-                "station": {
-                    "id": station_id,
-                    "name": station_feature["properties"].get("name", "Unknown")
-                },
-                "observation_time": properties.get("timestamp"),
-                "conditions": {
-                    "temperature": {
-                        "value": properties.get("temperature", {}).get("value"),
-                        "unit": properties.get("temperature", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "dewpoint": {
-                        "value": properties.get("dewpoint", {}).get("value"),
-                        "unit": properties.get("dewpoint", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "wind_direction": {
-                        "value": properties.get("windDirection", {}).get("value"),
-                        "unit": properties.get("windDirection", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "wind_speed": {
-                        "value": properties.get("windSpeed", {}).get("value"),
-                        "unit": properties.get("windSpeed", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "wind_gust": {
-                        "value": properties.get("windGust", {}).get("value"),
-                        "unit": properties.get("windGust", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "barometric_pressure": {
-                        "value": properties.get("barometricPressure", {}).get("value"),
-                        "unit": properties.get("barometricPressure", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "sea_level_pressure": {
-                        "value": properties.get("seaLevelPressure", {}).get("value"),
-                        "unit": properties.get("seaLevelPressure", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "visibility": {
-                        "value": properties.get("visibility", {}).get("value"),
-                        "unit": properties.get("visibility", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "max_temperature_last_24_hours": {
-                        "value": properties.get("maxTemperatureLast24Hours", {}).get("value"),
-                        "unit": properties.get("maxTemperatureLast24Hours", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "min_temperature_last_24_hours": {
-                        "value": properties.get("minTemperatureLast24Hours", {}).get("value"),
-                        "unit": properties.get("minTemperatureLast24Hours", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "precipitation_last_hour": {
-                        "value": properties.get("precipitationLastHour", {}).get("value"),
-                        "unit": properties.get("precipitationLastHour", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "precipitation_last_3_hours": {
-                        "value": properties.get("precipitationLast3Hours", {}).get("value"),
-                        "unit": properties.get("precipitationLast3Hours", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "precipitation_last_6_hours": {
-                        "value": properties.get("precipitationLast6Hours", {}).get("value"),
-                        "unit": properties.get("precipitationLast6Hours", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "relative_humidity": {
-                        "value": properties.get("relativeHumidity", {}).get("value"),
-                        "unit": properties.get("relativeHumidity", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "wind_chill": {
-                        "value": properties.get("windChill", {}).get("value"),
-                        "unit": properties.get("windChill", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "heat_index": {
-                        "value": properties.get("heatIndex", {}).get("value"),
-                        "unit": properties.get("heatIndex", {}).get("unitCode", "").replace("wmoUnit:", "")
-                    },
-                    "cloud_layers": properties.get("cloudLayers", []),
-                    "present_weather": properties.get("presentWeather", []),
-                    "text_description": properties.get("textDescription")
-                }
-            }
-            
-            # Save current conditions data
-            search_id = f"current_{latitude}_{longitude}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            save_weather_data(result, search_id)
-            result["search_id"] = search_id
-            
-            return result
+    # Probe the nearest stations (hedged by default) and keep the first observation
+    probe = await _probe_stations(stations)
+    if probe["station"] is None:
+        return {"error": "Unable to get current conditions from nearby stations", "probe": probe["metadata"]}
+    
+    station = probe["station"]
+    properties = probe["observation"]["properties"]
+    
+    result = {
+        "location": location_info["location"],
+        "station": station,
+        "probe": probe["metadata"],
+        "observation_time": properties.get("timestamp"),
+        "conditions": {
+            "temperature": {
+                "value": properties.get("temperature", {}).get("value"),
+                "unit": properties.get("temperature", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "dewpoint": {
+                "value": properties.get("dewpoint", {}).get("value"),
+                "unit": properties.get("dewpoint", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "wind_direction": {
+                "value": properties.get("windDirection", {}).get("value"),
+                "unit": properties.get("windDirection", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "wind_speed": {
+                "value": properties.get("windSpeed", {}).get("value"),
+                "unit": properties.get("windSpeed", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "wind_gust": {
+                "value": properties.get("windGust", {}).get("value"),
+                "unit": properties.get("windGust", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "barometric_pressure": {
+                "value": properties.get("barometricPressure", {}).get("value"),
+                "unit": properties.get("barometricPressure", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "sea_level_pressure": {
+                "value": properties.get("seaLevelPressure", {}).get("value"),
+                "unit": properties.get("seaLevelPressure", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "visibility": {
+                "value": properties.get("visibility", {}).get("value"),
+                "unit": properties.get("visibility", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "max_temperature_last_24_hours": {
+                "value": properties.get("maxTemperatureLast24Hours", {}).get("value"),
+                "unit": properties.get("maxTemperatureLast24Hours", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "min_temperature_last_24_hours": {
+                "value": properties.get("minTemperatureLast24Hours", {}).get("value"),
+                "unit": properties.get("minTemperatureLast24Hours", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "precipitation_last_hour": {
+                "value": properties.get("precipitationLastHour", {}).get("value"),
+                "unit": properties.get("precipitationLastHour", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "precipitation_last_3_hours": {
+                "value": properties.get("precipitationLast3Hours", {}).get("value"),
+                "unit": properties.get("precipitationLast3Hours", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "precipitation_last_6_hours": {
+                "value": properties.get("precipitationLast6Hours", {}).get("value"),
+                "unit": properties.get("precipitationLast6Hours", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "relative_humidity": {
+                "value": properties.get("relativeHumidity", {}).get("value"),
+                "unit": properties.get("relativeHumidity", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "wind_chill": {
+                "value": properties.get("windChill", {}).get("value"),
+                "unit": properties.get("windChill", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "heat_index": {
+                "value": properties.get("heatIndex", {}).get("value"),
+                "unit": properties.get("heatIndex", {}).get("unitCode", "").replace("wmoUnit:", "")
+            },
+            "cloud_layers": properties.get("cloudLayers", []),
+            "present_weather": properties.get("presentWeather", []),
+            "text_description": properties.get("textDescription")
+        }
+    }
+    
+    # Save current conditions data
+    search_id = f"current_{latitude}_{longitude}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    save_weather_data(result, search_id)
+    result["search_id"] = search_id
     
-    return {"error": "Unable to get current conditions from nearby stations"}
+    return result
 
 @mcp.tool()
-def get_weather_forecast(latitude: float, longitude: float, hourly: bool = False) -> Dict[str, Any]:
+async def get_weather_forecast(latitude: float, longitude: float, hourly: bool = False) -> Dict[str, Any]:
     """
     Get weather forecast for a location.
     
@@ -234,7 +407,7 @@ def get_weather_forecast(latitude: float, longitude: float, hourly: bool = False
     """
     
     # Get location info and grid coordinates
-    location_info = get_location_info(latitude, longitude)
+    location_info = await _point_metadata(latitude, longitude)
     if "error" in location_info:
         return location_info
     
@@ -246,49 +419,19 @@ def get_weather_forecast(latitude: float, longitude: float, hourly: bool = False
     if not all([office, grid_x, grid_y]):
         return {"error": "Invalid grid coordinates for location"}
     
-    # Build forecast endpoint
-    forecast_type = "forecast/hourly" if hourly else "forecast"
-    endpoint = f"{NWS_BASE_URL}/gridpoints/{office}/{grid_x},{grid_y}/{forecast_type}"
-    
-    forecast_data = make_nws_request(endpoint)
+    endpoint = _forecast_endpoint(grid, hourly)
+    forecast_data = await make_nws_request(endpoint)
     if not forecast_data:
         return {"error": f"Failed to get forecast from {endpoint}"}
     
     try:
-        properties = forecast_data.get("properties", {})
-        periods = properties.get("periods", [])
-        
         result = {
             "location": location_info["location"],
             "grid": grid,
             "forecast_type": "hourly" if hourly else "daily",
-            "updated": properties.get("updated"),
-            "generated_at": properties.get("generatedAt"),
-            "elevation": properties.get("elevation"),
-            "periods": []
+            **_parse_forecast(forecast_data)
         }
         
-        for period in periods:
-            period_data = {
-                "number": period.get("number"),
-                "name": period.get("name"),
-                "start_time": period.get("startTime"),
-                "end_time": period.get("endTime"),
-                "is_daytime": period.get("isDaytime"),
-                "temperature": period.get("temperature"),
-                "temperature_unit": period.get("temperatureUnit"),
-                "temperature_trend": period.get("temperatureTrend"),
-                "probability_of_precipitation": period.get("probabilityOfPrecipitation", {}).get("value"),
-                "dewpoint": period.get("dewpoint", {}).get("value"),
-                "relative_humidity": period.get("relativeHumidity", {}).get("value"),
-                "wind_speed": period.get("windSpeed"),
-                "wind_direction": period.get("windDirection"),
-                "icon": period.get("icon"),
-                "short_forecast": period.get("shortForecast"),
-                "detailed_forecast": period.get("detailedForecast")
-            }
-            result["periods"].append(period_data)
-        
         # Save forecast data
         forecast_id = f"forecast_{'hourly' if hourly else 'daily'}_{latitude}_{longitude}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         save_weather_data(result, forecast_id)
@@ -300,7 +443,105 @@ def get_weather_forecast(latitude: float, longitude: float, hourly: bool = False
         return {"error": f"Error processing forecast data: {str(e)}"}
 
 @mcp.tool()
-def get_weather_alerts(
+async def get_forecasts_batch(points: List[Dict[str, float]], hourly: bool = False) -> Dict[str, Any]:
+    """
+    Get weather forecasts for several locations (e.g. the stops of a road trip) in one call.
+    
+    Grid lookups run concurrently, points that fall in the same NWS grid cell
+    share a single forecast request, and forecasts are fetched in parallel,
+    at most NWS_BATCH_CONCURRENCY at a time and within the NWS rate limit.
+    
+    Args:
+        points: Locations as {"latitude": ..., "longitude": ...} dicts
+        hourly: If True, get hourly forecasts; if False, get daily forecasts
+        
+    Returns:
+        Dict with one entry per point in "results" (input order, each naming
+        its "grid_id" or an "error") and each distinct grid's forecast in
+        "forecasts"
+    """
+    if not points:
+        return {"error": "No points provided"}
+    
+    started = time.perf_counter()
+    semaphore = asyncio.Semaphore(max(1, int(get_config().get('NWS_BATCH_CONCURRENCY', 4))))
+    
+    async def limited(coro):
+        async with semaphore:
+            return await coro
+    
+    # Parse the points; identical rounded coordinates share one grid lookup
+    results: List[Dict[str, Any]] = []
+    lookups: Dict[str, Tuple[float, float]] = {}
+    for index, point in enumerate(points):
+        try:
+            latitude, longitude = _batch_point(point)
+        except (TypeError, ValueError):
+            results.append({"index": index, "error": f"Invalid point: {point!r}"})
+            continue
+        key = point_params(latitude, longitude)["point"]
+        lookups.setdefault(key, (latitude, longitude))
+        results.append({"index": index, "latitude": latitude, "longitude": longitude, "point": key})
+    
+    metadata = dict(zip(lookups, await asyncio.gather(
+        *(limited(_point_metadata(*coordinate)) for coordinate in lookups.values())
+    )))
+    
+    # Group the points by grid cell
+    grids: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        if "point" not in result:
+            continue
+        info = metadata[result.pop("point")]
+        if "error" in info:
+            result["error"] = info["error"]
+            continue
+        grid = info["grid"]
+        if not all([grid["office"], grid["gridX"], grid["gridY"]]):
+            result["error"] = "Invalid grid coordinates for location"
+            continue
+        grid_id = f"{grid['office']}/{grid['gridX']},{grid['gridY']}"
+        grids.setdefault(grid_id, grid)
+        result["location"] = {**info["location"], "latitude": result["latitude"], "longitude": result["longitude"]}
+        result["grid_id"] = grid_id
+    
+    responses = await asyncio.gather(
+        *(limited(make_nws_request(_forecast_endpoint(grid, hourly))) for grid in grids.values())
+    )
+    forecasts: Dict[str, Dict[str, Any]] = {}
+    for (grid_id, grid), forecast_data in zip(grids.items(), responses):
+        if not forecast_data:
+            forecasts[grid_id] = {"grid": grid, "error": f"Failed to get forecast from {_forecast_endpoint(grid, hourly)}"}
+            continue
+        try:
+            forecasts[grid_id] = {"grid": grid, **_parse_forecast(forecast_data)}
+        except Exception as e:
+            forecasts[grid_id] = {"grid": grid, "error": f"Error processing forecast data: {str(e)}"}
+    
+    for result in results:
+        if "grid_id" in result and "error" in forecasts[result["grid_id"]]:
+            result["error"] = forecasts[result["grid_id"]]["error"]
+    
+    forecast_type = "hourly" if hourly else "daily"
+    combined = {
+        "forecast_type": forecast_type,
+        "points": len(points),
+        "unique_points": len(lookups),
+        "unique_grids": len(grids),
+        "failed": sum(1 for result in results if "error" in result),
+        "results": results,
+        "forecasts": forecasts,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+    }
+    
+    batch_id = f"forecast_batch_{forecast_type}_{len(points)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    save_weather_data(combined, batch_id)
+    combined["search_id"] = batch_id
+    
+    return combined
+
+@mcp.tool()
+async def get_weather_alerts(
     area: Optional[str] = None,
     region: Optional[str] = None,
     zone: Optional[str] = None,
@@ -367,7 +608,7 @@ def get_weather_alerts(
     if params:
         endpoint += "?" + "&".join(params)
     
-    alerts_data = make_nws_request(endpoint)
+    alerts_data = await make_nws_request(endpoint)
     if not alerts_data:
         return {"error": f"Failed to get alerts from {endpoint}"}
     
@@ -468,7 +709,8 @@ def filter_forecast_by_conditions(
         min_temp: Minimum temperature filter
         max_temp: Maximum temperature filter
         max_precipitation_chance: Maximum precipitation probability (0-100)
-        wind_speed_threshold: Maximum wind speed (e.g., "15 mph")
+        wind_speed_threshold: Maximum wind speed (e.g., "15 mph" or "25 km/h"); a
+            period is excluded when the top of its wind range exceeds it
         
     Returns:
         JSON string with filtered forecast results
@@ -486,9 +728,13 @@ def filter_forecast_by_conditions(
         if weather_data.get("forecast_type") is None:
             return f"Data with ID {search_id} is not forecast data"
         
-        def condition_filter(period):
+        _, wind_limit, wind_unit = parse_wind_speed(wind_speed_threshold)
+        if wind_speed_threshold is not None and wind_limit is None:
+            return f"Invalid wind speed threshold: {wind_speed_threshold}"
+        
+        def condition_filter(period: ForecastPeriod) -> bool:
             # Temperature filters
-            temp = period.get("temperature")
+            temp = period.temperature
             if temp is not None:
                 if min_temp is not None and temp < min_temp:
                     return False
@@ -496,21 +742,21 @@ def filter_forecast_by_conditions(
                     return False
             
             # Precipitation filter
-            precip_chance = period.get("probability_of_precipitation")
+            precip_chance = period.probability_of_precipitation
             if precip_chance is not None and max_precipitation_chance is not None:
                 if precip_chance > max_precipitation_chance:
                     return False
             
-            # Wind speed filter (simplified - would need more parsing for real use)
-            if wind_speed_threshold is not None:
-                wind_speed_str = period.get("wind_speed", "")
-                # This is a simplified check - in practice, you'd want to parse the wind speed string
-                if wind_speed_threshold.lower() in wind_speed_str.lower():
+            # Wind speed filter, on the top of the period's wind range
+            if wind_limit is not None:
+                wind_speed = period.max_wind_speed(wind_unit or SpeedUnit.MPH)
+                if wind_speed is not None and wind_speed > wind_limit:
                     return False
             
             return True
         
-        filtered_periods = [p for p in weather_data.get("periods", []) if condition_filter(p)]
+        periods = [ForecastPeriod.from_dict(p) for p in weather_data.get("periods", [])]
+        filtered_periods = [period.to_dict() for period in periods if condition_filter(period)]
         
         result = {
             "search_id": search_id,
@@ -628,12 +874,13 @@ def get_weather_search_details(search_id: str) -> str:
             periods = weather_data.get('periods', [])[:5]  # Show first 5 periods
             if periods:
                 content += f"### Sample Periods\n\n"
-                for period in periods:
-                    content += f"**{period.get('name', 'Unknown')}**\n"
-                    content += f"- Temperature: {period.get('temperature', 'N/A')}°{period.get('temperature_unit', 'F')}\n"
-                    content += f"- Wind: {period.get('wind_speed', 'N/A')} {period.get('wind_direction', '')}\n"
-                    content += f"- Precipitation Chance: {period.get('probability_of_precipitation', 0)}%\n"
-                    content += f"- Conditions: {period.get('short_forecast', 'N/A')}\n\n"
+                for period in map(ForecastPeriod.from_dict, periods):
+                    display = period.render()
+                    content += f"**{period.name or 'Unknown'}**\n"
+                    content += f"- Temperature: {display['temperature']}\n"
+                    content += f"- Wind: {display['wind_speed']} {period.wind_direction or ''}\n"
+                    content += f"- Precipitation Chance: {period.probability_of_precipitation or 0:g}%\n"
+                    content += f"- Conditions: {period.short_forecast or 'N/A'}\n\n"
         
         elif 'conditions' in weather_data:
             # Current conditions data
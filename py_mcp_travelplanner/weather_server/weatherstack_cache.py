@@ -0,0 +1,111 @@
+"""Cache of Weatherstack API responses.
+
+Every Weatherstack call counts against the plan's monthly quota, and trip
+comparisons ask for the same handful of cities over and over. Responses
+are kept in a ``ResponseCache`` (memory LRU plus an on-disk tier) keyed on
+the normalized location query (case-folded, whitespace collapsed), units
+and language; the access key never becomes part of a key.
+
+- current weather is kept for ``WEATHERSTACK_CURRENT_CACHE_TTL`` seconds,
+  short enough that observations are never more than a few minutes old
+- historical weather is cached one day at a time and never expires (past
+  days do not change), so a date range is assembled from cached days and
+  only the missing days are requested
+
+Example Usage:
+    from py_mcp_travelplanner.weather_server.weatherstack_cache import (
+        current_params, get_weatherstack_cache, historical_params,
+    )
+
+    cache = get_weatherstack_cache("./outputs/weatherstack_cache")
+    params = current_params("New York", units="m", language="en")
+    data = cache.get(params)
+    if data is None:
+        data = fetch_current("New York")
+        cache.set(params, data)
+
+    cache.get(historical_params("New York", "2024-07-04", hourly=False))
+"""
+from __future__ import annotations
+
+import os
+import pathlib
+import threading
+from typing import Dict, Optional
+
+from py_mcp_travelplanner.config import get_config
+from py_mcp_travelplanner.response_cache import ResponseCache
+
+DEFAULT_CURRENT_TTL = 600.0
+
+CURRENT = "current"
+HISTORICAL = "historical"
+
+
+def normalize_location(location: str) -> str:
+    """Case-fold a location query and collapse its whitespace."""
+    return " ".join(str(location).casefold().split())
+
+
+def current_params(location: str, units: str = "m", language: str = "en") -> Dict[str, str]:
+    """Return the cache parameters for a location's current weather."""
+    return {"kind": CURRENT, "query": normalize_location(location), "units": units, "language": language}
+
+
+def historical_params(location: str, day: str, hourly: bool = False,
+                      units: str = "m", language: str = "en") -> Dict[str, str]:
+    """Return the cache parameters for one day of a location's historical weather."""
+    return {
+        "kind": HISTORICAL,
+        "query": normalize_location(location),
+        "date": day,
+        "hourly": str(int(bool(hourly))),
+        "units": units,
+        "language": language,
+    }
+
+
+# Global Weatherstack cache instances, keyed on disk directory
+_weatherstack_caches: Dict[str, ResponseCache] = {}
+_weatherstack_caches_lock = threading.Lock()
+
+
+def get_weatherstack_cache(default_dir: str | pathlib.Path) -> Optional[ResponseCache]:
+    """Return the process-wide Weatherstack response cache.
+
+    Args:
+        default_dir: On-disk tier directory used unless ``WEATHERSTACK_CACHE_DIR`` is set
+
+    Returns None when caching is disabled via ``WEATHERSTACK_CACHE_ENABLED``.
+    """
+    config = get_config()
+    if not config.get('WEATHERSTACK_CACHE_ENABLED', True):
+        return None
+
+    disk_dir = os.path.abspath(config.get('WEATHERSTACK_CACHE_DIR') or default_dir)
+    cache = _weatherstack_caches.get(disk_dir)
+    if cache is None:
+        with _weatherstack_caches_lock:
+            cache = _weatherstack_caches.get(disk_dir)
+            if cache is None:
+                cache = ResponseCache(
+                    max_bytes=int(config.get('WEATHERSTACK_CACHE_MAX_BYTES', 16 * 1024 * 1024)),
+                    default_ttl=float(config.get('WEATHERSTACK_CURRENT_CACHE_TTL', DEFAULT_CURRENT_TTL)),
+                    ttls={
+                        CURRENT: float(config.get('WEATHERSTACK_CURRENT_CACHE_TTL', DEFAULT_CURRENT_TTL)),
+                        HISTORICAL: None,
+                    },
+                    disk_dir=disk_dir,
+                    ttl_param="kind",
+                )
+                _weatherstack_caches[disk_dir] = cache
+    return cache
+
+
+def reset_weatherstack_caches() -> None:
+    """Discard the global Weatherstack cache instances.
+
+    This is primarily useful for testing.
+    """
+    with _weatherstack_caches_lock:
+        _weatherstack_caches.clear()
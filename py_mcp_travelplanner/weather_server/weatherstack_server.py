@@ -1,9 +1,22 @@
-import requests
+import asyncio
+import httpx
 import json
+import operator
 import os
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
+import time
+from typing import List, Dict, Optional, Any, Tuple
+from datetime import date as Date, datetime, timedelta, timezone
 from mcp.server.fastmcp import FastMCP
+from py_mcp_travelplanner.config import get_config
+from py_mcp_travelplanner.http_client import async_http_get
+from py_mcp_travelplanner.response_cache import ResponseCache
+from py_mcp_travelplanner.weather_server.weatherstack_cache import (
+    current_params,
+    get_weatherstack_cache,
+    historical_params,
+    normalize_location,
+)
+from py_mcp_travelplanner.weather_server.weather_records import CurrentWeather, UnitSystem
 
 # Directory to store weather data
 WEATHER_DIR = "tests/outputs/weather_data"
@@ -18,8 +31,45 @@ def get_weatherstack_key() -> str:
         raise ValueError("WEATHERSTACK_API_KEY environment variable is required")
     return api_key
 
+def _weatherstack_cache() -> Optional[ResponseCache]:
+    """Return the Weatherstack response cache (next to WEATHER_DIR by default)."""
+    return get_weatherstack_cache(os.path.join(os.path.dirname(os.path.abspath(WEATHER_DIR)), "weatherstack_cache"))
+
+def _check_api_error(weather_data: Dict[str, Any]) -> None:
+    """Raise ValueError if Weatherstack reported an error in a 200 response."""
+    if not weather_data.get("success", True):
+        error_info = weather_data.get("error", {})
+        raise ValueError(f"API Error {error_info.get('code', 'Unknown')}: {error_info.get('info', 'Unknown error')}")
+
+async def _fetch_current_weather(location: str, units: str, language: str) -> Tuple[Dict[str, Any], bool]:
+    """Return Weatherstack's current weather response and whether it came from the cache.
+    
+    Raises:
+        ValueError: If the API key is missing or Weatherstack returned an error
+        httpx.HTTPError: If the request failed
+    """
+    cache = _weatherstack_cache()
+    params = current_params(location, units, language)
+    weather_data = cache.get(params) if cache is not None else None
+    if weather_data is not None:
+        return weather_data, True
+    
+    response = await async_http_get("https://api.weatherstack.com/current", params={
+        "access_key": get_weatherstack_key(),
+        "query": location,
+        "units": units,
+        "language": language
+    })
+    response.raise_for_status()
+    weather_data = response.json()
+    _check_api_error(weather_data)
+    
+    if cache is not None:
+        cache.set(params, weather_data)
+    return weather_data, False
+
 @mcp.tool()
-def get_current_weather(
+async def get_current_weather(
     location: str,
     units: str = "m",
     language: str = "en"
@@ -37,28 +87,10 @@ def get_current_weather(
     """
     
     try:
-        api_key = get_weatherstack_key()
-        
-        # Build request parameters
-        params = {
-            "access_key": api_key,
-            "query": location,
-            "units": units,
-            "language": language
-        }
-        
-        # Make API request
-        response = requests.get("https://api.weatherstack.com/current", params=params)
-        response.raise_for_status()
-        
-        weather_data = response.json()
-        
-        # Check for API errors
-        if not weather_data.get("success", True):
-            error_info = weather_data.get("error", {})
-            return {
-                "error": f"API Error {error_info.get('code', 'Unknown')}: {error_info.get('info', 'Unknown error')}"
-            }
+        system = UnitSystem(units)
+        weather_data, cached = await _fetch_current_weather(location, units, language)
+        current = weather_data.get("current", {})
+        record = CurrentWeather.from_weatherstack(current, system)
         
         # Create search identifier
         search_id = f"current_{location.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -76,9 +108,9 @@ def get_current_weather(
                 "search_type": "current",
                 "search_timestamp": datetime.now().isoformat()
             },
-            "request": weather_data.get("request", {}),
             "location": weather_data.get("location", {}),
-            "current": weather_data.get("current", {})
+            "current": record.to_dict(),
+            "air_quality": current.get("air_quality", {})
         }
         
         # Save results to file
@@ -89,11 +121,11 @@ def get_current_weather(
         print(f"Current weather data saved to: {file_path}")
         
         # Return summary for the user
-        current = weather_data.get("current", {})
         location_info = weather_data.get("location", {})
         
         summary = {
             "search_id": search_id,
+            "cached": cached,
             "location": {
                 "name": location_info.get("name", "Unknown"),
                 "country": location_info.get("country", "Unknown"),
@@ -102,24 +134,15 @@ def get_current_weather(
                 "local_time": location_info.get("localtime", "N/A"),
                 "timezone": location_info.get("timezone_id", "N/A")
             },
-            "current_weather": {
-                "temperature": f"{current.get('temperature', 'N/A')}°{'C' if units == 'm' else 'F' if units == 'f' else 'K'}",
-                "description": current.get("weather_descriptions", ["N/A"])[0],
-                "feels_like": f"{current.get('feelslike', 'N/A')}°{'C' if units == 'm' else 'F' if units == 'f' else 'K'}",
-                "humidity": f"{current.get('humidity', 'N/A')}%",
-                "wind": f"{current.get('wind_speed', 'N/A')} {'km/h' if units in ['m', 's'] else 'mph'} {current.get('wind_dir', '')}",
-                "pressure": f"{current.get('pressure', 'N/A')} mb",
-                "visibility": f"{current.get('visibility', 'N/A')} {'km' if units in ['m', 's'] else 'miles'}",
-                "uv_index": current.get('uv_index', 'N/A'),
-                "cloud_cover": f"{current.get('cloudcover', 'N/A')}%"
-            },
+            "current_weather": record.to_dict(),
+            "unit_labels": system.labels(),
             "air_quality": current.get("air_quality", {}),
             "search_parameters": processed_data["search_metadata"]
         }
         
         return summary
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
@@ -127,7 +150,7 @@ def get_current_weather(
         return {"error": f"Unexpected error: {str(e)}"}
 
 @mcp.tool()
-def get_weather_forecast(
+async def get_weather_forecast(
     location: str,
     forecast_days: int = 5,
     hourly: bool = False,
@@ -166,7 +189,7 @@ def get_weather_forecast(
         }
         
         # Make API request
-        response = requests.get("https://api.weatherstack.com/forecast", params=params)
+        response = await async_http_get("https://api.weatherstack.com/forecast", params=params)
         response.raise_for_status()
         
         weather_data = response.json()
@@ -233,15 +256,81 @@ def get_weather_forecast(
         
         return summary
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}"}
 
+# Longest date range get_historical_weather accepts (Weatherstack's own limit)
+MAX_HISTORICAL_DAYS = 60
+
+def _historical_days(start: str, end: Optional[str]) -> List[str]:
+    """Return every YYYY-MM-DD day from ``start`` to ``end`` inclusive.
+    
+    Raises:
+        ValueError: If a date is malformed, the range is reversed or too long
+    """
+    first = Date.fromisoformat(start)
+    last = Date.fromisoformat(end) if end else first
+    if last < first:
+        raise ValueError(f"end_date {end} is before date {start}")
+    count = (last - first).days + 1
+    if count > MAX_HISTORICAL_DAYS:
+        raise ValueError(f"Date range spans {count} days; the maximum is {MAX_HISTORICAL_DAYS}")
+    return [(first + timedelta(days=offset)).isoformat() for offset in range(count)]
+
+# Furthest any time zone runs behind UTC, plus slack (UTC-12 is the westernmost)
+_LOCAL_DATE_MARGIN = timedelta(hours=14)
+
+def _day_is_over(day: str, location_info: Dict[str, Any]) -> bool:
+    """Return True once ``day`` has ended at the location.
+    
+    Uses the location's ``localtime`` from the response; without it, a day
+    only counts as over once it has ended in every time zone.
+    """
+    try:
+        local_today = datetime.strptime(location_info.get("localtime", "")[:10], "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        local_today = (datetime.now(timezone.utc) - _LOCAL_DATE_MARGIN).date()
+    return Date.fromisoformat(day) < local_today
+
+async def _fetch_historical_day(location: str, day: str, hourly: bool, units: str, language: str) -> Dict[str, Any]:
+    """Request one day of historical weather and cache it permanently once the day is over.
+    
+    Returns:
+        Dict with the Weatherstack "location" block and the "day" block
+    
+    Raises:
+        ValueError: If the API key is missing, Weatherstack returned an error or no data for the day
+        httpx.HTTPError: If the request failed
+    """
+    response = await async_http_get("https://api.weatherstack.com/historical", params={
+        "access_key": get_weatherstack_key(),
+        "query": location,
+        "historical_date": day,
+        "hourly": 1 if hourly else 0,
+        "units": units,
+        "language": language
+    })
+    response.raise_for_status()
+    weather_data = response.json()
+    _check_api_error(weather_data)
+    
+    day_data = weather_data.get("historical", {}).get(day)
+    if not day_data:
+        raise ValueError(f"No historical data for {day}")
+    entry = {"location": weather_data.get("location", {}), "day": day_data}
+    
+    # The location's today is still coming in; past days never change
+    cache = _weatherstack_cache()
+    if cache is not None and _day_is_over(day, entry["location"]):
+        cache.set(historical_params(location, day, hourly, units, language), entry)
+    return entry
+
 @mcp.tool()
-def get_historical_weather(
+async def get_historical_weather(
     location: str,
     date: str,
     end_date: Optional[str] = None,
@@ -252,10 +341,14 @@ def get_historical_weather(
     """
     Get historical weather data for a specific location and date(s) (Standard Plan required).
     
+    Each day is cached permanently, so a range is assembled from cached days
+    and only the missing days are requested, concurrently (at most
+    WEATHERSTACK_CONCURRENCY at a time). Repeating a query costs no API calls.
+    
     Args:
         location: Location name, coordinates (lat,lon), IP address, or ZIP code
         date: Historical date in YYYY-MM-DD format (back to 2015)
-        end_date: End date for date range queries (optional)
+        end_date: End date for date range queries (optional, at most 60 days after date)
         hourly: Include hourly historical data
         units: Temperature unit - 'm' for Celsius, 'f' for Fahrenheit, 's' for Kelvin
         language: Language code (e.g., 'en', 'es', 'fr', 'de')
@@ -265,45 +358,46 @@ def get_historical_weather(
     """
     
     try:
-        api_key = get_weatherstack_key()
-        
-        # Build request parameters
-        params = {
-            "access_key": api_key,
-            "query": location,
-            "hourly": 1 if hourly else 0,
-            "units": units,
-            "language": language
-        }
-        
-        # Add date parameters
-        if end_date:
-            params["historical_date_start"] = date
-            params["historical_date_end"] = end_date
-        else:
-            params["historical_date"] = date
-        
-        # Make API request
-        response = requests.get("https://api.weatherstack.com/historical", params=params)
-        response.raise_for_status()
-        
-        weather_data = response.json()
-        
-        # Check for API errors
-        if not weather_data.get("success", True):
-            error_info = weather_data.get("error", {})
-            return {
-                "error": f"API Error {error_info.get('code', 'Unknown')}: {error_info.get('info', 'Unknown error')}"
-            }
-        
-        # Create search identifier
+        days = _historical_days(date, end_date)
+        
+        # Serve what we can from the cache, then fetch the missing days concurrently
+        cache = _weatherstack_cache()
+        entries: Dict[str, Dict[str, Any]] = {}
+        for day in days:
+            entry = cache.get(historical_params(location, day, hourly, units, language)) if cache is not None else None
+            if entry is not None:
+                entries[day] = entry
+        missing = [day for day in days if day not in entries]
+        
+        semaphore = asyncio.Semaphore(max(1, int(get_config().get('WEATHERSTACK_CONCURRENCY', 5))))
+        
+        async def fetch(day: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await _fetch_historical_day(location, day, hourly, units, language)
+        
+        responses = await asyncio.gather(*(fetch(day) for day in missing), return_exceptions=True)
+        failed_days: Dict[str, str] = {}
+        for day, response in zip(missing, responses):
+            if isinstance(response, httpx.HTTPError):
+                failed_days[day] = f"API request failed: {str(response)}"
+            elif isinstance(response, Exception):
+                failed_days[day] = str(response)
+            else:
+                entries[day] = response
+        
+        if not entries:
+            return {"error": next(iter(failed_days.values()))}
+        
+        # Create search identifier (the same query always maps to the same file)
         date_range = f"{date}_to_{end_date}" if end_date else date
-        search_id = f"historical_{location.replace(' ', '_')}_{date_range}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        search_id = f"historical_{location.replace(' ', '_')}_{date_range}{'_hourly' if hourly else ''}_{units}_{language}"
         
         # Create directory structure
         os.makedirs(WEATHER_DIR, exist_ok=True)
         
         # Process and store weather data
+        location_info = next(entry["location"] for entry in entries.values())
+        historical_data = {day: entries[day]["day"] for day in days if day in entries}
         processed_data = {
             "search_metadata": {
                 "search_id": search_id,
@@ -316,10 +410,8 @@ def get_historical_weather(
                 "search_type": "historical",
                 "search_timestamp": datetime.now().isoformat()
             },
-            "request": weather_data.get("request", {}),
-            "location": weather_data.get("location", {}),
-            "current": weather_data.get("current", {}),
-            "historical": weather_data.get("historical", {})
+            "location": location_info,
+            "historical": historical_data
         }
         
         # Save results to file
@@ -330,9 +422,6 @@ def get_historical_weather(
         print(f"Historical weather data saved to: {file_path}")
         
         # Return summary for the user
-        location_info = weather_data.get("location", {})
-        historical_data = weather_data.get("historical", {})
-        
         summary = {
             "search_id": search_id,
             "location": {
@@ -345,14 +434,17 @@ def get_historical_weather(
             "historical_summary": {
                 "total_days": len(historical_data),
                 "date_range": f"{date} to {end_date}" if end_date else date,
-                "includes_hourly": hourly
+                "includes_hourly": hourly,
+                "days_cached": len(days) - len(missing),
+                "days_fetched": len(missing) - len(failed_days),
+                "failed_days": failed_days
             },
             "search_parameters": processed_data["search_metadata"]
         }
         
         return summary
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
@@ -360,7 +452,7 @@ def get_historical_weather(
         return {"error": f"Unexpected error: {str(e)}"}
 
 @mcp.tool()
-def search_locations(query: str) -> Dict[str, Any]:
+async def search_locations(query: str) -> Dict[str, Any]:
     """
     Search for locations using the autocomplete endpoint (Standard Plan required).
     
@@ -381,7 +473,7 @@ def search_locations(query: str) -> Dict[str, Any]:
         }
         
         # Make API request
-        response = requests.get("https://api.weatherstack.com/autocomplete", params=params)
+        response = await async_http_get("https://api.weatherstack.com/autocomplete", params=params)
         response.raise_for_status()
         
         location_data = response.json()
@@ -399,7 +491,7 @@ def search_locations(query: str) -> Dict[str, Any]:
             "locations": location_data.get("results", [])
         }
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {"error": f"API request failed: {str(e)}"}
     except ValueError as e:
         return {"error": str(e)}
@@ -430,8 +522,16 @@ def get_weather_details(search_id: str) -> str:
     except (FileNotFoundError, json.JSONDecodeError) as e:
         return f"Error reading weather data for {search_id}: {str(e)}"
 
+# Comparison summary entries: (name, numeric field, better-than test)
+COMPARISON_SUMMARY = (
+    ("hottest", "temperature", operator.gt),
+    ("coldest", "temperature", operator.lt),
+    ("windiest", "wind_speed", operator.gt),
+    ("most_humid", "humidity", operator.gt),
+)
+
 @mcp.tool()
-def compare_weather(
+async def compare_weather(
     locations: List[str],
     units: str = "m",
     language: str = "en"
@@ -439,6 +539,10 @@ def compare_weather(
     """
     Compare current weather across multiple locations.
     
+    Locations are fetched concurrently (at most WEATHERSTACK_CONCURRENCY at a
+    time); queries differing only in case or spacing are fetched once and
+    recent answers are served from the current-weather cache.
+    
     Args:
         locations: List of location names to compare
         units: Temperature unit - 'm' for Celsius, 'f' for Fahrenheit, 's' for Kelvin
@@ -448,105 +552,74 @@ def compare_weather(
         Dict containing weather comparison data
     """
     
-    if len(locations) < 2:
+    # Dedupe queries, keeping the first spelling of each
+    unique: Dict[str, str] = {}
+    for location in locations:
+        unique.setdefault(normalize_location(location), location)
+    unique_locations = list(unique.values())
+    
+    if len(unique_locations) < 2:
         return {"error": "At least 2 locations required for comparison"}
     
-    if len(locations) > 10:
+    if len(unique_locations) > 10:
         return {"error": "Maximum 10 locations allowed for comparison"}
     
+    try:
+        system = UnitSystem(units)
+    except ValueError:
+        return {"error": f"Invalid units: {units!r} (use 'm', 'f' or 's')"}
+    
+    started = time.perf_counter()
+    semaphore = asyncio.Semaphore(max(1, int(get_config().get('WEATHERSTACK_CONCURRENCY', 5))))
+    
+    async def fetch(location: str) -> Tuple[Dict[str, Any], bool]:
+        async with semaphore:
+            return await _fetch_current_weather(location, units, language)
+    
+    responses = await asyncio.gather(*(fetch(location) for location in unique_locations), return_exceptions=True)
+    
     comparison_data = {
         "comparison_timestamp": datetime.now().isoformat(),
         "units": units,
+        "unit_labels": system.labels(),
         "language": language,
         "locations": [],
-        "summary": {
-            "hottest": {"location": "", "temperature": float('-inf')},
-            "coldest": {"location": "", "temperature": float('inf')},
-            "windiest": {"location": "", "wind_speed": 0},
-            "most_humid": {"location": "", "humidity": 0}
-        }
+        "summary": {name: {"location": "", field: None} for name, field, _ in COMPARISON_SUMMARY},
+        "cached": 0
     }
-    
-    for location in locations:
-        try:
-            weather_result = get_current_weather(location, units, language)
-            
-            if "error" in weather_result:
-                comparison_data["locations"].append({
-                    "location": location,
-                    "error": weather_result["error"]
-                })
-                continue
-            
-            current_weather = weather_result["current_weather"]
-            location_info = weather_result["location"]
-            
-            # Extract numeric temperature for comparison
-            temp_str = current_weather["temperature"].replace("°C", "").replace("°F", "").replace("°K", "")
-            try:
-                temperature = float(temp_str)
-            except ValueError:
-                temperature = None
-            
-            location_data = {
-                "location": location_info["name"],
-                "country": location_info["country"],
-                "temperature": current_weather["temperature"],
-                "description": current_weather["description"],
-                "feels_like": current_weather["feels_like"],
-                "humidity": current_weather["humidity"],
-                "wind": current_weather["wind"],
-                "pressure": current_weather["pressure"],
-                "local_time": location_info["local_time"]
-            }
-            
-            comparison_data["locations"].append(location_data)
-            
-            # Update summary statistics
-            if temperature is not None:
-                if temperature > comparison_data["summary"]["hottest"]["temperature"]:
-                    comparison_data["summary"]["hottest"] = {
-                        "location": location_info["name"],
-                        "temperature": temperature
-                    }
-                
-                if temperature < comparison_data["summary"]["coldest"]["temperature"]:
-                    comparison_data["summary"]["coldest"] = {
-                        "location": location_info["name"],
-                        "temperature": temperature
-                    }
-            
-            # Extract humidity for comparison
-            humidity_str = current_weather["humidity"].replace("%", "")
-            try:
-                humidity = float(humidity_str)
-                if humidity > comparison_data["summary"]["most_humid"]["humidity"]:
-                    comparison_data["summary"]["most_humid"] = {
-                        "location": location_info["name"],
-                        "humidity": humidity
-                    }
-            except ValueError:
-                pass
-            
-            # Extract wind speed for comparison
-            wind_parts = current_weather["wind"].split()
-            if wind_parts:
-                try:
-                    wind_speed = float(wind_parts[0])
-                    if wind_speed > comparison_data["summary"]["windiest"]["wind_speed"]:
-                        comparison_data["summary"]["windiest"] = {
-                            "location": location_info["name"],
-                            "wind_speed": wind_speed
-                        }
-                except ValueError:
-                    pass
-                    
-        except Exception as e:
-            comparison_data["locations"].append({
-                "location": location,
-                "error": f"Failed to get weather data: {str(e)}"
-            })
-    
+    summary = comparison_data["summary"]
+    
+    for location, response in zip(unique_locations, responses):
+        if isinstance(response, httpx.HTTPError):
+            comparison_data["locations"].append({"location": location, "error": f"API request failed: {str(response)}"})
+            continue
+        if isinstance(response, ValueError):
+            comparison_data["locations"].append({"location": location, "error": str(response)})
+            continue
+        if isinstance(response, Exception):
+            comparison_data["locations"].append({"location": location, "error": f"Failed to get weather data: {str(response)}"})
+            continue
+        
+        weather_data, cached = response
+        location_info = weather_data.get("location", {})
+        name = location_info.get("name", "Unknown")
+        record = CurrentWeather.from_weatherstack(weather_data.get("current", {}), system)
+        comparison_data["cached"] += cached
+        
+        comparison_data["locations"].append({
+            "location": name,
+            "country": location_info.get("country", "Unknown"),
+            "local_time": location_info.get("localtime", "N/A"),
+            "weather": record.to_dict()
+        })
+        
+        # Update every summary statistic straight from the record's numeric fields
+        for entry, field, better in COMPARISON_SUMMARY:
+            value = getattr(record, field)
+            if value is not None and (summary[entry][field] is None or better(value, summary[entry][field])):
+                summary[entry] = {"location": name, field: value}
+    
+    comparison_data["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
     return comparison_data
 
 @mcp.resource("weather://searches")
@@ -656,20 +729,21 @@ def get_weather_search_details(search_id: str) -> str:
         
         # Current Weather
         if current:
+            display = CurrentWeather.from_dict(current, metadata.get('units', 'm')).render()
             content += f"## Current Weather\n"
-            content += f"- **Temperature**: {current.get('temperature', 'N/A')}°\n"
-            content += f"- **Feels Like**: {current.get('feelslike', 'N/A')}°\n"
-            content += f"- **Condition**: {', '.join(current.get('weather_descriptions', ['N/A']))}\n"
-            content += f"- **Humidity**: {current.get('humidity', 'N/A')}%\n"
-            content += f"- **Wind**: {current.get('wind_speed', 'N/A')} {current.get('wind_dir', '')}\n"
-            content += f"- **Pressure**: {current.get('pressure', 'N/A')} mb\n"
-            content += f"- **Visibility**: {current.get('visibility', 'N/A')}\n"
-            content += f"- **UV Index**: {current.get('uv_index', 'N/A')}\n"
-            content += f"- **Cloud Cover**: {current.get('cloudcover', 'N/A')}%\n"
+            content += f"- **Temperature**: {display['temperature']}\n"
+            content += f"- **Feels Like**: {display['feels_like']}\n"
+            content += f"- **Condition**: {display['description']}\n"
+            content += f"- **Humidity**: {display['humidity']}\n"
+            content += f"- **Wind**: {display['wind']}\n"
+            content += f"- **Pressure**: {display['pressure']}\n"
+            content += f"- **Visibility**: {display['visibility']}\n"
+            content += f"- **UV Index**: {display['uv_index']}\n"
+            content += f"- **Cloud Cover**: {display['cloud_cover']}\n"
             
             # Air Quality
-            if current.get('air_quality'):
-                aq = current['air_quality']
+            aq = weather_data.get('air_quality') or current.get('air_quality')
+            if aq:
                 content += f"\n### Air Quality\n"
                 content += f"- **US EPA Index**: {aq.get('us-epa-index', 'N/A')}\n"
                 content += f"- **UK DEFRA Index**: {aq.get('gb-defra-index', 'N/A')}\n"
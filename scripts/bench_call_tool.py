@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the unified server's call_tool dispatch overhead.
+
+Measures the per-call cost of mcp_server.call_tool() for:
+1. a cheap control tool (get_metrics, last in the old if/elif chain)
+2. an async subservice tool that does no work
+3. a sync subservice tool that does no work (runs on the tool executor)
+4. an unknown tool name (worst case for the dispatch chain)
+
+The subservice tools are registered on a throwaway FastMCP instance, so the
+numbers reflect dispatch/delegation overhead only, not network or disk I/O.
+
+Run with: python scripts/bench_call_tool.py [--iterations N]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from mcp.server.fastmcp import FastMCP
+
+from py_mcp_travelplanner import mcp_server
+
+
+def _register_noop_tools():
+    server = FastMCP("bench")
+
+    @server.tool()
+    async def noop_async(value: int = 0) -> dict:
+        return {"value": value}
+
+    @server.tool()
+    def noop_sync(value: int = 0) -> dict:
+        return {"value": value}
+
+    for original_name in ("noop_async", "noop_sync"):
+        namespaced = f"bench.{original_name}"
+        mcp_server._TOOL_REGISTRY[namespaced] = {
+            'service': 'bench_server',
+            'original_name': original_name,
+            'namespaced_name': namespaced,
+            'description': '',
+            'schema': {},
+            'mcp_instance': server,
+        }
+
+
+async def _measure(name, arguments, iterations):
+    # Warm up caches, lazily-bound invokers and the executor threads
+    for _ in range(50):
+        await mcp_server.call_tool(name, arguments)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await mcp_server.call_tool(name, arguments)
+    elapsed = time.perf_counter() - started
+    return elapsed / iterations * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    _register_noop_tools()
+
+    cases = [
+        ("control: get_metrics", "get_metrics", {}),
+        ("subservice: async no-op", "bench.noop_async", {"value": 1}),
+        ("subservice: sync no-op", "bench.noop_sync", {"value": 1}),
+        ("unknown tool", "does.not_exist", {}),
+    ]
+
+    print(f"call_tool overhead ({args.iterations} iterations per case)")
+    print("-" * 60)
+    for label, name, arguments in cases:
+        per_call = await _measure(name, arguments, args.iterations)
+        print(f"  {label:30} {per_call:10.1f} µs/call")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark the geocoder's distance_matrix tool against per-pair calculate_distance calls.
+
+Builds an N x N matrix of distances between random points three ways:
+1. calculate_distance for every pair (what itinerary planning did before)
+2. distance_matrix(method="geodesic"), exact, upper triangle only
+3. distance_matrix(method="haversine"), one vectorized NumPy pass
+
+and reports the time for each plus the largest haversine deviation from geodesic.
+
+Run with: python scripts/bench_distance_matrix.py [--points N] [--seed S]
+"""
+
+import argparse
+import random
+import time
+
+from py_mcp_travelplanner.geocoder_server import geocoder_server
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    points = [[rng.uniform(-60, 70), rng.uniform(-180, 180)] for _ in range(args.points)]
+
+    def per_pair():
+        return [
+            [geocoder_server.calculate_distance(a[0], a[1], b[0], b[1])["distance"] for b in points]
+            for a in points
+        ]
+
+    loop, loop_ms = _timed(per_pair)
+    geodesic, geodesic_ms = _timed(lambda: geocoder_server.distance_matrix(points, method="geodesic"))
+    haversine, haversine_ms = _timed(lambda: geocoder_server.distance_matrix(points))
+    assert geodesic["success"] and haversine["success"]
+
+    deviation = max(
+        abs(h - g) / g
+        for h_row, g_row in zip(haversine["matrix"], loop)
+        for h, g in zip(h_row, g_row)
+        if g
+    )
+    print(f"{args.points} x {args.points} distance matrix ({args.points ** 2} pairs)")
+    print("-" * 60)
+    print(f"  {'per-pair calculate_distance':32} {loop_ms:10.1f} ms")
+    print(f"  {'distance_matrix (geodesic)':32} {geodesic_ms:10.1f} ms  ({loop_ms / geodesic_ms:.1f}x)")
+    print(f"  {'distance_matrix (haversine)':32} {haversine_ms:10.1f} ms  ({loop_ms / haversine_ms:.1f}x)")
+    print(f"  max haversine deviation from geodesic: {deviation:.3%}")
+
+
+if __name__ == "__main__":
+    main()
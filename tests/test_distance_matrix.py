@@ -0,0 +1,50 @@
+"""Tests for the geocoder's vectorized distance matrix."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("geopy")
+pytest.importorskip("numpy")
+
+from py_mcp_travelplanner.geocoder_server import geocoder_server
+from py_mcp_travelplanner.geocoder_server.distance import geodesic_matrix, haversine_km, haversine_matrix
+
+PARIS = (48.8566, 2.3522)
+LONDON = (51.5074, -0.1278)
+NEW_YORK = (40.7128, -74.0060)
+
+
+def test_haversine_matches_geodesic_within_a_percent():
+    points = [PARIS, LONDON, NEW_YORK]
+    fast = haversine_matrix(points)
+    exact = geodesic_matrix(points)
+
+    assert fast.shape == (3, 3)
+    assert (fast.diagonal() == 0).all()
+    assert (fast == fast.T).all()
+    assert abs(fast - exact).max() / exact.max() < 0.01
+    assert haversine_matrix(points, unit="miles")[0, 1] == pytest.approx(fast[0, 1] / 1.609344)
+    assert haversine_km(*PARIS, *NEW_YORK) == pytest.approx(fast[0, 2])
+
+
+def test_rectangular_matrix_and_input_validation():
+    assert haversine_matrix([PARIS], [LONDON, NEW_YORK], unit="nm").shape == (1, 2)
+    with pytest.raises(ValueError):
+        haversine_matrix([(91.0, 0.0)])
+    with pytest.raises(ValueError):
+        haversine_matrix([PARIS], unit="furlongs")
+
+
+def test_distance_matrix_tool_agrees_with_calculate_distance():
+    result = geocoder_server.distance_matrix(
+        [list(PARIS), {"latitude": LONDON[0], "longitude": LONDON[1]}],
+        method="geodesic",
+        unit="miles",
+    )
+    single = geocoder_server.calculate_distance(*PARIS, *LONDON, unit="miles")
+
+    assert result["success"] is True
+    assert result["matrix"][0][1] == result["matrix"][1][0] == single["distance"]
+    assert result["destinations"] is None
+
+    assert geocoder_server.distance_matrix([PARIS], method="vincenty")["success"] is False
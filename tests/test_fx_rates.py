@@ -0,0 +1,222 @@
+"""Tests for the FX rate table behind convert_currency."""
+from __future__ import annotations
+
+import asyncio
+import email.utils
+
+import httpx
+import pytest
+
+from py_mcp_travelplanner.finance_server import finance_server, fx_rates
+from py_mcp_travelplanner.config import reset_config
+from py_mcp_travelplanner.finance_server.fx_rates import FxRateTable, parse_currencies, parse_pair
+
+MARKETS = {
+    "us": [{"stock": ".DJI:INDEXDJX", "price": 34000.0}],
+    "currencies": [
+        {"stock": "EUR-USD", "price": 1.08},
+        {"stock": "GBP-USD", "price": 1.25},
+        {"stock": "USD-JPY", "price": 150.0},
+        {"stock": "EUR-CHF", "price": 0.95},
+    ],
+    "crypto": [{"stock": "BTC-USD", "price": 60000.0}],
+}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_parse_pair():
+    assert parse_pair("EUR-USD") == ("EUR", "USD")
+    assert parse_pair("gbp / jpy") == ("GBP", "JPY")
+    assert parse_pair("GOOGL:NASDAQ") is None
+
+
+def test_pivot_currencies_from_environment(monkeypatch):
+    monkeypatch.setenv("FX_PIVOT_CURRENCIES", " usd, EUR,, ")
+    reset_config()
+    fx_rates.reset_fx_rate_table()
+    try:
+        table = fx_rates.get_fx_rate_table()
+        assert table.pivots == ("USD", "EUR")
+        table.update_from_markets(MARKETS)
+        assert table.rate("GBP", "JPY").path == ("GBP", "USD", "JPY")
+    finally:
+        monkeypatch.delenv("FX_PIVOT_CURRENCIES")
+        reset_config()
+        fx_rates.reset_fx_rate_table()
+    assert parse_currencies(["gbp"]) == ("GBP",)
+
+
+def test_direct_inverse_and_cross_rates():
+    table = FxRateTable(clock=Clock())
+    assert table.update_from_markets(MARKETS) == 5
+
+    assert table.rate("eur", "usd").rate == 1.08
+    assert table.rate("USD", "EUR").rate == pytest.approx(1 / 1.08)
+    gbp_jpy = table.rate("GBP", "JPY")
+    assert gbp_jpy.rate == pytest.approx(187.5) and gbp_jpy.path == ("GBP", "USD", "JPY")
+    # CHF is only quoted against EUR, JPY only against USD: both pivots are used
+    chf_jpy = table.rate("CHF", "JPY")
+    assert chf_jpy.rate == pytest.approx(150.0 * 1.08 / 0.95)
+    assert chf_jpy.path == ("CHF", "EUR", "USD", "JPY")
+    assert table.convert(2, "BTC", "EUR") == pytest.approx(2 * 60000 / 1.08)
+    assert table.rate("USD", "USD").rate == 1.0
+    assert table.rate("USD", "XAU") is None
+
+
+def test_stale_quotes_are_not_used():
+    clock = Clock()
+    table = FxRateTable(max_age=600, refresh_interval=60, clock=clock)
+    table.update_from_markets(MARKETS)
+    clock.now += 30
+    table.update({"GBP-USD": 1.26})
+    assert not table.needs_refresh()
+
+    clock.now += 590
+    # EUR-USD is 620s old, GBP-USD 590s: only the fresher leg survives
+    assert table.needs_refresh()
+    assert table.rate("EUR", "USD") is None
+    assert table.rate("GBP", "USD").rate == 1.26
+    assert table.rate("GBP", "JPY") is None
+    assert table.rate("EUR", "USD", max_age=3600).rate == 1.08
+    assert table.rate("GBP", "JPY", max_age=3600).as_of == clock.now - 620
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_fetch():
+    table = FxRateTable(clock=Clock())
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"markets": MARKETS}
+
+    counts = await asyncio.gather(*(table.refresh(fetch) for _ in range(5)))
+
+    assert calls == [1] and counts == [5] * 5
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    assert await table.refresh(failing) == 0
+    assert table.stats()["refresh_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_backs_off():
+    clock = Clock()
+    table = FxRateTable(refresh_retry_interval=60, clock=clock)
+
+    async def empty():
+        return {"markets": {}}
+
+    async def snapshot():
+        return {"markets": MARKETS}
+
+    assert table.needs_refresh()
+    assert await table.refresh(empty) == 0
+    clock.now += 59
+    assert not table.needs_refresh()
+    clock.now += 1
+    assert table.needs_refresh()
+    await table.refresh(snapshot)
+    clock.now += 120
+    assert not table.needs_refresh()
+
+
+@pytest.fixture
+def finance(monkeypatch):
+    fx_rates.reset_fx_rate_table()
+    monkeypatch.setenv("SERPAPI_KEY", "test-key")
+    saved = []
+    monkeypatch.setattr(finance_server, "_result_store",
+                        lambda: type("Store", (), {"save": lambda self, *a: saved.append(a[0])})())
+    queries = []
+
+    async def fake_get(url, params=None, headers=None, timeout=None):
+        queries.append(params["q"])
+        if params["q"] == "USD-THB":
+            body = {"summary": {"extracted_price": 36.0}, "markets": {}}
+        else:
+            body = {"summary": {"extracted_price": 1.08}, "markets": MARKETS}
+        return httpx.Response(200, json=body, request=httpx.Request("GET", url))
+
+    async def cached_search(params, timeout=None):
+        raise AssertionError("FX quotes must not come from the response cache")
+
+    monkeypatch.setattr(finance_server, "async_http_get", fake_get)
+    monkeypatch.setattr(finance_server, "serpapi_search_async", cached_search)
+    yield queries, saved
+    fx_rates.reset_fx_rate_table()
+
+
+@pytest.mark.asyncio
+async def test_convert_currency_answers_locally_from_one_snapshot(finance):
+    queries, saved = finance
+
+    first = await finance_server.convert_currency("GBP", "JPY", amount=10)
+    second = await finance_server.convert_currency("jpy", "eur", amount=1500)
+    third = await finance_server.convert_currency("USD", "GBP")
+
+    assert queries == ["EUR-USD"] and saved == []
+    assert first["converted_amount"] == pytest.approx(1875.0)
+    assert first["rate_source"] == "rate_table" and first["rate_path"] == ["GBP", "USD", "JPY"]
+    assert second["converted_amount"] == pytest.approx(10 / 1.08)
+    assert third["exchange_rate"] == pytest.approx(0.8)
+
+
+@pytest.mark.asyncio
+async def test_market_overview_quotes_keep_their_upstream_date(finance, monkeypatch):
+    queries, _ = finance
+    now = fx_rates.time.time()
+    served = email.utils.formatdate(now - 7200, usegmt=True)
+
+    async def replayed(params, timeout=None):
+        return httpx.Response(200, json={"markets": MARKETS}, headers={"date": served},
+                              request=httpx.Request("GET", "https://serpapi.com/search"))
+
+    monkeypatch.setattr(finance_server, "serpapi_get_async", replayed)
+    await finance_server.get_market_overview()
+
+    table = fx_rates.get_fx_rate_table()
+    assert table.rate("EUR", "USD") is None
+    assert table.rate("EUR", "USD", max_age=3 * 3600).as_of == pytest.approx(now - 7200, abs=1)
+    assert queries == []
+
+
+@pytest.mark.asyncio
+async def test_convert_currency_requests_underivable_pairs_once(finance):
+    queries, saved = finance
+
+    first = await finance_server.convert_currency("USD", "THB", amount=2)
+    second = await finance_server.convert_currency("THB", "EUR", amount=36)
+
+    assert queries == ["EUR-USD", "USD-THB"] and len(saved) == 1
+    assert first["rate_source"] == "pair_request" and first["converted_amount"] == 72.0
+    assert second["rate_source"] == "rate_table"
+    assert second["converted_amount"] == pytest.approx(1 / 1.08)
+
+
+@pytest.mark.asyncio
+async def test_failing_snapshot_is_not_refetched_on_every_conversion(finance, monkeypatch):
+    queries, _ = finance
+
+    async def unavailable(url, params=None, headers=None, timeout=None):
+        queries.append(params["q"])
+        status, body = (503, {}) if params["q"] == "EUR-USD" else (200, {"summary": {"extracted_price": 2.0}})
+        return httpx.Response(status, json=body, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(finance_server, "async_http_get", unavailable)
+    first = await finance_server.convert_currency("USD", "THB")
+    second = await finance_server.convert_currency("GBP", "JPY")
+
+    assert queries == ["EUR-USD", "USD-THB", "GBP-JPY"]
+    assert first["converted_amount"] == second["converted_amount"] == 2.0
+    assert fx_rates.get_fx_rate_table().stats()["refresh_errors"] == 1
@@ -0,0 +1,159 @@
+"""Tests for the persistent geocode cache and its use in the geocoder server."""
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("geopy")
+
+from py_mcp_travelplanner.geocoder_server import geocode_cache, geocoder_server
+from py_mcp_travelplanner.geocoder_server.geocode_cache import (
+    GeocodeCache,
+    forward_key,
+    reverse_key,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _place(name: str, lat: float, lon: float):
+    return SimpleNamespace(latitude=lat, longitude=lon, address=name, raw={"display_name": name})
+
+
+@pytest.fixture
+def nominatim(tmp_path, monkeypatch):
+    """Route the geocoder server to a fake Nominatim and a temporary cache."""
+    geocode_cache.reset_geocode_caches()
+    geocoder_server.reset_location_indexes()
+    monkeypatch.setattr(geocoder_server, "GEOCODE_DIR", str(tmp_path / "geocoded_locations"))
+    calls = []
+
+    def geocode(query, **params):
+        calls.append(("geocode", query))
+        if "nowhere" in query.lower():
+            return None
+        return _place(f"{query.title()}, Earth", 48.8566, 2.3522)
+
+    def reverse(point, **params):
+        calls.append(("reverse", point))
+        return _place("Somewhere Street", *point)
+
+    monkeypatch.setattr(geocoder_server, "get_geolocator", lambda: (geocode, reverse))
+    yield calls
+    geocode_cache.reset_geocode_caches()
+    geocoder_server.reset_location_indexes()
+
+
+def test_keys_normalize_query_and_round_coordinates():
+    assert forward_key("  Paris,   FRANCE ") == forward_key("paris, france")
+    assert forward_key("Paris", country_codes="FR, be") == forward_key("paris", country_codes="be,fr")
+    assert forward_key("Paris", language="fr") != forward_key("Paris")
+
+    assert reverse_key(48.85661, 2.35222) == reverse_key(48.85659, 2.35218)
+    assert reverse_key(48.8566, 2.3522, zoom=10) != reverse_key(48.8566, 2.3522)
+
+
+def test_ttl_and_lru_bound(tmp_path):
+    clock = FakeClock()
+    cache = GeocodeCache(tmp_path / "cache.sqlite3", ttl=100, negative_ttl=10,
+                         max_entries=2, clock=clock)
+    cache.put("forward:a", {"locations": [1]})
+    cache.put("forward:none", {"locations": []}, negative=True)
+    clock.now += 20
+
+    assert cache.get("forward:a") == {"locations": [1]}
+    assert cache.get("forward:none") is None
+
+    cache.put("forward:b", {"locations": [2]})
+    cache.put("forward:c", {"locations": [3]})
+
+    assert cache.stats()["entries"] == 2
+    assert cache.get("forward:c") is not None
+    clock.now += 200
+    assert cache.get("forward:c") is None
+    cache.close()
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    first = GeocodeCache(path)
+    first.put("forward:paris", {"locations": [{"display_name": "Paris"}]})
+    first.close()
+
+    second = GeocodeCache(path)
+    assert second.get("forward:paris") == {"locations": [{"display_name": "Paris"}]}
+    assert second.stats()["forward"] == {"hits": 1, "misses": 0, "hit_rate": 1.0}
+    second.close()
+
+
+def test_geocode_location_serves_repeats_from_cache(nominatim):
+    first = geocoder_server.geocode_location("Paris, France")
+    second = geocoder_server.geocode_location("paris,  france")
+    missing = geocoder_server.geocode_location("Nowhere Land")
+    geocoder_server.geocode_location("nowhere land")
+
+    assert first["cached"] is False and second["cached"] is True
+    assert second["location_data"] == first["location_data"]
+    assert missing["success"] is False
+    assert nominatim == [("geocode", "Paris, France"), ("geocode", "Nowhere Land")]
+
+    stats = geocoder_server.get_geocode_cache_stats()
+    assert stats["forward"]["hits"] == 2
+    assert stats["forward"]["hit_rate"] == 0.5
+
+
+def test_reverse_geocode_uses_grid_cell(nominatim):
+    geocoder_server.reverse_geocode(48.85661, 2.35222)
+    cached = geocoder_server.reverse_geocode(48.85659, 2.35219)
+
+    assert cached["cached"] is True
+    assert cached["coordinates"] == {"latitude": 48.85659, "longitude": 2.35219}
+    assert len([c for c in nominatim if c[0] == "reverse"]) == 1
+
+
+def test_search_locations_consults_cache(nominatim):
+    geocoder_server.geocode_location("Lyon")
+
+    results = json.loads(geocoder_server.search_locations("lyon"))
+
+    assert results["matches_found"] == 1
+    assert results["results"][0]["location_data"]["display_name"] == "Lyon, Earth"
+
+
+def test_batch_geocode_dedupes_and_serves_cache_hits(nominatim, tmp_path):
+    geocoder_server.geocode_location("Paris")
+    nominatim.clear()
+
+    batch = geocoder_server.batch_geocode(["Paris", "Lyon", " lyon ", "PARIS", "", "Nowhere"])
+
+    assert nominatim == [("geocode", "Lyon"), ("geocode", "Nowhere")]
+    assert [r["source"] for r in batch["results"]] == [
+        "cache", "nominatim", "duplicate", "duplicate", None, "nominatim"
+    ]
+    assert batch["unique_locations"] == 3
+    assert batch["cache_hits"] == 1 and batch["geocoded"] == 2
+    assert batch["successful"] == 4 and batch["failed"] == 2
+    assert batch["results"][2]["location_data"]["display_name"] == "Lyon, Earth"
+    assert set(batch["timing"]) == {"total_ms", "cache_ms", "geocode_ms"}
+
+    saved = list((tmp_path / "geocoded_locations").iterdir())
+    assert [p.name for p in saved if p.name.startswith("batch_")] == [f"{batch['batch_id']}.json"]
+    assert len(saved) == 2  # the earlier geocode_location file plus the batch
+
+
+def test_reverse_geocode_reuses_nearby_result_across_cells(nominatim):
+    geocoder_server.reverse_geocode(48.85665, 2.35225)
+    nearby = geocoder_server.reverse_geocode(48.85675, 2.35235)  # ~13 m away, different cell
+    other_zoom = geocoder_server.reverse_geocode(48.85675, 2.35235, zoom=10)
+
+    assert nearby["cached"] is True
+    assert other_zoom["cached"] is False
+    assert len([c for c in nominatim if c[0] == "reverse"]) == 2
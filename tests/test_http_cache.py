@@ -0,0 +1,93 @@
+"""Tests for the HTTP validator cache used by upstream GET requests."""
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from py_mcp_travelplanner import http_client
+from py_mcp_travelplanner.http_cache import HttpCache, freshness_lifetime, parse_cache_control
+from py_mcp_travelplanner.rate_limit import TokenBucket
+
+URL = "https://api.weather.gov/gridpoints/TOP/31,80/forecast"
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_parse_cache_control_and_freshness():
+    assert parse_cache_control('public, max-age=300, s-maxage="60"') == {
+        "public": "", "max-age": "300", "s-maxage": "60",
+    }
+    assert freshness_lifetime(httpx.Headers({"cache-control": "max-age=300", "age": "100"}), 0) == 200
+    assert freshness_lifetime(httpx.Headers({"cache-control": "no-cache, max-age=300"}), 0) == 0
+    assert freshness_lifetime(httpx.Headers({
+        "expires": "Wed, 21 Oct 2015 07:28:00 GMT", "date": "Wed, 21 Oct 2015 07:18:00 GMT",
+    }), 0) == 600
+
+
+def test_store_skips_uncacheable_responses():
+    cache = HttpCache()
+    assert cache.store("a", httpx.Response(200, content=b"{}")) is None
+    assert cache.store("b", httpx.Response(200, content=b"{}", headers={
+        "cache-control": "no-store", "etag": '"x"'})) is None
+    assert cache.store("c", httpx.Response(404, headers={"etag": '"x"'})) is None
+    assert cache.store("d", httpx.Response(200, content=b"{}", headers={"etag": '"x"'})) is not None
+    assert cache.stats()["entries"] == 1
+
+
+def test_lru_is_bounded_by_bytes():
+    cache = HttpCache(max_bytes=10)
+    for key in "abc":
+        cache.store(key, httpx.Response(200, content=b"12345", headers={"etag": key}))
+
+    assert cache.lookup("a") is None
+    assert cache.lookup("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_cached_get_serves_fresh_then_revalidates(monkeypatch):
+    clock = FakeClock()
+    cache = HttpCache(clock=clock)
+    monkeypatch.setattr(http_client, "get_http_cache", lambda: cache)
+    seen = []
+    state = {"etag": '"v1"', "body": {"periods": [1]}}
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        headers = {"etag": state["etag"], "cache-control": "public, max-age=60"}
+        if request.headers.get("if-none-match") == state["etag"]:
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, json=state["body"], headers=headers)
+
+    http_client._ASYNC_CLIENTS[asyncio.get_running_loop()] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler))
+    limiter = TokenBucket(rate=1000.0, capacity=10)
+    try:
+        first = await http_client.async_cached_get(URL, limiter=limiter)
+        fresh = await http_client.async_cached_get(URL, limiter=limiter)
+        assert first.json() == fresh.json() == {"periods": [1]}
+        assert seen == [None]
+
+        clock.now += 120
+        revalidated = await http_client.async_cached_get(URL, limiter=limiter)
+        assert revalidated.status_code == 200 and revalidated.json() == {"periods": [1]}
+        assert seen == [None, '"v1"']
+
+        clock.now += 120
+        state.update(etag='"v2"', body={"periods": [2]})
+        changed = await http_client.async_cached_get(URL, limiter=limiter)
+        assert changed.json() == {"periods": [2]}
+
+        stats = cache.stats()
+        assert (stats["fresh_hits"], stats["revalidated"], stats["misses"]) == (1, 1, 2)
+        assert limiter.acquired == 3  # Fresh hits send nothing upstream
+    finally:
+        await http_client.reset_async_client()
@@ -0,0 +1,165 @@
+"""Tests for the shared pooled HTTP client."""
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from py_mcp_travelplanner import http_client
+from py_mcp_travelplanner import cli_handlers
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    http_client.reset_session()
+    yield
+    http_client.reset_session()
+
+
+def test_build_session_configures_pool_and_retries():
+    session = http_client.build_session(pool_connections=4, pool_maxsize=7, max_retries=2, backoff_factor=0.25)
+    adapter = session.get_adapter("https://serpapi.com/search")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 7
+    assert adapter._pool_block is True
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.backoff_factor == 0.25
+    assert 429 in adapter.max_retries.status_forcelist
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_get_session_is_shared():
+    assert http_client.get_session() is http_client.get_session()
+
+
+def test_serpapi_get_applies_default_timeout(monkeypatch):
+    fake_session = Mock()
+    monkeypatch.setattr(http_client, "get_session", lambda: fake_session)
+    monkeypatch.setattr(http_client, "default_timeout", lambda: (1.5, 9.0))
+
+    http_client.serpapi_get({"engine": "google_flights"})
+
+    fake_session.get.assert_called_once_with(
+        http_client.SERPAPI_URL,
+        params={"engine": "google_flights"},
+        headers=None,
+        timeout=(1.5, 9.0),
+    )
+
+
+def test_explicit_timeout_overrides_default(monkeypatch):
+    fake_session = Mock()
+    monkeypatch.setattr(http_client, "get_session", lambda: fake_session)
+
+    http_client.http_get("https://example.com", timeout=3.0)
+
+    assert fake_session.get.call_args.kwargs["timeout"] == 3.0
+
+
+def test_verify_serpapi_key_uses_shared_client(monkeypatch):
+    response = Mock(status_code=200)
+    response.json.return_value = {"search_metadata": {}, "organic_results": []}
+    fake_session = Mock()
+    fake_session.get.return_value = response
+    monkeypatch.setattr(http_client, "get_session", lambda: fake_session)
+    monkeypatch.setattr(cli_handlers, "_resolve_serpapi_key", lambda: "token-xyz")
+
+    ok, info = cli_handlers.verify_serpapi_key(timeout=2.0)
+
+    assert ok is True
+    assert info["http_status"] == 200
+    assert fake_session.get.call_args.kwargs["timeout"] == 2.0
+
+
+def _install_mock_async_client(handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    http_client._ASYNC_CLIENTS[asyncio.get_running_loop()] = client
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_async_client_is_shared_per_loop():
+    try:
+        assert http_client.get_async_client() is http_client.get_async_client()
+    finally:
+        await http_client.reset_async_client()
+
+
+@pytest.mark.asyncio
+async def test_async_http_get_retries_retryable_status(monkeypatch):
+    statuses = iter([503, 429, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={"ok": True})
+
+    monkeypatch.setattr(http_client, "_retry_delay", lambda response, attempt, factor: 0)
+    _install_mock_async_client(handler)
+
+    response = await http_client.async_http_get("https://example.com")
+
+    assert response.status_code == 200
+    await http_client.reset_async_client()
+
+
+def test_retry_delay_caps_and_parses_retry_after():
+    def delay(value, attempt=0):
+        headers = {"Retry-After": value} if value is not None else {}
+        return http_client._retry_delay(httpx.Response(429, headers=headers), attempt, 0.5)
+
+    assert delay("2") == 2.0
+    assert delay("3600") == 60.0
+    assert 25 <= delay(email.utils.formatdate(time.time() + 30, usegmt=True)) <= 30
+    assert delay(email.utils.formatdate(time.time() - 30, usegmt=True)) == 0.0
+    assert delay("soon", attempt=2) == 2.0
+
+
+@pytest.mark.asyncio
+async def test_serpapi_search_async_uses_response_cache(monkeypatch):
+    from py_mcp_travelplanner import response_cache
+
+    response_cache.reset_response_cache()
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json={"best_flights": []})
+
+    _install_mock_async_client(handler)
+    params = {"engine": "google_flights", "departure_id": "LAX", "api_key": "k"}
+
+    first = await http_client.serpapi_search_async(params)
+    second = await http_client.serpapi_search_async(params)
+
+    assert first == second == {"best_flights": []}
+    assert len(requests_seen) == 1
+    assert requests_seen[0].url.params["departure_id"] == "LAX"
+    await http_client.reset_async_client()
+    response_cache.reset_response_cache()
+
+
+@pytest.mark.asyncio
+async def test_async_tools_run_concurrently(monkeypatch, tmp_path):
+    from py_mcp_travelplanner.flight_server import flight_server
+
+    async def slow_search(params):
+        await asyncio.sleep(0.2)
+        return {"best_flights": [], "other_flights": []}
+
+    monkeypatch.setenv("SERPAPI_KEY", "test-key")
+    monkeypatch.setattr(flight_server, "FLIGHTS_DIR", str(tmp_path))
+    monkeypatch.setattr(flight_server, "serpapi_search_async", slow_search)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await asyncio.gather(*[
+        flight_server.search_flights(f"AP{i}", "JFK", "2025-12-15", trip_type=2)
+        for i in range(5)
+    ])
+
+    assert all("error" not in r for r in results)
+    assert loop.time() - started < 0.8
@@ -8,6 +8,8 @@ This test suite covers:
 """
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from pathlib import Path
@@ -314,6 +316,68 @@ class TestMCPServerInitialization:
         """Verify logger is configured correctly."""
         assert mcp_server.LOG.name == "py_mcp_travelplanner.mcp_server"
 
+    @pytest.mark.asyncio
+    async def test_every_control_tool_has_a_handler(self):
+        """Verify the dispatch table covers exactly the advertised control tools."""
+        tools = await mcp_server.list_tools()
+        control_names = {t.name for t in tools if "." not in t.name}
+
+        assert control_names == set(mcp_server._CONTROL_HANDLERS)
+
+    @pytest.mark.asyncio
+    async def test_registry_entries_have_resolved_invokers(self):
+        """Verify invokers are bound once at registry initialization."""
+        await mcp_server._initialize_service_registry()
+
+        for tool_info in mcp_server._TOOL_REGISTRY.values():
+            assert callable(tool_info.get('invoker'))
+
+    @pytest.mark.asyncio
+    async def test_tool_list_is_cached_until_registry_changes(self, monkeypatch):
+        """Verify list_tools reuses the assembled list until the registry changes."""
+        first = mcp_server._tool_list_snapshot()
+        tools = await mcp_server.list_tools()
+        assert mcp_server._tool_list_snapshot() is first
+        assert [t.name for t in tools] == [t.name for t in first.tools]
+
+        monkeypatch.setitem(mcp_server._TOOL_REGISTRY, "demo.echo", {
+            'service': 'demo_server',
+            'original_name': 'echo',
+            'namespaced_name': 'demo.echo',
+            'description': 'Echo',
+            'schema': {'type': 'object', 'properties': {}},
+            'mcp_instance': None,
+        })
+        monkeypatch.setattr(mcp_server, "_REGISTRY_INITIALIZED", True)
+
+        second = mcp_server._tool_list_snapshot()
+        assert second.generation > first.generation
+        assert "demo.echo" in {t.name for t in await mcp_server.list_tools()}
+        assert mcp_server._tool_list_snapshot() is second
+
+    @pytest.mark.asyncio
+    async def test_generation_bump_notifies_listing_sessions(self, monkeypatch):
+        """Verify sessions that listed tools are sent notifications/tools/list_changed."""
+        class Session:
+            def __init__(self):
+                self.notified = 0
+
+            async def send_tool_list_changed(self):
+                self.notified += 1
+
+        session = Session()
+        context = Mock(session=session)
+        monkeypatch.setattr(type(mcp_server.mcp), "request_context", property(lambda self: context))
+        monkeypatch.setattr(mcp_server, "_LISTING_SESSIONS", mcp_server.weakref.WeakSet())
+
+        await mcp_server.list_tools()
+        await asyncio.sleep(0)
+        before = session.notified
+        mcp_server._bump_registry_generation()
+        await asyncio.sleep(0)
+
+        assert session.notified == before + 1
+
 
 class TestMCPServerEdgeCases:
     """Test suite for edge cases and error conditions."""
@@ -0,0 +1,163 @@
+"""Tests for the columnar finance price series store and its analysis tool."""
+from __future__ import annotations
+
+import math
+import threading
+import warnings
+
+import httpx
+import numpy as np
+import pytest
+
+from py_mcp_travelplanner.finance_server import finance_server, price_series
+from py_mcp_travelplanner.finance_server.price_series import (
+    PriceSeriesStore,
+    analyze,
+    merge,
+    moving_average,
+    parse_graph,
+    parse_timestamp,
+)
+
+
+def _graph(start_day, prices):
+    return [
+        {"price": price, "currency": "USD", "volume": 1000 + i,
+         "date": f"Oct {start_day + i:02d} 2023, 04:00 PM UTC-04:00"}
+        for i, price in enumerate(prices)
+    ]
+
+
+def test_parse_timestamp_formats():
+    assert parse_timestamp("Oct 02 2023, 04:00 PM UTC-04:00") == 1696276800
+    assert parse_timestamp("Oct 02 2023, 08:00 PM UTC") == 1696276800
+    assert parse_timestamp("2023-10-02T20:00:00+00:00") == 1696276800
+    assert parse_timestamp("yesterday") is None
+
+
+def test_parse_graph_skips_bad_points_and_sorts():
+    graph = _graph(3, [11.0, 12.0]) + _graph(1, [10.0]) + [{"price": None, "date": "Oct 09 2023, 04:00 PM UTC"}]
+    graph[0].pop("volume")
+
+    series = parse_graph(graph)
+
+    assert series.prices.tolist() == [10.0, 11.0, 12.0]
+    assert np.all(np.diff(series.timestamps) > 0)
+    assert math.isnan(series.volumes[1])
+
+
+def test_merge_overlapping_windows_prefers_newer_points():
+    stored = parse_graph(_graph(1, [10.0, 11.0, 12.0]))
+    fetched = parse_graph(_graph(3, [12.5, 13.0]))
+
+    merged = merge(stored, fetched)
+
+    assert merged.prices.tolist() == [10.0, 11.0, 12.5, 13.0]
+    assert merge(merged, parse_graph(_graph(10, [14.0]))).prices.tolist()[-1] == 14.0
+
+
+def test_store_round_trips_memory_mapped_columns(tmp_path):
+    store = PriceSeriesStore(tmp_path)
+    store.merge("GOOGL:NASDAQ", "1m", parse_graph(_graph(1, [10.0, 11.0])))
+    store.merge("GOOGL:NASDAQ", "1M", parse_graph(_graph(2, [11.5, 12.0])))
+
+    series = store.load("googl:nasdaq", "1M")
+
+    assert isinstance(series.prices, np.memmap)
+    assert series.prices.tolist() == [10.0, 11.5, 12.0]
+    assert store.metadata("GOOGL:NASDAQ", "1M")["points"] == 3
+    assert store.load("AAPL", "1M") is None
+
+
+def test_store_swaps_in_complete_versions(tmp_path):
+    store = PriceSeriesStore(tmp_path)
+    store.merge("GOOGL", "1M", parse_graph(_graph(1, [10.0, 11.0])))
+    before = store.load("GOOGL", "1M")
+    first_version = store.metadata("GOOGL", "1M")["version"]
+
+    store.merge("GOOGL", "1M", parse_graph(_graph(3, [12.0, 13.0])))
+    after = store.load("GOOGL", "1M")
+    meta = store.metadata("GOOGL", "1M")
+
+    # The earlier reader keeps its own aligned columns
+    assert before.prices.tolist() == [10.0, 11.0] and len(before.timestamps) == 2
+    assert after.prices.tolist() == [10.0, 11.0, 12.0, 13.0]
+    assert meta["version"] != first_version and meta["points"] == 4
+    path = store._path("GOOGL", "1M")
+    assert [p.name for p in path.iterdir() if p.is_dir()] == [meta["version"]]
+    assert not list(path.glob(".meta-*"))
+
+
+@pytest.mark.skipif(price_series.fcntl is None, reason="needs fcntl file locks")
+def test_merge_waits_for_another_processes_lock(tmp_path):
+    store = PriceSeriesStore(tmp_path)
+    store.merge("GOOGL", "1M", parse_graph(_graph(1, [10.0])))
+    path = store._path("GOOGL", "1M")
+
+    # A separate open file description stands in for another server process
+    with open(path / ".lock", "a") as other:
+        price_series.fcntl.flock(other.fileno(), price_series.fcntl.LOCK_EX)
+        writer = threading.Thread(target=store.merge, args=("GOOGL", "1M", parse_graph(_graph(2, [11.0]))))
+        writer.start()
+        writer.join(0.2)
+        assert writer.is_alive()
+        price_series.fcntl.flock(other.fileno(), price_series.fcntl.LOCK_UN)
+    writer.join(2)
+
+    assert not writer.is_alive()
+    assert store.load("GOOGL", "1M").prices.tolist() == [10.0, 11.0]
+
+
+def test_analyze_statistics():
+    prices = [100.0, 110.0, 99.0, 120.0]
+    stats = analyze(parse_graph(_graph(2, prices)), moving_averages=(2, 10))
+
+    assert stats["total_return"] == pytest.approx(0.2)
+    assert stats["max_drawdown"] == pytest.approx(-0.1)
+    assert stats["best_return"] == pytest.approx(120 / 99 - 1, abs=1e-6)
+    assert stats["moving_averages"] == {"2": 109.5, "10": None}
+    assert moving_average(np.array(prices), 3).tolist() == pytest.approx([103.0, 329 / 3])
+    assert stats["volatility"] == pytest.approx(np.std(np.diff(np.log(prices)), ddof=1), abs=1e-6)
+
+
+def test_zero_prices_do_not_poison_statistics():
+    graph = _graph(1, [100.0, 0, 110.0, -1.0])
+    assert parse_graph(graph).prices.tolist() == [100.0, 110.0]
+
+    timestamps = np.arange(4, dtype=np.int64) * 86400
+    stored = price_series.PriceSeries(timestamps, np.array([100.0, 0.0, 110.0, np.nan]), np.full(4, np.nan))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        stats = analyze(stored)
+
+    assert stats["points"] == 2
+    assert stats["total_return"] == pytest.approx(0.1)
+    assert all(not (isinstance(v, float) and math.isnan(v)) for v in stats.values())
+
+
+@pytest.mark.asyncio
+async def test_historical_data_feeds_analysis_without_refetching(tmp_path, monkeypatch):
+    price_series.reset_price_series_stores()
+    monkeypatch.setenv("SERPAPI_KEY", "test-key")
+    monkeypatch.setattr(finance_server, "FINANCE_DIR", str(tmp_path))
+    monkeypatch.setattr(finance_server, "_result_store", lambda: type("Store", (), {"save": lambda self, *a: "x"})())
+    calls = []
+
+    async def fake_get(params, timeout=None):
+        calls.append(params["window"])
+        body = {"graph": _graph(1, [100.0, 105.0, 102.0]), "key_events": []}
+        return httpx.Response(200, json=body, request=httpx.Request("GET", "https://serpapi.com/search"))
+
+    monkeypatch.setattr(finance_server, "serpapi_get_async", fake_get)
+    try:
+        fetched = await finance_server.get_historical_data("googl", "nasdaq", window="1m")
+        analysis = finance_server.analyze_price_history("GOOGL", "NASDAQ", window="1M", moving_averages=[2])
+        missing = finance_server.analyze_price_history("AAPL")
+    finally:
+        price_series.reset_price_series_stores()
+
+    assert fetched["statistics"]["max_price"] == 105.0 and fetched["stored_points"] == 3
+    assert calls == ["1M"]
+    assert analysis["statistics"]["last_price"] == 102.0
+    assert analysis["statistics"]["moving_averages"] == {"2": 103.5}
+    assert "error" in missing
@@ -0,0 +1,91 @@
+"""Tests for the shared token-bucket rate limiter."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from py_mcp_travelplanner import rate_limit
+from py_mcp_travelplanner.rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_reservations_are_spaced_by_the_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.5, 1.0]
+    clock.now += 10
+    assert bucket.reserve() == 0.0
+    assert bucket.stats()["acquired"] == 4
+
+
+def test_capacity_allows_a_burst():
+    bucket = TokenBucket(rate=1.0, capacity=3, clock=FakeClock())
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.0, 1.0]
+
+
+def test_threads_and_tasks_share_one_schedule():
+    bucket = TokenBucket(rate=50.0)
+    started = time.monotonic()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+
+    async def tasks():
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(3)))
+
+    asyncio.run(tasks())
+    for thread in threads:
+        thread.join()
+
+    # Six calls at 50/s: the last one waits at least 5 intervals
+    assert time.monotonic() - started >= 5 / 50.0 - 0.01
+    assert bucket.stats()["acquired"] == 6
+
+
+def test_get_rate_limiter_is_shared_per_name():
+    rate_limit.reset_rate_limiters()
+    first = rate_limit.get_rate_limiter("upstream", rate=1.0)
+
+    assert rate_limit.get_rate_limiter("upstream", rate=5.0) is first
+    assert rate_limit.get_rate_limiter("other", rate=1.0) is not first
+    rate_limit.reset_rate_limiters()
+
+
+def test_geolocator_is_created_once(monkeypatch):
+    pytest.importorskip("geopy")
+    from py_mcp_travelplanner.geocoder_server import geocoder_server
+
+    created = []
+
+    class FakeNominatim:
+        def __init__(self, user_agent):
+            created.append(user_agent)
+
+        def geocode(self, query, **params):
+            return query
+
+        def reverse(self, point, **params):
+            return point
+
+    geocoder_server.reset_geolocator()
+    monkeypatch.setattr(geocoder_server, "Nominatim", FakeNominatim)
+    try:
+        geocode, reverse = geocoder_server.get_geolocator()
+        assert geocoder_server.get_geolocator() == (geocode, reverse)
+        assert geocode("Paris") == "Paris"
+        assert created == [geocoder_server.DEFAULT_USER_AGENT]
+        assert rate_limit.rate_limiter_stats()["nominatim"]["acquired"] == 1
+    finally:
+        geocoder_server.reset_geolocator()
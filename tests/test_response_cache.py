@@ -0,0 +1,131 @@
+"""Tests for the SerpAPI response cache."""
+from __future__ import annotations
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from py_mcp_travelplanner import http_client
+from py_mcp_travelplanner import mcp_server
+from py_mcp_travelplanner import response_cache
+from py_mcp_travelplanner.response_cache import ResponseCache, make_cache_key
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    response_cache.reset_response_cache()
+    yield
+    response_cache.reset_response_cache()
+
+
+def test_cache_key_ignores_api_key_and_order():
+    a = make_cache_key({"engine": "google_hotels", "q": "Paris", "api_key": "one"})
+    b = make_cache_key({"api_key": "two", "q": "Paris", "engine": "google_hotels"})
+    c = make_cache_key({"engine": "google_hotels", "q": "Rome", "api_key": "one"})
+
+    assert a == b
+    assert a != c
+
+
+def test_cache_key_normalizes_value_types():
+    assert make_cache_key({"adults": 1}) == make_cache_key({"adults": "1"})
+
+
+def test_entries_expire_after_engine_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(ttls={"google_finance": 60}, default_ttl=900, clock=clock)
+    quote = {"engine": "google_finance", "q": "AAPL"}
+    hotel = {"engine": "google_hotels", "q": "Paris"}
+
+    cache.set(quote, {"price": 1})
+    cache.set(hotel, {"hotels": []})
+    clock.now += 61
+
+    assert cache.get(quote) is None
+    assert cache.get(hotel) == {"hotels": []}
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_eviction_respects_byte_budget():
+    payload = {"data": "x" * 100}
+    size = len(json.dumps(payload, separators=(',', ':')))
+    cache = ResponseCache(max_bytes=size * 2, default_ttl=None)
+
+    cache.set({"q": "a"}, payload)
+    cache.set({"q": "b"}, payload)
+    cache.get({"q": "a"})  # 'a' becomes most recently used
+    cache.set({"q": "c"}, payload)
+
+    assert cache.get({"q": "b"}) is None
+    assert cache.get({"q": "a"}) == payload
+    assert cache.get({"q": "c"}) == payload
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= stats["max_bytes"]
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    params = {"engine": "google_flights", "departure_id": "JFK"}
+    ResponseCache(disk_dir=tmp_path).set(params, {"best_flights": [1, 2]})
+
+    reloaded = ResponseCache(disk_dir=tmp_path)
+
+    assert reloaded.get(params) == {"best_flights": [1, 2]}
+    assert reloaded.stats()["disk_hits"] == 1
+
+
+def test_hits_return_independent_copies():
+    cache = ResponseCache()
+    cache.set({"q": "a"}, {"items": [1]})
+
+    first = cache.get({"q": "a"})
+    first["items"].append(2)
+
+    assert cache.get({"q": "a"}) == {"items": [1]}
+
+
+def test_serpapi_search_serves_repeat_requests_from_cache(monkeypatch):
+    response = Mock(status_code=200)
+    response.json.return_value = {"properties": [{"name": "Hotel"}]}
+    fake_get = Mock(return_value=response)
+    monkeypatch.setattr(http_client, "serpapi_get", fake_get)
+
+    params = {"engine": "google_hotels", "q": "Paris", "api_key": "k1"}
+    first = http_client.serpapi_search(params)
+    second = http_client.serpapi_search({**params, "api_key": "k2"})
+
+    assert first == second
+    assert fake_get.call_count == 1
+    stats = response_cache.get_response_cache().stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_serpapi_search_does_not_cache_errors(monkeypatch):
+    response = Mock(status_code=200)
+    response.json.return_value = {"error": "Invalid API key"}
+    fake_get = Mock(return_value=response)
+    monkeypatch.setattr(http_client, "serpapi_get", fake_get)
+
+    http_client.serpapi_search({"engine": "google_finance", "q": "AAPL"})
+    http_client.serpapi_search({"engine": "google_finance", "q": "AAPL"})
+
+    assert fake_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_reports_cache_stats():
+    result = await mcp_server.call_tool("get_metrics", {})
+    metrics = json.loads(result[0].text)
+
+    assert "hits" in metrics["response_cache"]
+    assert "evictions" in metrics["response_cache"]
@@ -0,0 +1,209 @@
+"""Tests for the saved search result stores."""
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from py_mcp_travelplanner import result_store
+from py_mcp_travelplanner.config import get_config
+from py_mcp_travelplanner.result_store import (
+    JsonFileResultStore,
+    ParsedResultCache,
+    SqliteResultStore,
+)
+
+
+def _flight(search_id: str, route=("LAX", "CDG"), price=500, timestamp="2025-01-01T10:00:00"):
+    return {
+        "search_metadata": {
+            "search_id": search_id,
+            "departure": route[0],
+            "arrival": route[1],
+            "search_timestamp": timestamp,
+        },
+        "best_flights": [{"price": price}],
+        "other_flights": [{"price": price + 100}],
+    }
+
+
+def _index(document):
+    metadata = document["search_metadata"]
+    flights = document["best_flights"] + document["other_flights"]
+    return {
+        "route": f"{metadata['departure']}-{metadata['arrival']}",
+        "min_price": min(f["price"] for f in flights),
+        "result_count": len(flights),
+    }
+
+
+@pytest.fixture(autouse=True)
+def fresh_result_cache():
+    result_store.reset_parsed_result_cache()
+    yield
+    result_store.reset_parsed_result_cache()
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        store = JsonFileResultStore(tmp_path / "flights", "flights", index=_index)
+    else:
+        store = SqliteResultStore(tmp_path / "results.sqlite3", "flights", index=_index)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    """Select a result store backend through the runtime configuration."""
+    config = get_config()
+    saved = {key: config.get(key) for key in ('RESULT_STORE_BACKEND', 'RESULT_STORE_PATH')}
+    result_store.reset_result_stores()
+
+    def select(name: str):
+        config.set('RESULT_STORE_BACKEND', name)
+        config.set('RESULT_STORE_PATH', str(tmp_path / "results.sqlite3"))
+
+    yield select
+    result_store.reset_result_stores()
+    for key, value in saved.items():
+        config.set(key, value)
+
+
+def test_round_trip_and_delete(store):
+    document = _flight("a")
+    store.save("a", document)
+
+    assert store.load("a") == document
+    assert store.load("missing") is None
+    assert store.delete("a") is True
+    assert store.load("a") is None
+    assert store.delete("a") is False
+
+
+def test_list_searches_filters_and_orders_newest_first(store):
+    store.save("old", _flight("old", timestamp="2025-01-01T10:00:00"))
+    store.save("new", _flight("new", timestamp="2025-02-01T10:00:00"))
+    store.save("cheap", _flight("cheap", route=("JFK", "LHR"), price=200, timestamp="2025-01-15T10:00:00"))
+
+    assert [s["search_id"] for s in store.list_searches()] == ["new", "cheap", "old"]
+    assert [s["search_id"] for s in store.list_searches(route="LAX-CDG")] == ["new", "old"]
+    assert [s["search_id"] for s in store.list_searches(max_price=300)] == ["cheap"]
+    assert [s["search_id"] for s in store.list_searches(limit=1)] == ["new"]
+
+    summary = store.list_searches(route="JFK-LHR")[0]
+    assert summary["min_price"] == 200
+    assert summary["result_count"] == 2
+    assert summary["metadata"]["departure"] == "JFK"
+
+
+def test_sqlite_store_indexes_columns_and_compresses_payload(tmp_path):
+    path = tmp_path / "results.sqlite3"
+    store = SqliteResultStore(path, "flights", index=_index)
+    document = _flight("a")
+    document["best_flights"] = [{"price": 500, "airline": "Example Air " * 50}] * 20
+    store.save("a", document)
+    store.close()
+
+    conn = sqlite3.connect(path)
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list('flights')")}
+    payload = conn.execute("SELECT payload FROM flights WHERE search_id = 'a'").fetchone()[0]
+    conn.close()
+
+    assert {"flights_search_timestamp", "flights_route", "flights_min_price"} <= indexes
+    assert len(payload) < len(json.dumps(document)) / 5
+
+
+def test_sqlite_store_imports_existing_json_files(tmp_path):
+    legacy = JsonFileResultStore(tmp_path / "flights", "flights")
+    legacy.save("a", _flight("a"))
+    (tmp_path / "flights" / "broken.json").write_text("{not json")
+
+    store = SqliteResultStore(tmp_path / "results.sqlite3", "flights", index=_index,
+                              legacy_dir=tmp_path / "flights")
+
+    assert store.load("a") == _flight("a")
+    assert [s["search_id"] for s in store.list_searches()] == ["a"]
+    store.close()
+
+
+def test_get_result_store_follows_configured_backend(backend, tmp_path):
+    backend("sqlite")
+    store = result_store.get_result_store("hotels", tmp_path / "hotels")
+
+    assert isinstance(store, SqliteResultStore)
+    assert result_store.get_result_store("hotels", tmp_path / "hotels") is store
+
+    backend("parquet")
+    with pytest.raises(ValueError):
+        result_store.get_result_store("hotels", tmp_path / "hotels")
+
+
+@pytest.mark.asyncio
+async def test_flight_server_uses_sqlite_store(backend, tmp_path, monkeypatch):
+    from py_mcp_travelplanner.flight_server import flight_server
+
+    async def fake_search(params):
+        return {"best_flights": [{"price": 420, "flights": [{"airline": "Delta"}]}], "other_flights": []}
+
+    backend("sqlite")
+    monkeypatch.setenv("SERPAPI_KEY", "test-key")
+    monkeypatch.setattr(flight_server, "FLIGHTS_DIR", str(tmp_path / "flights"))
+    monkeypatch.setattr(flight_server, "serpapi_search_async", fake_search)
+
+    summary = await flight_server.search_flights("LAX", "CDG", "2025-12-15", trip_type=2)
+    search_id = summary["search_id"]
+
+    assert not (tmp_path / "flights").exists()
+    assert search_id in flight_server.get_flight_searches()
+    filtered = json.loads(flight_server.filter_flights_by_airline(search_id, ["delta"]))
+    assert filtered["total_filtered"] == 1
+    assert "No flight search found" in flight_server.get_flight_details("missing")
+
+
+def test_repeated_loads_parse_once_until_the_result_changes(store, monkeypatch):
+    store.save("a", _flight("a"))
+    reads = []
+    original_read = store._read
+    monkeypatch.setattr(store, "_read", lambda search_id: reads.append(search_id) or original_read(search_id))
+
+    first = store.load("a")
+    assert store.load("a") is first
+    assert reads == ["a"]
+
+    store.save("a", _flight("a", price=100))
+    assert store.load("a")["best_flights"][0]["price"] == 100
+    assert reads == ["a", "a"]
+
+    stats = result_store.get_parsed_result_cache().stats()
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+
+
+def test_json_cache_entry_is_revalidated_after_external_edit(tmp_path):
+    store = JsonFileResultStore(tmp_path, "flights")
+    store.save("a", _flight("a"))
+    assert store.load("a")["best_flights"][0]["price"] == 500
+
+    # Rewritten by another process: different size and mtime
+    (tmp_path / "a.json").write_text(json.dumps(_flight("a", price=12345)))
+    assert store.load("a")["best_flights"][0]["price"] == 12345
+
+
+def test_parsed_result_cache_evicts_least_recently_used():
+    cache = ParsedResultCache(max_bytes=100)
+    cache.put(("k", "a"), (1, 40), {"a": 1})
+    cache.put(("k", "b"), (1, 40), {"b": 1})
+    assert cache.get(("k", "a"), (1, 40)) == {"a": 1}
+
+    cache.put(("k", "c"), (1, 40), {"c": 1})
+    cache.put(("k", "huge"), (1, 500), {"huge": 1})
+
+    assert cache.get(("k", "b"), (1, 40)) is None
+    assert cache.get(("k", "a"), (1, 40)) == {"a": 1}
+    assert cache.get(("k", "a"), (2, 40)) is None
+    assert cache.get(("k", "huge"), (1, 500)) is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 80
@@ -0,0 +1,92 @@
+"""Tests for the geocoder's in-memory spatial index."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from py_mcp_travelplanner.geocoder_server.distance import haversine_km
+from py_mcp_travelplanner.geocoder_server.spatial_index import SpatialIndex
+
+
+def _brute_force(points, latitude, longitude):
+    return sorted((haversine_km(latitude, longitude, lat, lon), key) for key, (lat, lon) in points.items())
+
+
+def test_nearest_and_within_match_brute_force():
+    rng = random.Random(3)
+    index = SpatialIndex()
+    points = {}
+    for i in range(2000):
+        # Clustered around a few cities plus some global noise, including the antimeridian
+        lat, lon = rng.choice([(48.85, 2.35), (40.71, -74.0), (-17.7, 179.95), (0.0, 0.0)])
+        if i % 10:
+            point = (lat + rng.gauss(0, 0.3), max(-180.0, min(180.0, lon + rng.gauss(0, 0.3))))
+        else:
+            point = (rng.uniform(-89, 89), rng.uniform(-180, 180))
+        points[f"p{i}"] = point
+        index.add(f"p{i}", *point, {"i": i})
+
+    for latitude, longitude in [(48.9, 2.3), (-17.7, -179.98), (85.0, 10.0), (10.0, 100.0)]:
+        expected = _brute_force(points, latitude, longitude)
+        nearest = index.nearest(latitude, longitude, k=7)
+        assert [key for _, key, _ in nearest] == [key for _, key in expected[:7]]
+
+        within = index.within(latitude, longitude, 50.0)
+        assert [key for _, key, _ in within] == [key for d, key in expected if d <= 50.0]
+
+
+def test_add_replaces_and_remove_deletes():
+    index = SpatialIndex()
+    index.add("a", 10.0, 10.0, {"v": 1})
+    index.add("a", -10.0, -10.0, {"v": 2})
+
+    assert len(index) == 1
+    assert index.nearest(-10.0, -10.0, k=5)[0][2] == {"v": 2}
+    assert index.within(10.0, 10.0, 100.0) == []
+    assert index.remove("a") is True
+    assert index.nearest(0.0, 0.0) == []
+    with pytest.raises(ValueError):
+        index.add("bad", 95.0, 0.0, {})
+
+
+def test_where_filters_candidates():
+    index = SpatialIndex()
+    index.add("near", 0.0, 0.0, {"kind": "address"})
+    index.add("far", 1.0, 1.0, {"kind": "place"})
+
+    matches = index.nearest(0.0, 0.0, k=1, where=lambda data: data["kind"] == "place")
+    assert [key for _, key, _ in matches] == ["far"]
+
+
+def test_geocoder_tools_query_the_index(tmp_path, monkeypatch):
+    pytest.importorskip("geopy")
+    from py_mcp_travelplanner.geocoder_server import geocode_cache, geocoder_server
+
+    geocode_cache.reset_geocode_caches()
+    geocoder_server.reset_location_indexes()
+    monkeypatch.setattr(geocoder_server, "GEOCODE_DIR", str(tmp_path / "geocoded_locations"))
+    places = {"Paris": (48.8566, 2.3522), "Versailles": (48.8049, 2.1204), "Lyon": (45.764, 4.8357)}
+
+    def geocode(query, **params):
+        from types import SimpleNamespace
+        lat, lon = places[query]
+        return SimpleNamespace(latitude=lat, longitude=lon, address=f"{query}, France", raw={})
+
+    monkeypatch.setattr(geocoder_server, "get_geolocator", lambda: (geocode, None))
+    try:
+        geocoder_server.batch_geocode(list(places))
+
+        nearest = geocoder_server.nearest_locations(48.86, 2.34, k=2)
+        assert [r["name"] for r in nearest["results"]] == ["Paris, France", "Versailles, France"]
+        assert nearest["results"][0]["query"] == "Paris"
+
+        within = geocoder_server.locations_within(48.86, 2.34, radius=30)
+        assert within["count"] == 2
+
+        # A fresh index is rebuilt from the cache and saved files
+        geocoder_server.reset_location_indexes()
+        assert geocoder_server.nearest_locations(45.7, 4.8, k=1)["results"][0]["name"] == "Lyon, France"
+    finally:
+        geocode_cache.reset_geocode_caches()
+        geocoder_server.reset_location_indexes()
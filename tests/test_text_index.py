@@ -0,0 +1,85 @@
+"""Tests for the geocoder's inverted text index."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from py_mcp_travelplanner.geocoder_server.text_index import TextIndex, tokenize
+
+
+def test_tokenize_folds_case_and_accents():
+    assert tokenize("Zürich,  SWITZERLAND") == ["zurich", "switzerland"]
+    assert tokenize("Île-de-France 75001") == ["ile", "de", "france", "75001"]
+    assert tokenize(None) == []
+
+
+def test_search_requires_every_token_and_matches_prefixes():
+    index = TextIndex()
+    index.add("paris", {"name": "Paris, France"}, {"id": "paris"})
+    index.add("paris-tx", {"name": "Paris, Texas, United States"}, {"id": "paris-tx"})
+    index.add("lyon", {"name": "Lyon, France"}, {"id": "lyon"})
+
+    assert {key for _, key, _ in index.search("paris")} == {"paris", "paris-tx"}
+    assert [key for _, key, _ in index.search("par fra")] == ["paris"]
+    assert index.search("par", prefix=False) == []
+    assert index.search("berlin") == []
+    assert index.search("   ") == []
+
+
+def test_ranking_prefers_exact_tokens_weighted_fields_and_recency():
+    index = TextIndex(field_weights={"query": 2.0, "name": 1.0})
+    index.add("york", {"name": "York, England"}, {})
+    index.add("yorkshire", {"name": "Yorkshire, England"}, {})
+    assert [key for _, key, _ in index.search("york")] == ["york", "yorkshire"]
+
+    index.add("a", {"name": "Springfield"}, {})
+    index.add("b", {"name": "Springfield"}, {})
+    index.add("c", {"query": "springfield", "name": "Somewhere"}, {})
+    assert [key for _, key, _ in index.search("springfield")] == ["c", "b", "a"]
+
+
+def test_readd_and_remove_update_postings():
+    index = TextIndex()
+    index.add("a", {"name": "Old Name"}, {})
+    index.add("a", {"name": "New Name"}, {})
+
+    assert index.search("old") == []
+    assert [key for _, key, _ in index.search("new")] == ["a"]
+    assert index.remove("a") is True
+    assert index.search("name") == [] and len(index) == 0
+
+
+def test_search_locations_finds_forward_and_reverse_results(tmp_path, monkeypatch):
+    pytest.importorskip("geopy")
+    from types import SimpleNamespace
+
+    from py_mcp_travelplanner.geocoder_server import geocode_cache, geocoder_server
+
+    geocode_cache.reset_geocode_caches()
+    geocoder_server.reset_location_indexes()
+    monkeypatch.setattr(geocoder_server, "GEOCODE_DIR", str(tmp_path / "geocoded_locations"))
+
+    def geocode(query, **params):
+        return SimpleNamespace(latitude=47.3769, longitude=8.5417, address="Zürich, Schweiz", raw={})
+
+    def reverse(point, **params):
+        return SimpleNamespace(address="Bahnhofstrasse 1, Zürich", raw={})
+
+    monkeypatch.setattr(geocoder_server, "get_geolocator", lambda: (geocode, reverse))
+    try:
+        assert "No geocoded locations" in geocoder_server.search_locations("zurich")
+
+        geocoder_server.geocode_location("Zurich")
+        geocoder_server.reverse_geocode(47.37, 8.54)
+        results = json.loads(geocoder_server.search_locations("zur"))
+
+        assert results["matches_found"] == 2
+        assert results["results"][0]["location_data"]["display_name"] == "Zürich, Schweiz"
+        assert results["results"][1]["address"] == "Bahnhofstrasse 1, Zürich"
+
+        bahnhof = json.loads(geocoder_server.search_locations("bahnhof zur"))
+        assert bahnhof["matches_found"] == 1
+    finally:
+        geocode_cache.reset_geocode_caches()
+        geocoder_server.reset_location_indexes()
@@ -0,0 +1,173 @@
+"""Tests for the bounded executor that runs synchronous tools."""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from py_mcp_travelplanner import mcp_server
+from py_mcp_travelplanner import tool_executor
+from py_mcp_travelplanner.tool_executor import ToolExecutor
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor():
+    tool_executor.reset_tool_executor()
+    yield
+    tool_executor.reset_tool_executor()
+
+
+@pytest.mark.asyncio
+async def test_service_limit_caps_concurrency():
+    executor = ToolExecutor(max_workers=4, default_service_limit=1)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    await asyncio.gather(*[executor.run("geocoder_server", work) for _ in range(3)])
+
+    assert peak == 1
+    stats = executor.stats()
+    assert stats["completed"] == 3
+    assert stats["services"]["geocoder_server"]["limit"] == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_and_failures_are_counted():
+    executor = ToolExecutor(max_workers=1, default_service_limit=1)
+    release = threading.Event()
+
+    def blocked():
+        release.wait(2)
+        return "done"
+
+    def broken():
+        raise RuntimeError("boom")
+
+    first = asyncio.create_task(executor.run("hotel_server", blocked))
+    second = asyncio.create_task(executor.run("hotel_server", blocked))
+    await asyncio.sleep(0.05)
+
+    stats = executor.stats()
+    assert stats["running"] == 1
+    assert stats["queued"] == 1
+
+    release.set()
+    assert await asyncio.gather(first, second) == ["done", "done"]
+    with pytest.raises(RuntimeError):
+        await executor.run("hotel_server", broken)
+
+    stats = executor.stats()["services"]["hotel_server"]
+    assert stats == {"queued": 0, "running": 0, "completed": 2, "failed": 1, "limit": 1}
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancel_before_a_worker_picks_up_the_call_releases_queue_slot():
+    executor = ToolExecutor(max_workers=1, default_service_limit=1)
+    release = threading.Event()
+    ran = []
+
+    busy = asyncio.create_task(executor.run("hotel_server", release.wait, 2))
+    waiting = asyncio.create_task(executor.run("flight_server", ran.append, 1))
+    await asyncio.sleep(0.05)
+    assert executor.stats()["services"]["flight_server"]["queued"] == 1
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    release.set()
+    await busy
+
+    assert ran == []
+    assert executor.stats()["services"]["flight_server"]["queued"] == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_running_call_keeps_its_service_slot():
+    executor = ToolExecutor(max_workers=2, default_service_limit=1)
+    release = threading.Event()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        release.wait(2)
+        with lock:
+            active -= 1
+
+    first = asyncio.create_task(executor.run("hotel_server", work))
+    await asyncio.sleep(0.05)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    second = asyncio.create_task(executor.run("hotel_server", work))
+    await asyncio.sleep(0.05)
+    assert executor.stats()["services"]["hotel_server"]["running"] == 1
+    assert executor.stats()["services"]["hotel_server"]["queued"] == 1
+
+    release.set()
+    await second
+    assert peak == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sync_tool_delegation_does_not_block_event_loop(monkeypatch):
+    server = FastMCP("executor-test")
+
+    @server.tool()
+    def slow_lookup(query: str) -> dict:
+        time.sleep(0.3)
+        return {"query": query, "thread": threading.current_thread().name}
+
+    monkeypatch.setitem(mcp_server._TOOL_REGISTRY, "test.slow_lookup", {
+        'service': 'test_server',
+        'original_name': 'slow_lookup',
+        'namespaced_name': 'test.slow_lookup',
+        'description': '',
+        'schema': {},
+        'mcp_instance': server,
+    })
+
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    beat = asyncio.create_task(heartbeat())
+    try:
+        result = await mcp_server.call_tool("test.slow_lookup", {"query": "Paris"})
+    finally:
+        beat.cancel()
+
+    payload = json.loads(result[0].text)
+    assert payload["query"] == "Paris"
+    assert payload["thread"].startswith("mcp-tool")
+    assert ticks >= 10
+
+    metrics = json.loads((await mcp_server.call_tool("get_metrics", {}))[0].text)
+    assert metrics["tool_executor"]["services"]["test_server"]["completed"] == 1
@@ -0,0 +1,177 @@
+"""Tests for the static tool manifest and lazy subservice loading."""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from py_mcp_travelplanner import mcp_server
+from py_mcp_travelplanner import tool_manifest
+
+
+@pytest.fixture
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(mcp_server, "_SERVICE_REGISTRY", {})
+    monkeypatch.setattr(mcp_server, "_TOOL_REGISTRY", {})
+    monkeypatch.setattr(mcp_server, "_SERVICE_IMPORT_TIMES", {})
+    monkeypatch.setattr(mcp_server, "_REGISTRY_INITIALIZED", False)
+
+
+@pytest.fixture
+def manifest_file(tmp_path, monkeypatch):
+    path = tmp_path / "tool_manifest.json"
+    monkeypatch.setattr(tool_manifest, "manifest_path", lambda: path)
+    return path
+
+
+def test_manifest_round_trip(tmp_path):
+    registry = {
+        "flight.get_flight_details": {
+            'service': 'flight_server',
+            'original_name': 'get_flight_details',
+            'namespaced_name': 'flight.get_flight_details',
+            'description': 'Get details',
+            'schema': {'type': 'object', 'properties': {}},
+            'mcp_instance': object(),
+        }
+    }
+    manifest = tool_manifest.build_manifest(
+        registry, {'flight_server': 'py_mcp_travelplanner.flight_server.flight_server'}
+    )
+    path = tool_manifest.write_manifest(manifest, tmp_path / "manifest.json")
+
+    entries = list(tool_manifest.manifest_entries(tool_manifest.load_manifest(path)))
+
+    assert entries == [{
+        'service': 'flight_server',
+        'original_name': 'get_flight_details',
+        'namespaced_name': 'flight.get_flight_details',
+        'description': 'Get details',
+        'schema': {'type': 'object', 'properties': {}},
+        'module_path': 'py_mcp_travelplanner.flight_server.flight_server',
+        'mcp_instance': None,
+    }]
+
+
+@pytest.fixture
+def fake_package(tmp_path, monkeypatch):
+    package_dir = tmp_path / "py_mcp_travelplanner"
+    module = package_dir / "demo_server" / "demo_server.py"
+    module.parent.mkdir(parents=True)
+    module.write_text("def tool(a: int): ...\n")
+    monkeypatch.setattr(tool_manifest, "PACKAGE_DIR", package_dir)
+    registry = {
+        "demo.tool": {
+            'service': 'demo_server',
+            'original_name': 'tool',
+            'namespaced_name': 'demo.tool',
+            'description': '',
+            'schema': {},
+        }
+    }
+    manifest = tool_manifest.build_manifest(
+        registry, {'demo_server': 'py_mcp_travelplanner.demo_server.demo_server'},
+        discovered=['demo_server'],
+    )
+    return module, tool_manifest.write_manifest(manifest, tmp_path / "manifest.json")
+
+
+def test_manifest_survives_touch_without_content_change(fake_package):
+    module, path = fake_package
+    stat = module.stat()
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert tool_manifest.load_manifest(path, expected_services=['demo_server']) is not None
+
+
+def test_manifest_is_stale_after_module_edit(fake_package):
+    module, path = fake_package
+    module.write_text("def tool(b: str): ...\n")
+
+    assert tool_manifest.load_manifest(path) is None
+    assert tool_manifest.load_manifest(path, validate=False) is not None
+
+
+def test_manifest_is_stale_when_services_or_mcp_change(fake_package, monkeypatch):
+    _, path = fake_package
+
+    assert tool_manifest.load_manifest(path, expected_services=['demo_server', 'new_server']) is None
+    monkeypatch.setattr(tool_manifest, "_mcp_version", lambda: "0.0.0")
+    assert tool_manifest.load_manifest(path) is None
+
+
+def test_load_manifest_rejects_other_versions(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"version": tool_manifest.MANIFEST_VERSION + 1, "services": {}}))
+
+    assert tool_manifest.load_manifest(path) is None
+    assert tool_manifest.load_manifest(tmp_path / "missing.json") is None
+
+
+@pytest.mark.asyncio
+async def test_eager_initialization_reports_import_times(fresh_registry):
+    await mcp_server._initialize_service_registry(lazy=False)
+
+    assert mcp_server._TOOL_REGISTRY
+    assert set(mcp_server._SERVICE_IMPORT_TIMES) == set(mcp_server._SERVICE_REGISTRY)
+
+    result = await mcp_server.call_tool("get_service_manifest", {})
+    services = json.loads(result[0].text)["services"]
+    assert all(info["loaded"] and info["import_ms"] is not None for info in services.values())
+
+
+@pytest.mark.asyncio
+async def test_lazy_mode_defers_imports_until_first_call(fresh_registry, manifest_file, monkeypatch, tmp_path):
+    await mcp_server._initialize_service_registry(lazy=False)
+    eager_tools = {name: info['schema'] for name, info in mcp_server._TOOL_REGISTRY.items()}
+    await tool_manifest.generate_manifest(manifest_file)
+
+    monkeypatch.setattr(mcp_server, "_SERVICE_REGISTRY", {})
+    monkeypatch.setattr(mcp_server, "_TOOL_REGISTRY", {})
+    await mcp_server._initialize_service_registry(lazy=True)
+
+    assert mcp_server._SERVICE_REGISTRY == {}
+    tools = await mcp_server.list_tools()
+    assert {t.name: t.inputSchema for t in tools if "." in t.name} == eager_tools
+
+    from py_mcp_travelplanner.flight_server import flight_server
+    monkeypatch.setattr(flight_server, "FLIGHTS_DIR", str(tmp_path))
+    result = await mcp_server.call_tool("flight.get_flight_details", {"search_id": "missing"})
+
+    assert "No flight search found" in result[0].text
+    assert list(mcp_server._SERVICE_REGISTRY) == ["flight_server"]
+
+
+@pytest.mark.asyncio
+async def test_boot_writes_snapshot_then_serves_from_it(fresh_registry, manifest_file, monkeypatch):
+    assert await mcp_server._boot_registry() is None
+    assert manifest_file.exists()
+    eager_names = set(mcp_server._TOOL_REGISTRY)
+
+    monkeypatch.setattr(mcp_server, "_SERVICE_REGISTRY", {})
+    monkeypatch.setattr(mcp_server, "_TOOL_REGISTRY", {})
+    monkeypatch.setattr(mcp_server, "_lazy_loading_enabled", lambda: True)
+
+    assert await mcp_server._boot_registry() is None
+    assert set(mcp_server._TOOL_REGISTRY) == eager_names
+    assert mcp_server._SERVICE_REGISTRY == {}
+
+
+@pytest.mark.asyncio
+async def test_warmup_logs_services_that_fail_to_load(fresh_registry, monkeypatch, caplog):
+    monkeypatch.setitem(mcp_server._TOOL_REGISTRY, "broken.ping", {
+        'service': 'broken_server',
+        'original_name': 'ping',
+        'namespaced_name': 'broken.ping',
+        'description': 'Ping',
+        'schema': {'type': 'object', 'properties': {}},
+        'mcp_instance': None,
+    })
+    monkeypatch.setattr(mcp_server, "_load_subservice_mcp", lambda name: None)
+
+    with caplog.at_level("ERROR", logger="py_mcp_travelplanner.mcp_server"):
+        await mcp_server._initialize_service_registry(lazy=False)
+
+    assert "Could not load subservice broken_server" in caplog.text
+    assert mcp_server._TOOL_REGISTRY["broken.ping"]['mcp_instance'] is None
@@ -0,0 +1,50 @@
+"""Tests for the typed weather records and their rendering."""
+from __future__ import annotations
+
+import pytest
+
+from py_mcp_travelplanner.weather_server.weather_records import (
+    CurrentWeather,
+    ForecastPeriod,
+    SpeedUnit,
+    UnitSystem,
+    parse_wind_speed,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("10 mph", (10.0, 10.0, SpeedUnit.MPH)),
+    ("5 to 15 mph", (5.0, 15.0, SpeedUnit.MPH)),
+    ("20 km/h", (20.0, 20.0, SpeedUnit.KMH)),
+    ("calm", (None, None, None)),
+    (None, (None, None, None)),
+])
+def test_parse_wind_speed(text, expected):
+    assert parse_wind_speed(text) == expected
+
+
+def test_current_weather_round_trips_and_renders():
+    record = CurrentWeather.from_weatherstack({
+        "temperature": 23, "feelslike": 25, "humidity": 40, "wind_speed": 12,
+        "wind_dir": "SW", "weather_descriptions": ["Partly cloudy"], "uv_index": "n/a",
+    }, "f")
+
+    assert record.units is UnitSystem.FAHRENHEIT and record.uv_index is None
+    assert CurrentWeather.from_dict(record.to_dict()) == record
+    display = record.render()
+    assert (display["temperature"], display["wind"], display["uv_index"]) == ("23°F", "12 mph SW", "N/A")
+    assert CurrentWeather(units=UnitSystem.SCIENTIFIC, temperature=296.15).render()["temperature"] == "296.15K"
+
+
+def test_forecast_period_reads_legacy_wind_text():
+    record = ForecastPeriod.from_nws({
+        "name": "Tonight", "temperature": 61, "temperatureUnit": "F",
+        "windSpeed": "5 to 10 mph", "probabilityOfPrecipitation": {"value": 20},
+    })
+    legacy = ForecastPeriod.from_dict({"name": "Tonight", "temperature": 61, "temperature_unit": "F",
+                                       "wind_speed": "5 to 10 mph", "probability_of_precipitation": 20})
+
+    assert legacy == record
+    assert ForecastPeriod.from_dict(record.to_dict()) == record
+    assert record.max_wind_speed(SpeedUnit.KMH) == pytest.approx(16.09, abs=0.01)
+    assert record.render() == {"temperature": "61°F", "wind_speed": "5 to 10 mph"}
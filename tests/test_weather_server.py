@@ -0,0 +1,231 @@
+"""Tests for the NWS weather server's request handling and caching."""
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from py_mcp_travelplanner.config import get_config
+from py_mcp_travelplanner.weather_server import nws_metadata, weather_server
+from py_mcp_travelplanner.weather_server.nws_metadata import point_params
+
+NWS = weather_server.NWS_BASE_URL
+STATIONS_URL = f"{NWS}/gridpoints/TOP/31,80/stations"
+
+
+def _nws_responses():
+    return {
+        f"{NWS}/points/39.7456,-97.0892": {"properties": {
+            "cwa": "TOP", "gridX": 31, "gridY": 80,
+            "relativeLocation": {"properties": {"city": "Linn", "state": "KS"}},
+            "observationStations": STATIONS_URL,
+        }},
+        STATIONS_URL: {"features": [
+            {"properties": {"stationIdentifier": "KMYZ", "name": "Marysville"}},
+            {"properties": {"stationIdentifier": "KCNK", "name": "Concordia"}},
+        ]},
+        f"{NWS}/stations/KMYZ/observations/latest": {"properties": {
+            "timestamp": "2025-06-01T12:00:00+00:00",
+            "temperature": {"value": 21.0, "unitCode": "wmoUnit:degC"},
+        }},
+        f"{NWS}/gridpoints/TOP/31,80/forecast": {"properties": {"periods": [
+            {"number": 1, "name": "Today", "temperature": 75, "windSpeed": "10 mph"},
+        ]}},
+    }
+
+
+@pytest.fixture
+def nws(tmp_path, monkeypatch):
+    """Route NWS requests to canned responses and record the endpoints hit."""
+    nws_metadata.reset_nws_metadata_caches()
+    monkeypatch.setattr(weather_server, "WEATHER_DIR", str(tmp_path / "weather_data"))
+    responses = _nws_responses()
+    calls = []
+
+    async def fake_request(endpoint):
+        calls.append(endpoint)
+        return responses.get(endpoint)
+
+    monkeypatch.setattr(weather_server, "make_nws_request", fake_request)
+    yield calls
+    nws_metadata.reset_nws_metadata_caches()
+
+
+def test_point_params_round_to_nws_precision():
+    assert point_params(39.745612, -97.08921)["point"] == "39.7456,-97.0892"
+    assert point_params(40.0, -0.00001)["point"] == "40,0"
+
+
+@pytest.mark.asyncio
+async def test_forecast_reuses_cached_grid_lookup(nws):
+    first = await weather_server.get_weather_forecast(39.7456, -97.0892)
+    second = await weather_server.get_weather_forecast(39.74561, -97.08919)
+
+    assert first["periods"][0]["temperature"] == 75
+    assert second["location"] == {"latitude": 39.74561, "longitude": -97.08919,
+                                  "city": "Linn", "state": "KS"}
+    assert nws.count(f"{NWS}/points/39.7456,-97.0892") == 1
+    assert nws.count(f"{NWS}/gridpoints/TOP/31,80/forecast") == 2
+
+
+@pytest.mark.asyncio
+async def test_current_conditions_cache_station_list(nws):
+    first = await weather_server.get_current_conditions(39.7456, -97.0892)
+    await weather_server.get_current_conditions(39.7456, -97.0892)
+
+    assert first["station"] == {"id": "KMYZ", "name": "Marysville"}
+    assert first["conditions"]["temperature"] == {"value": 21.0, "unit": "degC"}
+    assert nws.count(STATIONS_URL) == 1
+    assert nws.count(f"{NWS}/points/39.7456,-97.0892") == 1
+
+
+@pytest.mark.asyncio
+async def test_grid_metadata_survives_restart(nws):
+    await weather_server.get_location_info(39.7456, -97.0892)
+    nws_metadata.reset_nws_metadata_caches()
+
+    info = await weather_server.get_location_info(39.7456, -97.0892)
+
+    assert info["cached"] is True
+    assert info["grid"] == {"office": "TOP", "gridX": 31, "gridY": 80}
+    assert len(nws) == 1
+
+
+@pytest.mark.asyncio
+async def test_forecasts_batch_shares_grid_cells(nws):
+    batch = await weather_server.get_forecasts_batch([
+        {"latitude": 39.7456, "longitude": -97.0892},
+        {"latitude": 39.74561, "longitude": -97.08919},
+        {"latitude": 10.0, "longitude": 10.0},
+        {"latitude": "north"},
+    ])
+
+    assert [result["index"] for result in batch["results"]] == [0, 1, 2, 3]
+    assert batch["results"][0]["grid_id"] == batch["results"][1]["grid_id"] == "TOP/31,80"
+    assert batch["results"][1]["location"]["latitude"] == 39.74561
+    assert "error" in batch["results"][2] and "error" in batch["results"][3]
+    assert batch["forecasts"]["TOP/31,80"]["periods"][0]["temperature"] == 75
+    assert (batch["unique_points"], batch["unique_grids"], batch["failed"]) == (2, 1, 2)
+    assert nws.count(f"{NWS}/points/39.7456,-97.0892") == 1
+    assert nws.count(f"{NWS}/gridpoints/TOP/31,80/forecast") == 1
+
+
+@pytest.mark.asyncio
+async def test_forecasts_batch_caps_requests_in_flight(nws, monkeypatch):
+    config = get_config()
+    saved = config.get('NWS_BATCH_CONCURRENCY')
+    config.set('NWS_BATCH_CONCURRENCY', 2)
+    in_flight, peak = 0, 0
+
+    async def slow_request(endpoint):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if "/points/" in endpoint:
+            return {"properties": {"cwa": "TOP", "gridX": endpoint.rsplit("-", 1)[1], "gridY": 1}}
+        return {"properties": {"periods": []}}
+
+    monkeypatch.setattr(weather_server, "make_nws_request", slow_request)
+    try:
+        batch = await weather_server.get_forecasts_batch([[40.0, -90.0 - i] for i in range(6)])
+    finally:
+        config.set('NWS_BATCH_CONCURRENCY', saved)
+
+    assert peak == 2
+    assert (batch["unique_points"], batch["unique_grids"], batch["failed"]) == (6, 6, 0)
+
+
+@pytest.mark.asyncio
+async def test_forecast_periods_are_typed_and_filterable(nws):
+    forecast = await weather_server.get_weather_forecast(39.7456, -97.0892)
+
+    period = forecast["periods"][0]
+    assert (period["wind_speed_min"], period["wind_speed_max"], period["wind_speed_unit"]) == (10.0, 10.0, "mph")
+
+    def kept(threshold):
+        result = weather_server.filter_forecast_by_conditions(forecast["search_id"], wind_speed_threshold=threshold)
+        return json.loads(result)["filtered_periods"]
+
+    assert (kept("15 mph"), kept("5 mph"), kept("20 km/h")) == (1, 0, 1)
+
+
+@pytest.fixture
+def probe_config():
+    config = get_config()
+    keys = ('NWS_STATION_PROBE_STRATEGY', 'NWS_STATION_HEDGE_DELAY')
+    saved = {key: config.get(key) for key in keys}
+    yield config
+    for key, value in saved.items():
+        config.set(key, value)
+
+
+def _stations(monkeypatch, behaviour):
+    """Replace observation requests: behaviour maps station id -> (delay, ok)."""
+    cancelled = []
+
+    async def fake_request(endpoint):
+        station_id = endpoint.split("/")[-3]
+        delay, ok = behaviour[station_id]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(station_id)
+            raise
+        return {"properties": {"timestamp": station_id}} if ok else None
+
+    monkeypatch.setattr(weather_server, "make_nws_request", fake_request)
+    return cancelled
+
+
+STATIONS = [{"id": "A", "name": "a"}, {"id": "B", "name": "b"}, {"id": "C", "name": "c"}]
+
+
+@pytest.mark.asyncio
+async def test_unknown_probe_strategy_is_reported_as_an_error(monkeypatch, probe_config):
+    probe_config.set('NWS_STATION_PROBE_STRATEGY', 'fastest')
+    requests = []
+    monkeypatch.setattr(weather_server, "make_nws_request", lambda endpoint: requests.append(endpoint))
+
+    result = await weather_server.get_current_conditions(39.7456, -97.0892)
+
+    assert "Unknown NWS_STATION_PROBE_STRATEGY" in result["error"]
+    assert requests == []
+
+
+@pytest.mark.asyncio
+async def test_hedged_probe_takes_first_answer_and_cancels_the_rest(monkeypatch, probe_config):
+    probe_config.set('NWS_STATION_PROBE_STRATEGY', 'hedged')
+    probe_config.set('NWS_STATION_HEDGE_DELAY', 0.05)
+    cancelled = _stations(monkeypatch, {"A": (5.0, True), "B": (0.01, True), "C": (0.01, True)})
+
+    probe = await weather_server._probe_stations(STATIONS)
+
+    assert probe["station"]["id"] == "B"
+    assert probe["metadata"]["stations_attempted"] == ["A", "B"]
+    assert probe["metadata"]["latency_ms"] < 1000
+    assert cancelled == ["A"]
+
+
+@pytest.mark.asyncio
+async def test_failed_station_starts_the_next_one_immediately(monkeypatch, probe_config):
+    probe_config.set('NWS_STATION_PROBE_STRATEGY', 'sequential')
+    _stations(monkeypatch, {"A": (0.0, False), "B": (0.0, False), "C": (0.0, True)})
+
+    probe = await weather_server._probe_stations(STATIONS)
+
+    assert probe["metadata"]["winner"] == "C"
+    assert probe["metadata"]["strategy"] == "sequential"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_probe_reports_no_winner_when_all_fail(monkeypatch, probe_config):
+    probe_config.set('NWS_STATION_PROBE_STRATEGY', 'concurrent')
+    _stations(monkeypatch, {"A": (0.02, False), "B": (0.01, False), "C": (0.0, False)})
+
+    probe = await weather_server._probe_stations(STATIONS)
+
+    assert probe["station"] is None
+    assert probe["metadata"]["stations_attempted"] == ["A", "B", "C"]
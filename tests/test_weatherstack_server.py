@@ -0,0 +1,140 @@
+"""Tests for the Weatherstack server's current-weather cache and comparisons."""
+from __future__ import annotations
+
+import asyncio
+import datetime
+import json
+
+import httpx
+import pytest
+
+from py_mcp_travelplanner.config import get_config
+from py_mcp_travelplanner.weather_server import weatherstack_cache, weatherstack_server
+
+CURRENT = {
+    "london": {"name": "London", "temperature": 14, "wind_speed": 20, "humidity": 82},
+    "madrid": {"name": "Madrid", "temperature": 31, "wind_speed": 7, "humidity": 25},
+    "oslo": {"name": "Oslo", "temperature": 4, "wind_speed": 33, "humidity": 60},
+}
+
+
+@pytest.fixture
+def weatherstack(tmp_path, monkeypatch):
+    """Serve canned Weatherstack answers; record queries and peak concurrency."""
+    weatherstack_cache.reset_weatherstack_caches()
+    monkeypatch.setenv("WEATHERSTACK_API_KEY", "test-key")
+    monkeypatch.setattr(weatherstack_server, "WEATHER_DIR", str(tmp_path / "weather_data"))
+    config = get_config()
+    saved = config.get('WEATHERSTACK_CONCURRENCY')
+    config.set('WEATHERSTACK_CONCURRENCY', 2)
+    state = {"queries": [], "days": [], "in_flight": 0, "peak": 0}
+
+    async def fake_get(url, params=None, **kwargs):
+        state["queries"].append(params["query"])
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        current = CURRENT.get(params["query"].strip().lower())
+        if url.endswith("/historical"):
+            state["days"].append(params["historical_date"])
+            day = params["historical_date"]
+            location_info = {"name": "Oslo", **({"localtime": state["localtime"]} if "localtime" in state else {})}
+            body = {"location": location_info, "historical": {day: {"date": day, "avgtemp": 3}}}
+        elif current is None:
+            body = {"success": False, "error": {"code": 615, "info": "Request failed."}}
+        else:
+            body = {
+                "location": {"name": current["name"], "country": "X", "localtime": "2025-06-01 12:00"},
+                "current": {**current, "weather_descriptions": ["Sunny"], "wind_dir": "N"},
+            }
+        return httpx.Response(200, json=body, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(weatherstack_server, "async_http_get", fake_get)
+    yield state
+    config.set('WEATHERSTACK_CONCURRENCY', saved)
+    weatherstack_cache.reset_weatherstack_caches()
+
+
+@pytest.mark.asyncio
+async def test_compare_weather_fans_out_once_per_location(weatherstack):
+    result = await weatherstack_server.compare_weather(["London", "Madrid", " london", "Oslo", "Atlantis"])
+
+    assert sorted(weatherstack["queries"]) == ["Atlantis", "London", "Madrid", "Oslo"]
+    assert weatherstack["peak"] == 2
+    assert [entry["location"] for entry in result["locations"]] == ["London", "Madrid", "Oslo", "Atlantis"]
+    assert result["locations"][0]["weather"]["temperature"] == 14.0
+    assert result["unit_labels"]["temperature"] == "C"
+    assert result["locations"][3]["error"] == "API Error 615: Request failed."
+    assert result["summary"] == {
+        "hottest": {"location": "Madrid", "temperature": 31.0},
+        "coldest": {"location": "Oslo", "temperature": 4.0},
+        "windiest": {"location": "Oslo", "wind_speed": 33.0},
+        "most_humid": {"location": "London", "humidity": 82.0},
+    }
+
+
+@pytest.mark.asyncio
+async def test_current_weather_is_served_from_cache(weatherstack):
+    await weatherstack_server.compare_weather(["London", "Madrid"])
+    single = await weatherstack_server.get_current_weather("LONDON")
+    again = await weatherstack_server.compare_weather(["london", "madrid", "Atlantis"])
+
+    assert single["cached"] is True
+    assert again["cached"] == 2
+    assert weatherstack["queries"] == ["London", "Madrid", "Atlantis"]
+
+
+@pytest.mark.asyncio
+async def test_current_weather_persists_typed_record(weatherstack):
+    result = await weatherstack_server.get_current_weather("Oslo", units="m")
+
+    assert result["current_weather"] == {
+        "units": "m", "temperature": 4.0, "humidity": 60.0, "wind_speed": 33.0,
+        "wind_direction": "N", "description": "Sunny",
+    }
+    details = weatherstack_server.get_weather_search_details(result["search_id"])
+    assert "- **Temperature**: 4°C" in details
+    assert "- **Wind**: 33 km/h N" in details
+
+
+@pytest.mark.asyncio
+async def test_historical_range_fetches_only_missing_days(weatherstack):
+    first = await weatherstack_server.get_historical_weather("Oslo", "2015-01-01", "2015-01-03")
+    second = await weatherstack_server.get_historical_weather("oslo", "2015-01-02", "2015-01-04")
+    repeat = await weatherstack_server.get_historical_weather("Oslo", "2015-01-02", "2015-01-04")
+
+    assert sorted(weatherstack["days"]) == ["2015-01-01", "2015-01-02", "2015-01-03", "2015-01-04"]
+    assert weatherstack["peak"] == 2
+    assert first["historical_summary"]["days_fetched"] == 3
+    assert (second["historical_summary"]["days_cached"], second["historical_summary"]["days_fetched"]) == (2, 1)
+    assert repeat["historical_summary"]["days_cached"] == 3
+    details = json.loads(weatherstack_server.get_weather_details(repeat["search_id"]))
+    assert list(details["historical"]) == ["2015-01-02", "2015-01-03", "2015-01-04"]
+
+
+@pytest.mark.asyncio
+async def test_historical_today_is_not_cached(weatherstack):
+    today = datetime.date.today().isoformat()
+    await weatherstack_server.get_historical_weather("Oslo", today)
+    await weatherstack_server.get_historical_weather("Oslo", today)
+
+    assert weatherstack["days"] == [today, today]
+    assert "error" in await weatherstack_server.get_historical_weather("Oslo", "2015-01-05", "2015-01-01")
+
+
+@pytest.mark.asyncio
+async def test_historical_day_is_cached_once_over_at_the_location(weatherstack):
+    weatherstack["localtime"] = "2025-03-01 23:59"
+    await weatherstack_server.get_historical_weather("Oslo", "2025-03-01")
+    weatherstack["localtime"] = "2025-03-02 00:05"
+    await weatherstack_server.get_historical_weather("Oslo", "2025-03-01")
+    cached = await weatherstack_server.get_historical_weather("Oslo", "2025-03-01")
+
+    assert weatherstack["days"] == ["2025-03-01", "2025-03-01"]
+    assert cached["historical_summary"]["days_cached"] == 1
+
+    # Without a local time a day must be over in every time zone
+    utc_now = datetime.datetime.now(datetime.timezone.utc)
+    assert not weatherstack_server._day_is_over((utc_now - datetime.timedelta(hours=14)).date().isoformat(), {})
+    assert weatherstack_server._day_is_over((utc_now - datetime.timedelta(hours=38)).date().isoformat(), {})